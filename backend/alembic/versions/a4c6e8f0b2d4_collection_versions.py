@@ -0,0 +1,72 @@
+"""add collection_versions and the triggers that bump it
+
+Revision ID: a4c6e8f0b2d4
+Revises: f3b5d7e9a1c2
+Create Date: 2026-10-19 19:00:00.000000
+
+One row per table, bumped by a statement-level trigger on every insert,
+update or delete that touched at least one row. The polled GET endpoints
+turn these versions into weak ETags (app/utils/conditional_get.py).
+The table list mirrors models.VERSIONED_TABLES.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c6e8f0b2d4'
+down_revision: Union[str, Sequence[str], None] = 'f3b5d7e9a1c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = (
+    'app_settings',
+    'calendar_events',
+    'calendars',
+    'family_members',
+    'food_item_details',
+    'items',
+    'meal_entries',
+    'meal_entry_participants',
+    'meal_slot_types',
+    'recipe_details',
+    'tasks',
+)
+_OPS = (('insert', 'NEW'), ('update', 'NEW'), ('delete', 'OLD'))
+
+
+def upgrade() -> None:
+    op.create_table(
+        'collection_versions',
+        sa.Column('scope', sa.Text(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed) THEN
+                INSERT INTO collection_versions (scope, version) VALUES (TG_TABLE_NAME, 1)
+                ON CONFLICT (scope) DO UPDATE SET version = collection_versions.version + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in VERSIONED_TABLES:
+        for name, transition in _OPS:
+            op.execute(
+                f"CREATE TRIGGER {table}_{name}_bump_version AFTER {name.upper()} ON {table} "
+                f"REFERENCING {transition} TABLE AS changed "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version()"
+            )
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        for name, _ in _OPS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_{name}_bump_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_collection_version()")
+    op.drop_table('collection_versions')
@@ -0,0 +1,76 @@
+"""add recurring_event_series and occurrence columns on calendar_events
+
+Revision ID: a7c1e9d3b5f2
+Revises: cf4f8428948e
+Create Date: 2026-10-19 10:00:00.000000
+
+Stores the master VEVENT (DTSTART + RRULE, EXDATEs, RECURRENCE-ID
+overrides) of recurring iCloud events. Occurrences are materialized into
+calendar_events with series_id / recurrence_id set; deleting a series
+cascades to its occurrences.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e9d3b5f2'
+down_revision: Union[str, Sequence[str], None] = 'cf4f8428948e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'recurring_event_series',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('external_id', sa.String(), nullable=False),
+        sa.Column('calendar_integration_id', sa.Integer(), nullable=False),
+        sa.Column('calendar_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('dtstart', sa.DateTime(), nullable=False),
+        sa.Column('all_day', sa.Boolean(), nullable=False),
+        sa.Column('timezone', sa.String(), nullable=True),
+        sa.Column('duration_minutes', sa.Integer(), nullable=True),
+        sa.Column('rrule', sa.String(), nullable=False),
+        sa.Column('exdates', sa.JSON(), nullable=False),
+        sa.Column('overrides', sa.JSON(), nullable=False),
+        sa.Column('etag', sa.String(), nullable=True),
+        sa.Column('last_modified_remote', sa.DateTime(), nullable=True),
+        sa.Column('expanded_until', sa.Date(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['calendar_integration_id'], ['calendar_integrations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('external_id', 'calendar_integration_id', name='uq_recurring_series_external_integration'),
+    )
+    op.create_index(op.f('ix_recurring_event_series_id'), 'recurring_event_series', ['id'], unique=False)
+
+    op.add_column('calendar_events', sa.Column('series_id', sa.Integer(), nullable=True))
+    op.add_column('calendar_events', sa.Column('recurrence_id', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'fk_calendar_events_series_id',
+        'calendar_events',
+        'recurring_event_series',
+        ['series_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_unique_constraint(
+        'uq_calendar_event_series_occurrence',
+        'calendar_events',
+        ['series_id', 'recurrence_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_calendar_event_series_occurrence', 'calendar_events', type_='unique')
+    op.drop_constraint('fk_calendar_events_series_id', 'calendar_events', type_='foreignkey')
+    op.drop_column('calendar_events', 'recurrence_id')
+    op.drop_column('calendar_events', 'series_id')
+    op.drop_index(op.f('ix_recurring_event_series_id'), table_name='recurring_event_series')
+    op.drop_table('recurring_event_series')
@@ -0,0 +1,95 @@
+"""move shopping provenance from tasks.source_meals to shopping_item_sources
+
+Revision ID: b3d8f1a6c4e9
+Revises: a7c1e9d3b5f2
+Create Date: 2026-10-19 12:00:00.000000
+
+Each element of the tasks.source_meals JSON array becomes a row in
+shopping_item_sources, indexed by meal_entry_id so removing a meal from the
+shopping list no longer scans every auto row on the list. Elements that
+point at meal entries which no longer exist are dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8f1a6c4e9'
+down_revision: Union[str, Sequence[str], None] = 'a7c1e9d3b5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'shopping_item_sources',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('meal_entry_id', sa.Integer(), nullable=False),
+        sa.Column('source_kind', sa.String(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=True),
+        sa.Column('display_name', sa.String(), nullable=False),
+        sa.Column('ingredient_name', sa.String(), nullable=False),
+        sa.Column('base_quantity', sa.Float(), nullable=False),
+        sa.Column('unit', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['meal_entry_id'], ['meal_entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_shopping_item_sources_id'), 'shopping_item_sources', ['id'], unique=False)
+    op.create_index(op.f('ix_shopping_item_sources_task_id'), 'shopping_item_sources', ['task_id'], unique=False)
+    op.create_index(op.f('ix_shopping_item_sources_meal_entry_id'), 'shopping_item_sources', ['meal_entry_id'], unique=False)
+
+    op.execute("""
+        INSERT INTO shopping_item_sources
+            (task_id, meal_entry_id, source_kind, item_id, display_name,
+             ingredient_name, base_quantity, unit)
+        SELECT
+            t.id,
+            (src->>'meal_entry_id')::int,
+            COALESCE(src->>'source_kind', 'recipe_ingredient'),
+            (src->>'item_id')::int,
+            COALESCE(src->>'display_name', t.title),
+            COALESCE(src->>'ingredient_name', t.aggregation_key_name, ''),
+            COALESCE((src->>'quantity')::float, 0),
+            src->>'unit'
+        FROM tasks t
+        CROSS JOIN LATERAL json_array_elements(t.source_meals) WITH ORDINALITY AS s(src, ord)
+        JOIN meal_entries me ON me.id = (src->>'meal_entry_id')::int
+        WHERE t.source_meals IS NOT NULL
+          AND json_typeof(t.source_meals) = 'array'
+        ORDER BY t.id, s.ord
+    """)
+
+    op.drop_column('tasks', 'source_meals')
+
+
+def downgrade() -> None:
+    op.add_column('tasks', sa.Column('source_meals', sa.JSON(), nullable=True))
+    op.execute("""
+        UPDATE tasks t
+        SET source_meals = agg.sources
+        FROM (
+            SELECT
+                task_id,
+                json_agg(json_build_object(
+                    'meal_entry_id', meal_entry_id,
+                    'source_kind', source_kind,
+                    'item_id', item_id,
+                    'display_name', display_name,
+                    'ingredient_name', ingredient_name,
+                    'quantity', base_quantity,
+                    'unit', unit
+                ) ORDER BY id) AS sources
+            FROM shopping_item_sources
+            GROUP BY task_id
+        ) agg
+        WHERE t.id = agg.task_id
+    """)
+    op.drop_index(op.f('ix_shopping_item_sources_meal_entry_id'), table_name='shopping_item_sources')
+    op.drop_index(op.f('ix_shopping_item_sources_task_id'), table_name='shopping_item_sources')
+    op.drop_index(op.f('ix_shopping_item_sources_id'), table_name='shopping_item_sources')
+    op.drop_table('shopping_item_sources')
@@ -0,0 +1,40 @@
+"""add meal board and participant indexes
+
+Revision ID: b6d8f0a2c4e6
+Revises: a4c6e8f0b2d4
+Create Date: 2026-10-19 21:00:00.000000
+
+Every board read is a date range over the visible meal_entries ordered by
+(date, slot, sort_order), optionally narrowed to one family member. The range
+used the bare date index and then filtered hidden rows; the member filter
+could only walk the (meal_entry_id, family_member_id) primary key. Adds a
+partial index shaped like the board query and the reverse junction index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d8f0a2c4e6'
+down_revision: Union[str, Sequence[str], None] = 'a4c6e8f0b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'meal_entries_visible_board_idx', 'meal_entries',
+        ['date', 'meal_slot_type_id', 'sort_order'],
+        postgresql_where=sa.text('soft_hidden_at IS NULL'),
+    )
+    op.create_index(
+        'meal_entry_participants_member_idx', 'meal_entry_participants',
+        ['family_member_id', 'meal_entry_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('meal_entry_participants_member_idx', table_name='meal_entry_participants')
+    op.drop_index('meal_entries_visible_board_idx', table_name='meal_entries')
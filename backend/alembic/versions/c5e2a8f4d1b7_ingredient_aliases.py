@@ -0,0 +1,40 @@
+"""add ingredient_aliases
+
+Revision ID: c5e2a8f4d1b7
+Revises: b3d8f1a6c4e9
+Create Date: 2026-10-19 14:00:00.000000
+
+Synonym dictionary for shopping-list aggregation ("scallion" → "green
+onion"), loaded into memory by shopping_sync.canonicalize_name.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2a8f4d1b7'
+down_revision: Union[str, Sequence[str], None] = 'b3d8f1a6c4e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ingredient_aliases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('alias', sa.String(), nullable=False),
+        sa.Column('canonical_name', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias'),
+    )
+    op.create_index(op.f('ix_ingredient_aliases_id'), 'ingredient_aliases', ['id'], unique=False)
+    op.create_index(op.f('ix_ingredient_aliases_canonical_name'), 'ingredient_aliases', ['canonical_name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ingredient_aliases_canonical_name'), table_name='ingredient_aliases')
+    op.drop_index(op.f('ix_ingredient_aliases_id'), table_name='ingredient_aliases')
+    op.drop_table('ingredient_aliases')
@@ -0,0 +1,83 @@
+"""defer collection_versions bumps to commit
+
+Revision ID: c8e0a2b4d6f8
+Revises: b6d8f0a2c4e6
+Create Date: 2026-10-19 23:00:00.000000
+
+The version triggers bumped collection_versions in place, so each writer held
+the table's counter row until it committed: writers to the same table were
+serialized, and transactions writing two tables in opposite orders
+(soft_delete_item: items -> meal_entries; create_meal_entry: meal_entries ->
+items) deadlocked. The triggers now only note the table in an unlogged,
+per-transaction pending table; a deferred constraint trigger applies the
+bumps at commit, in scope order, and clears them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e0a2b4d6f8'
+down_revision: Union[str, Sequence[str], None] = 'b6d8f0a2c4e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'collection_version_pending',
+        sa.Column('txid', sa.BigInteger(), nullable=False),
+        sa.Column('scope', sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint('txid', 'scope'),
+        prefixes=['UNLOGGED'],
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION apply_collection_version_bumps() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO collection_versions (scope, version)
+            SELECT scope, 1 FROM collection_version_pending
+            WHERE txid = txid_current()
+            ORDER BY scope
+            ON CONFLICT (scope) DO UPDATE SET version = collection_versions.version + 1;
+            DELETE FROM collection_version_pending WHERE txid = txid_current();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE CONSTRAINT TRIGGER collection_version_pending_apply "
+        "AFTER INSERT ON collection_version_pending DEFERRABLE INITIALLY DEFERRED "
+        "FOR EACH ROW EXECUTE FUNCTION apply_collection_version_bumps()"
+    )
+    # The existing per-table triggers call this function, so replacing its
+    # body is enough to switch them over.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed) THEN
+                INSERT INTO collection_version_pending (txid, scope)
+                VALUES (txid_current(), TG_TABLE_NAME)
+                ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed) THEN
+                INSERT INTO collection_versions (scope, version) VALUES (TG_TABLE_NAME, 1)
+                ON CONFLICT (scope) DO UPDATE SET version = collection_versions.version + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.drop_table('collection_version_pending')
+    op.execute("DROP FUNCTION IF EXISTS apply_collection_version_bumps()")
@@ -0,0 +1,71 @@
+"""full-text and trigram search indexes for the item library
+
+Revision ID: d7f2b9c3e1a8
+Revises: c5e2a8f4d1b7
+Create Date: 2026-10-19 16:00:00.000000
+
+Generated tsvector columns on items (name, tags) and recipe_details
+(ingredient names, description), each with a GIN index, for
+crud_items.search_items. pg_trgm is created and used for a trigram index on
+items.name only where the server ships it; search degrades to full-text
+only without it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f2b9c3e1a8'
+down_revision: Union[str, Sequence[str], None] = 'c5e2a8f4d1b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', name), 'A') || "
+            "setweight(jsonb_to_tsvector('english', tags, '[\"string\"]'), 'B')",
+            persisted=True,
+        ),
+    ))
+    op.add_column('recipe_details', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(jsonb_to_tsvector('english', "
+            "jsonb_path_query_array(ingredients, '$[*].name'), '[\"string\"]'), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    ))
+    op.create_index('items_search_vector_gin', 'items', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'recipe_details_search_vector_gin', 'recipe_details', ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX IF NOT EXISTS items_name_trgm
+                    ON items USING gin (name gin_trgm_ops);
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it.
+    op.execute("DROP INDEX IF EXISTS items_name_trgm")
+    op.drop_index('recipe_details_search_vector_gin', table_name='recipe_details')
+    op.drop_index('items_search_vector_gin', table_name='items')
+    op.drop_column('recipe_details', 'search_vector')
+    op.drop_column('items', 'search_vector')
@@ -0,0 +1,31 @@
+"""index items by (name, id) for keyset pagination
+
+Revision ID: e2a4c6b8d0f1
+Revises: d7f2b9c3e1a8
+Create Date: 2026-10-19 17:00:00.000000
+
+GET /items pages with WHERE (name, id) > (:name, :id) ORDER BY name, id;
+the partial index matches that order over active items only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6b8d0f1'
+down_revision: Union[str, Sequence[str], None] = 'd7f2b9c3e1a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'items_active_name_id_idx', 'items', ['name', 'id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('items_active_name_id_idx', table_name='items')
@@ -0,0 +1,48 @@
+"""add items.usage_count and items.last_used_on
+
+Revision ID: f3b5d7e9a1c2
+Revises: e2a4c6b8d0f1
+Create Date: 2026-10-19 18:00:00.000000
+
+Item reads used to GROUP BY meal_entries on every list/detail call to get the
+usage count. The count (and the latest planned date) now live on the item,
+backfilled here from the visible meal_entries and kept current by the meal
+entry write paths.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b5d7e9a1c2'
+down_revision: Union[str, Sequence[str], None] = 'e2a4c6b8d0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('usage_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('items', sa.Column('last_used_on', sa.Date(), nullable=True))
+    op.execute("""
+        UPDATE items i
+        SET usage_count = agg.n, last_used_on = agg.last_used_on
+        FROM (
+            SELECT item_id, count(*) AS n, max(date) AS last_used_on
+            FROM meal_entries
+            WHERE item_id IS NOT NULL AND soft_hidden_at IS NULL
+            GROUP BY item_id
+        ) agg
+        WHERE i.id = agg.item_id
+    """)
+    op.create_index(
+        'items_active_usage_idx', 'items', ['usage_count', 'id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('items_active_usage_idx', table_name='items')
+    op.drop_column('items', 'last_used_on')
+    op.drop_column('items', 'usage_count')
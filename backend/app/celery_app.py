@@ -1,9 +1,54 @@
 import os
 import ssl
 from celery import Celery
+from kombu import Exchange, Queue
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
+# Queues by latency class. A user is waiting on anything in "interactive"
+# (push-to-iCloud after an edit, shopping list sync after planning a meal);
+# everything else can lag without anyone noticing. Separate queues with
+# separate worker pools keep a 120s recipe extraction or a full reminders
+# sync from sitting in front of a 200ms push.
+QUEUE_INTERACTIVE = "interactive"
+QUEUE_SYNC_BULK = "sync_bulk"
+QUEUE_AI = "ai"
+QUEUE_MAINTENANCE = "maintenance"
+
+TASK_ROUTES = {
+    "app.tasks.health_check": QUEUE_INTERACTIVE,
+    "app.tasks.push_event_to_icloud": QUEUE_INTERACTIVE,
+    "app.tasks.push_delete_to_icloud": QUEUE_INTERACTIVE,
+    "app.tasks.move_event_on_icloud": QUEUE_INTERACTIVE,
+    "app.tasks.push_task_to_icloud_task": QUEUE_INTERACTIVE,
+    "app.tasks.push_task_delete_to_icloud_task": QUEUE_INTERACTIVE,
+    "app.tasks.sync_shopping_list_add": QUEUE_INTERACTIVE,
+    "app.tasks.sync_shopping_list_remove": QUEUE_INTERACTIVE,
+    "app.tasks.sync_pending_shopping_entries": QUEUE_SYNC_BULK,
+    "app.tasks.sync_all_icloud_integrations": QUEUE_SYNC_BULK,
+    "app.tasks.sync_single_integration": QUEUE_SYNC_BULK,
+    "app.tasks.sync_integration_calendar": QUEUE_SYNC_BULK,
+    "app.tasks.finalize_integration_sync": QUEUE_SYNC_BULK,
+    "app.tasks.sync_all_reminders": QUEUE_SYNC_BULK,
+    "app.tasks.sync_single_reminders_integration": QUEUE_SYNC_BULK,
+    "app.tasks.delete_events_for_integration": QUEUE_SYNC_BULK,
+    "app.tasks.extract_recipe_from_url": QUEUE_AI,
+    "app.tasks.hard_delete_expired_soft_deletes": QUEUE_MAINTENANCE,
+    "app.tasks.rebucket_shopping_list": QUEUE_MAINTENANCE,
+    "app.tasks.reconcile_item_usage_counts": QUEUE_MAINTENANCE,
+}
+
+# Per-pool worker settings, applied when a worker is started with
+# CELERY_WORKER_POOL=<queue> (see docker-compose.yml). Interactive tasks are
+# short, so prefetching a few is cheap; the long-running pools take one task
+# at a time so a busy process never hoards work an idle sibling could run.
+WORKER_POOLS = {
+    QUEUE_INTERACTIVE: {"concurrency": 4, "prefetch_multiplier": 4},
+    QUEUE_SYNC_BULK: {"concurrency": 2, "prefetch_multiplier": 1},
+    QUEUE_AI: {"concurrency": 2, "prefetch_multiplier": 1},
+    QUEUE_MAINTENANCE: {"concurrency": 1, "prefetch_multiplier": 1},
+}
+
 celery_app = Celery(
     "family_hub",
     broker=REDIS_URL,
@@ -17,6 +62,17 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # A worker started without -Q consumes every queue below, so a single
+    # catch-all worker (fly.toml) keeps working alongside split pools.
+    # Explicit exchange + routing key per queue: a bare Queue(name) inherits
+    # the default queue's binding, which would fan every task out to every
+    # queue.
+    task_queues=[
+        Queue(name, Exchange(name, type="direct"), routing_key=name)
+        for name in WORKER_POOLS
+    ],
+    task_default_queue=QUEUE_INTERACTIVE,
+    task_routes={task: {"queue": queue} for task, queue in TASK_ROUTES.items()},
     # Per-task time limits. extract_recipe_from_url is I/O-heavy (HTTP fetch +
     # LLM call), so we cap it at 120s hard / 110s soft. The soft limit gives
     # the task a chance to raise SoftTimeLimitExceeded and mark itself failed
@@ -48,9 +104,28 @@ celery_app.conf.update(
             "task": "app.tasks.sync_all_reminders",
             "schedule": 600.0,  # Every 10 minutes
         },
+        "sync-pending-shopping-entries": {
+            "task": "app.tasks.sync_pending_shopping_entries",
+            "schedule": 300.0,  # Every 5 minutes — catches entries whose dispatch failed
+        },
         "hard-delete-expired-soft-deletes": {
             "task": "app.tasks.hard_delete_expired_soft_deletes",
             "schedule": 3600.0,  # Every hour — sweeps items with deleted_at > 24h
         },
+        "reconcile-item-usage-counts": {
+            "task": "app.tasks.reconcile_item_usage_counts",
+            "schedule": 86400.0,  # Daily — repairs items.usage_count drift
+        },
     },
 )
+
+_worker_pool = os.getenv("CELERY_WORKER_POOL")
+if _worker_pool:
+    if _worker_pool not in WORKER_POOLS:
+        raise RuntimeError(
+            f"CELERY_WORKER_POOL={_worker_pool!r} is not one of {sorted(WORKER_POOLS)}"
+        )
+    celery_app.conf.update(
+        worker_concurrency=WORKER_POOLS[_worker_pool]["concurrency"],
+        worker_prefetch_multiplier=WORKER_POOLS[_worker_pool]["prefetch_multiplier"],
+    )
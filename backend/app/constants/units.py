@@ -89,7 +89,7 @@ FREEFORM_UNIT_MAP = {
     "gram": "g", "grams": "g",
     "kilogram": "kg", "kilograms": "kg", "kgs": "kg",
     # Volume
-    "cup": "cup", "cups": "cup",
+    "cup": "cup", "cups": "cup", "c": "cup",
     "tablespoon": "tbsp", "tablespoons": "tbsp", "tbsp": "tbsp", "tbs": "tbsp", "T": "tbsp",
     "teaspoon": "tsp", "teaspoons": "tsp", "tsp": "tsp", "t": "tsp",
     "milliliter": "ml", "milliliters": "ml", "mL": "ml",
@@ -191,6 +191,68 @@ def format_ingredient_title(quantity: float | None, unit: str | None, name: str)
     return f"{qty_str} {unit} {name}"
 
 
+# ── Batch conversion ──
+# Whole shopping lists are re-titled at once (recompute, remove, preview), so
+# the display-unit choice is table-driven: for each (system, base unit) the
+# candidate display units from largest to smallest. A quantity takes the
+# first unit it is at least one of; the last is the fallback. This is the
+# same ladder `from_base_unit` walks one quantity at a time.
+
+_BASE_FACTOR = {
+    unit: info["to_base"] for unit, info in {**WEIGHT_UNITS, **VOLUME_UNITS}.items()
+}
+
+_DISPLAY_LADDER = {
+    ("imperial", "g"): ("lb", "oz"),
+    ("imperial", "ml"): ("cup", "tbsp", "tsp"),
+    ("metric", "g"): ("kg", "g"),
+    ("metric", "ml"): ("l", "ml"),
+}
+
+def _display_unit(base_quantity: float, base_unit: str, system: str) -> str:
+    ladder = _DISPLAY_LADDER[(system, base_unit)]
+    for unit in ladder[:-1]:
+        if base_quantity >= _BASE_FACTOR[unit]:
+            return unit
+    return ladder[-1]
+
+
+def from_base_units(
+    base_quantities: list[float],
+    base_units: list[str],
+    system: str = "imperial",
+) -> tuple[list[float], list[str]]:
+    """Batch form of `from_base_unit`: convert parallel lists of base
+    quantities and base units to display quantities and units.
+
+    Results match `from_base_unit` element for element.
+    """
+    system = "metric" if system == "metric" else "imperial"
+    display_units = [
+        _display_unit(q, base, system) if base in ("g", "ml") else base
+        for q, base in zip(base_quantities, base_units)
+    ]
+    scaled = [
+        q / _BASE_FACTOR[unit] if base in ("g", "ml") else q
+        for q, base, unit in zip(base_quantities, base_units, display_units)
+    ]
+
+    display_quantities = [
+        round(q, 1) if base in ("g", "ml") else round(q)
+        for q, base in zip(scaled, base_units)
+    ]
+    return display_quantities, display_units
+
+
+def format_ingredient_titles(
+    quantities: list[float | None],
+    units: list[str | None],
+    names: list[str],
+) -> list[str]:
+    """Batch form of `format_ingredient_title`."""
+    return [format_ingredient_title(q, u, n) for q, u, n in zip(quantities, units, names)]
+
+
 def normalize_unit(freeform: str | None) -> str | None:
     """Map a freeform unit string to a predefined unit abbreviation.
 
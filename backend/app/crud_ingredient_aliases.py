@@ -0,0 +1,76 @@
+import logging
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models, schemas
+from .services import ingredient_aliases
+from .services.shopping_sync import singularize_name
+from .utils.task_dedupe import submit_once
+
+logger = logging.getLogger(__name__)
+
+
+async def get_ingredient_aliases(db: AsyncSession):
+    """Get all aliases, grouped by the name they map to."""
+    stmt = select(models.IngredientAlias).order_by(
+        models.IngredientAlias.canonical_name, models.IngredientAlias.alias
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+
+async def create_ingredient_alias(db: AsyncSession, alias_in: schemas.IngredientAliasCreate):
+    """Add an alias and re-bucket the linked shopping list.
+
+    Aliases stay one hop deep: a target that is itself an alias is followed,
+    and aliases that pointed at the new alias are re-pointed at its target.
+    Raises ValueError if the alias would map a name onto itself, and lets
+    IntegrityError propagate for an alias that already exists.
+    """
+    alias = singularize_name(alias_in.alias)
+    target = singularize_name(alias_in.canonical_name)
+
+    result = await db.execute(
+        select(models.IngredientAlias.canonical_name)
+        .where(models.IngredientAlias.alias == target)
+    )
+    target = result.scalar_one_or_none() or target
+    if alias == target:
+        raise ValueError(f"'{alias_in.alias}' already buckets as '{target}'")
+
+    await db.execute(
+        update(models.IngredientAlias)
+        .where(models.IngredientAlias.canonical_name == alias)
+        .values(canonical_name=target)
+    )
+    db_alias = models.IngredientAlias(alias=alias, canonical_name=target)
+    db.add(db_alias)
+    await db.commit()
+    await db.refresh(db_alias)
+
+    await _aliases_changed(db)
+    return db_alias
+
+
+async def delete_ingredient_alias(db: AsyncSession, alias_id: int):
+    """Remove an alias and re-bucket the linked shopping list."""
+    db_alias = await db.get(models.IngredientAlias, alias_id)
+    if db_alias is None:
+        return None
+    await db.delete(db_alias)
+    await db.commit()
+
+    await _aliases_changed(db)
+    return db_alias
+
+
+async def _aliases_changed(db: AsyncSession):
+    # This process sees the change immediately; workers within
+    # ingredient_aliases.REFRESH_SECONDS, and the re-bucket task reloads first.
+    await ingredient_aliases.load_aliases(db)
+    try:
+        from .tasks import rebucket_shopping_list
+        submit_once(rebucket_shopping_list, "shopping:rebucket")
+    except Exception as e:
+        logger.warning("Failed to dispatch shopping list re-bucket: %s", e)
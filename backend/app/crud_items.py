@@ -9,24 +9,76 @@ which enforces `deleted_at IS NULL` and eager-loads both detail relationships vi
 See plan §0.3 for the full API contract.
 """
 import asyncio
+import hashlib
+import html
+import json
+import logging
 import os
+import re
 from datetime import datetime, timedelta
 import secrets
+import time
 from decimal import Decimal
 
 import redis.asyncio as redis
-from sqlalchemy import func, select, update, delete, and_
+from sqlalchemy import func, literal, literal_column, or_, select, text, tuple_, update, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 from sqlalchemy.orm import selectinload
 
 from . import models, schemas
+from .utils.conditional_get import get_versions
+
+logger = logging.getLogger(__name__)
 
 
 HARD_DELETE_SOAK_HOURS = 24
 USER_UNDO_GRACE_SECONDS = 15
+# The sweeper deletes at most this many items (or entries) per transaction,
+# and stops starting new chunks once the time budget is spent; whatever is
+# left goes to the next hourly run.
+HARD_DELETE_CHUNK_SIZE = 500
+HARD_DELETE_TIME_BUDGET = timedelta(minutes=2)
+
+
+async def _hard_delete_item_chunk(db: AsyncSession, item_ids: list[int]) -> None:
+    """Delete one chunk of expired items and their soft-hidden meal_entries,
+    in one transaction. Rolls back and raises if any of them still has an
+    active meal_entry."""
+    # Soft-hidden meal_entries referencing the items go first (FK RESTRICT)
+    await db.execute(
+        delete(models.MealEntry).where(
+            models.MealEntry.item_id.in_(item_ids),
+            models.MealEntry.soft_hidden_at.is_not(None),
+        )
+    )
+    await db.flush()
+
+    # Assertion gate — any remaining meal_entries means a bug
+    remaining_res = await db.execute(
+        select(func.count(models.MealEntry.id)).where(
+            models.MealEntry.item_id.in_(item_ids),
+        )
+    )
+    remaining = remaining_res.scalar() or 0
+    if remaining > 0:
+        await db.rollback()
+        raise RuntimeError(
+            f"Hard-delete aborted: {remaining} active meal_entries still "
+            f"reference {len(item_ids)} expired items. Soft-delete "
+            f"propagation bug — investigate before the next sweep run."
+        )
+
+    await db.execute(delete(models.Item).where(models.Item.id.in_(item_ids)))
+    await db.commit()
 
 
-async def hard_delete_expired_soft_deletes_async(db: AsyncSession) -> dict:
+async def hard_delete_expired_soft_deletes_async(
+    db: AsyncSession,
+    *,
+    chunk_size: int = HARD_DELETE_CHUNK_SIZE,
+    time_budget: timedelta = HARD_DELETE_TIME_BUDGET,
+) -> dict:
     """Sweep expired soft-deleted items AND user-undo meal_entries past grace.
 
     Two sweeps, one pass:
@@ -39,88 +91,194 @@ async def hard_delete_expired_soft_deletes_async(db: AsyncSession) -> dict:
        undo window is closed. Parent items are still alive; only the entry
        rows need hard-deletion. 5s client window + 10s network/clock slack.
 
+    Both sweeps run in chunks of `chunk_size` rows, one short transaction
+    each, so a large backlog never holds its locks for the whole sweep. Each
+    chunk logs a `hard_delete.chunk` progress line. Once `time_budget` is
+    spent no new chunk starts (each sweep still gets one); the rest waits for
+    the next run. A gate failure raises after rolling back only its own chunk.
+
     Returns dict(items_deleted, user_undo_entries_deleted).
     """
-    items_cutoff = datetime.utcnow() - timedelta(hours=HARD_DELETE_SOAK_HOURS)
+    deadline = time.monotonic() + time_budget.total_seconds()
+    out_of_time = False
 
-    expired_res = await db.execute(
-        select(models.Item.id).where(
-            models.Item.deleted_at.is_not(None),
-            models.Item.deleted_at < items_cutoff,
+    def log_chunk(sweep: str, deleted: int, total: int) -> None:
+        logger.info(
+            "hard_delete.chunk",
+            extra={"sweep": sweep, "deleted": deleted, "total": total},
         )
-    )
-    expired_ids = [row[0] for row in expired_res.all()]
-    items_deleted = 0
-
-    if expired_ids:
-        # Step 2a: delete soft-hidden meal_entries that reference expired items
-        await db.execute(
-            delete(models.MealEntry).where(
-                models.MealEntry.item_id.in_(expired_ids),
-                models.MealEntry.soft_hidden_at.is_not(None),
-            )
-        )
-        await db.flush()
 
-        # Step 2b: assertion gate — any remaining meal_entries means a bug
-        remaining_res = await db.execute(
-            select(func.count(models.MealEntry.id)).where(
-                models.MealEntry.item_id.in_(expired_ids),
+    items_cutoff = datetime.utcnow() - timedelta(hours=HARD_DELETE_SOAK_HOURS)
+    items_deleted = 0
+    last_id = 0
+    while True:
+        expired_res = await db.execute(
+            select(models.Item.id)
+            .where(
+                models.Item.deleted_at.is_not(None),
+                models.Item.deleted_at < items_cutoff,
+                models.Item.id > last_id,
             )
+            .order_by(models.Item.id)
+            .limit(chunk_size)
         )
-        remaining = remaining_res.scalar() or 0
-        if remaining > 0:
-            await db.rollback()
-            raise RuntimeError(
-                f"Hard-delete aborted: {remaining} active meal_entries still "
-                f"reference {len(expired_ids)} expired items. Soft-delete "
-                f"propagation bug — investigate before the next sweep run."
-            )
-
-        # Step 3: now delete the items (FK RESTRICT is satisfied)
-        await db.execute(delete(models.Item).where(models.Item.id.in_(expired_ids)))
-        items_deleted = len(expired_ids)
+        expired_ids = list(expired_res.scalars().all())
+        if not expired_ids:
+            break
+        await _hard_delete_item_chunk(db, expired_ids)
+        items_deleted += len(expired_ids)
+        last_id = expired_ids[-1]
+        log_chunk("items", len(expired_ids), items_deleted)
+        if len(expired_ids) < chunk_size:
+            break
+        if time.monotonic() >= deadline:
+            out_of_time = True
+            break
 
     # Second pass: hard-delete user-undo rows past the 15-second grace window.
     # Parent items are still alive; only the orphan entries need purging.
     undo_cutoff = datetime.utcnow() - timedelta(seconds=USER_UNDO_GRACE_SECONDS)
-    undo_del = await db.execute(
-        delete(models.MealEntry).where(
-            models.MealEntry.undo_token.is_not(None),
-            models.MealEntry.soft_hidden_at.is_not(None),
-            models.MealEntry.soft_hidden_at < undo_cutoff,
+    user_undo_entries_deleted = 0
+    while True:
+        expired_entries = (
+            select(models.MealEntry.id)
+            .where(
+                models.MealEntry.undo_token.is_not(None),
+                models.MealEntry.soft_hidden_at.is_not(None),
+                models.MealEntry.soft_hidden_at < undo_cutoff,
+            )
+            .limit(chunk_size)
+            .scalar_subquery()
+        )
+        undo_del = await db.execute(
+            delete(models.MealEntry).where(models.MealEntry.id.in_(expired_entries))
+        )
+        await db.commit()
+        deleted = undo_del.rowcount or 0
+        if not deleted:
+            break
+        user_undo_entries_deleted += deleted
+        log_chunk("user_undo_entries", deleted, user_undo_entries_deleted)
+        if deleted < chunk_size:
+            break
+        if time.monotonic() >= deadline:
+            out_of_time = True
+            break
+
+    if out_of_time:
+        logger.warning(
+            "Hard-delete sweep hit its %ds budget; the rest waits for the next run",
+            time_budget.total_seconds(),
         )
-    )
-    user_undo_entries_deleted = undo_del.rowcount or 0
-
-    await db.commit()
     return {
         "items_deleted": items_deleted,
         "user_undo_entries_deleted": user_undo_entries_deleted,
     }
 
 
-async def _attach_usage_counts(db: AsyncSession, items: list[models.Item]) -> None:
-    """Populate `item.meal_entry_count` on each passed Item in place.
+# ---------------------------------------------------------------------------
+# Usage counters
+# ---------------------------------------------------------------------------
+# `items.usage_count` / `last_used_on` mirror the item's visible meal_entries
+# (count, latest date). Every write that shows or hides an entry adjusts them
+# in its own transaction, so reads are a plain column fetch;
+# `reconcile_usage_counts` (nightly) repairs any drift.
+
+def _visible_usage(item_id_col):
+    """Correlated (count, max(date)) of the visible meal_entries for an item."""
+    visible = and_(
+        models.MealEntry.item_id == item_id_col,
+        models.MealEntry.soft_hidden_at.is_(None),
+    )
+    return (
+        select(func.count(models.MealEntry.id)).where(visible).scalar_subquery(),
+        select(func.max(models.MealEntry.date)).where(visible).scalar_subquery(),
+    )
 
-    Single GROUP BY over meal_entries, filtered to non-hidden rows only (matches
-    the `visible_meal_entries_stmt()` invariant in crud_meal_entries — we don't
-    count soft-hidden rows since they're already associated with a soft-deleted
-    item in the cascade path). Household scale is cheap; for larger data this
-    would want a correlated subquery at SELECT time instead.
-    """
-    if not items:
+
+async def record_usage(db: AsyncSession, item_id: int | None, on_date) -> None:
+    """A meal_entry for `item_id` on `on_date` became visible."""
+    if item_id is None:
         return
-    ids = [it.id for it in items]
-    result = await db.execute(
-        select(models.MealEntry.item_id, func.count(models.MealEntry.id))
+    await db.execute(
+        update(models.Item)
+        .where(models.Item.id == item_id)
+        .values(
+            usage_count=models.Item.usage_count + 1,
+            # GREATEST ignores NULL, so the first use sets it
+            last_used_on=func.greatest(models.Item.last_used_on, on_date),
+        )
+    )
+
+
+async def release_usage(db: AsyncSession, item_id: int | None) -> None:
+    """A meal_entry for `item_id` was hidden. Call after the hiding UPDATE:
+    `last_used_on` is re-read from the item's remaining visible entries."""
+    if item_id is None:
+        return
+    _, latest = _visible_usage(models.Item.id)
+    await db.execute(
+        update(models.Item)
+        .where(models.Item.id == item_id)
+        .values(
+            usage_count=func.greatest(models.Item.usage_count - 1, 0),
+            last_used_on=latest,
+        )
+    )
+
+
+async def recount_usage(db: AsyncSession, item_ids) -> None:
+    """Recompute the counters for `item_ids` from their meal_entries. For
+    writes that move many entries at once (cascade hide/restore, re-pointing
+    an entry at another item)."""
+    ids = [item_id for item_id in set(item_ids) if item_id is not None]
+    if not ids:
+        return
+    count, latest = _visible_usage(models.Item.id)
+    await db.execute(
+        update(models.Item)
+        .where(models.Item.id.in_(ids))
+        .values(usage_count=count, last_used_on=latest)
+    )
+
+
+async def reconcile_usage_counts(db: AsyncSession) -> int:
+    """Repair every item whose counters disagree with its meal_entries.
+    Commits and returns the number of items fixed."""
+    usage = (
+        select(
+            models.MealEntry.item_id,
+            func.count(models.MealEntry.id).label("n"),
+            func.max(models.MealEntry.date).label("latest"),
+        )
         .where(models.MealEntry.soft_hidden_at.is_(None))
-        .where(models.MealEntry.item_id.in_(ids))
+        .where(models.MealEntry.item_id.is_not(None))
         .group_by(models.MealEntry.item_id)
+        .subquery()
+    )
+    actual = (
+        select(
+            models.Item.id,
+            func.coalesce(usage.c.n, 0).label("n"),
+            usage.c.latest,
+        )
+        .outerjoin(usage, usage.c.item_id == models.Item.id)
+        .subquery()
     )
-    counts = dict(result.all())
-    for it in items:
-        it.meal_entry_count = counts.get(it.id, 0)
+    result = await db.execute(
+        update(models.Item)
+        .where(models.Item.id == actual.c.id)
+        .where(or_(
+            models.Item.usage_count != actual.c.n,
+            models.Item.last_used_on.is_distinct_from(actual.c.latest),
+        ))
+        .values(usage_count=actual.c.n, last_used_on=actual.c.latest)
+        .returning(models.Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    repaired = len(result.all())
+    await db.commit()
+    return repaired
 
 
 # ---------------------------------------------------------------------------
@@ -134,6 +292,12 @@ def active_items_stmt(
 ):
     """Canonical statement builder for non-deleted items with detail eager-loaded.
     All list/detail/search endpoints build off this.
+
+    `search` stays a substring match on the name (the list filter's contract;
+    ranked search is `search_items`). Where pg_trgm is installed the
+    `items_name_trgm` GIN index serves that ILIKE for terms of three or more
+    characters; without it, or for shorter terms, it is a scan of the
+    non-deleted items.
     """
     stmt = (
         select(models.Item)
@@ -171,30 +335,199 @@ def items_by_id_stmt(item_id: int, *, include_deleted: bool = False):
 # Reads
 # ---------------------------------------------------------------------------
 
+# RecipeDetail columns for summary listings — everything but the two heavy
+# ones (ingredients JSONB, instructions text).
+_RECIPE_SUMMARY_COLUMNS = (
+    models.RecipeDetail.item_id,
+    models.RecipeDetail.description,
+    models.RecipeDetail.prep_time_minutes,
+    models.RecipeDetail.cook_time_minutes,
+    models.RecipeDetail.servings,
+    models.RecipeDetail.image_url,
+    models.RecipeDetail.source_url,
+)
+
+
 async def list_items(
     db: AsyncSession,
     *,
     item_type: str | None = None,
     favorites_only: bool = False,
     search: str | None = None,
+    limit: int | None = None,
+    after: tuple | None = None,
+    summary: bool = False,
+    sort: str = "name",
 ) -> list[models.Item]:
+    """Active items ordered by (name, id), or most used first with
+    `sort="usage"` (usage_count DESC, id DESC).
+
+    Keyset pagination: `after` is the sort key — (name, id) or
+    (usage_count, id) — of the last item of the previous page and `limit` the
+    page size. Each page is an index range scan on `items_active_name_id_idx`
+    / `items_active_usage_idx`, however deep. With `summary=True` recipe
+    details are loaded without `ingredients` / `instructions`; only serialize
+    such items with `schemas.ItemSummary`.
+    """
     stmt = active_items_stmt(
         item_type=item_type, favorites_only=favorites_only, search=search
-    ).order_by(models.Item.name)
+    )
+    if sort == "usage":
+        key = tuple_(models.Item.usage_count, models.Item.id)
+        stmt = stmt.order_by(models.Item.usage_count.desc(), models.Item.id.desc())
+        if after is not None:
+            stmt = stmt.where(key < tuple_(*after))
+    else:
+        key = tuple_(models.Item.name, models.Item.id)
+        stmt = stmt.order_by(models.Item.name, models.Item.id)
+        if after is not None:
+            stmt = stmt.where(key > tuple_(*after))
+    if summary:
+        stmt = stmt.options(
+            selectinload(models.Item.recipe_detail).load_only(*_RECIPE_SUMMARY_COLUMNS)
+        )
+    if limit is not None:
+        stmt = stmt.limit(limit)
     result = await db.execute(stmt)
-    items = list(result.scalars().all())
-    await _attach_usage_counts(db, items)
-    return items
+    return list(result.scalars().all())
 
 
 async def get_item(
     db: AsyncSession, item_id: int, *, include_deleted: bool = False
 ) -> models.Item | None:
     result = await db.execute(items_by_id_stmt(item_id, include_deleted=include_deleted))
-    item = result.scalar_one_or_none()
-    if item is not None:
-        await _attach_usage_counts(db, [item])
-    return item
+    return result.scalar_one_or_none()
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+_SEARCH_CONFIG = literal_column("'english'::regconfig")
+# Private-use code points mark ts_headline matches so the surrounding text can
+# be HTML-escaped in Python before the markers become <mark> tags.
+_HIT_START, _HIT_STOP = "\ue000", "\ue001"
+# Names are short: highlight them whole. Descriptions: one ~20-word fragment.
+_NAME_HEADLINE = f"StartSel={_HIT_START}, StopSel={_HIT_STOP}, HighlightAll=true"
+_DESCRIPTION_HEADLINE = (
+    f"StartSel={_HIT_START}, StopSel={_HIT_STOP}, MaxWords=20, MinWords=5, MaxFragments=1"
+)
+
+# pg_trgm is optional: without it search loses typo tolerance but still
+# works. The lookup is cached, and redone every TRIGRAM_RECHECK_SECONDS so a
+# process that started before the migration installed the extension picks it
+# up.
+TRIGRAM_RECHECK_SECONDS = 60
+
+_trigram_available: bool | None = None
+_trigram_checked_at: float | None = None
+
+
+async def _has_trigram(db: AsyncSession) -> bool:
+    global _trigram_available, _trigram_checked_at
+    now = time.monotonic()
+    if _trigram_checked_at is None or now - _trigram_checked_at >= TRIGRAM_RECHECK_SECONDS:
+        result = await db.execute(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        )
+        _trigram_available = bool(result.scalar())
+        _trigram_checked_at = now
+    return _trigram_available
+
+
+def reset_trigram_check() -> None:
+    """Forget the cached pg_trgm lookup. Test helper — not for production code."""
+    global _trigram_available, _trigram_checked_at
+    _trigram_available = None
+    _trigram_checked_at = None
+
+
+def _prefix_tsquery(term: str) -> str | None:
+    """"chick tik" → "chick:* & tik:*" — every word a prefix, for search-as-you-type.
+
+    Only word characters survive, so user input can't inject tsquery operators.
+    """
+    words = re.findall(r"\w+", term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _highlight(fragment: str | None) -> str | None:
+    if fragment is None:
+        return None
+    return (
+        html.escape(fragment)
+        .replace(_HIT_START, "<mark>")
+        .replace(_HIT_STOP, "</mark>")
+    )
+
+
+async def search_items(
+    db: AsyncSession, term: str, *, limit: int = 20
+) -> list[tuple[models.Item, float, str, str | None]]:
+    """Ranked full-text search over item names, tags, recipe descriptions and
+    ingredient names.
+
+    Matches are found through the GIN indexes on `items.search_vector` and
+    `recipe_details.search_vector`; with pg_trgm installed, names containing
+    a word within trigram word-similarity of the term match too (typos, via
+    `items_name_trgm`). Highlights are computed only for the returned page.
+
+    Returns (item, rank, name_highlight, description_highlight) tuples, best
+    match first. Highlights are HTML-escaped with matches wrapped in <mark>.
+    """
+    tsquery = _prefix_tsquery(term)
+    if tsquery is None:
+        return []
+    query = func.to_tsquery(_SEARCH_CONFIG, tsquery)
+    detail = models.RecipeDetail
+
+    matches = or_(
+        models.Item.search_vector.op("@@")(query),
+        models.Item.id.in_(
+            select(detail.item_id).where(detail.search_vector.op("@@")(query))
+        ),
+    )
+    rank = func.ts_rank(
+        models.Item.search_vector.op("||")(
+            func.coalesce(detail.search_vector, literal_column("''::tsvector"))
+        ),
+        query,
+    )
+    if await _has_trigram(db):
+        # Word similarity, not similarity: "chickn" is close to the word
+        # "Chicken", but not to the whole of "Chicken Tikka Masala".
+        matches = or_(matches, literal(term).op("<%")(models.Item.name))
+        rank = rank + func.word_similarity(term, models.Item.name)
+
+    ranked = (
+        select(models.Item.id, rank.label("rank"))
+        .outerjoin(detail, detail.item_id == models.Item.id)
+        .where(models.Item.deleted_at.is_(None), matches)
+        .order_by(rank.desc(), models.Item.name)
+        .limit(limit)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            models.Item,
+            ranked.c.rank,
+            func.ts_headline(_SEARCH_CONFIG, models.Item.name, query, _NAME_HEADLINE),
+            func.ts_headline(_SEARCH_CONFIG, detail.description, query, _DESCRIPTION_HEADLINE),
+        )
+        .join(ranked, ranked.c.id == models.Item.id)
+        .outerjoin(detail, detail.item_id == models.Item.id)
+        .options(
+            selectinload(models.Item.recipe_detail),
+            selectinload(models.Item.food_item_detail),
+        )
+        .order_by(ranked.c.rank.desc(), models.Item.name)
+    )
+    return [
+        (item, float(item_rank), _highlight(name_hl), _highlight(description_hl))
+        for item, item_rank, name_hl, description_hl in result.all()
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -372,6 +705,7 @@ async def soft_delete_item(
         .where(models.MealEntry.soft_hidden_at.is_(None))
         .values(soft_hidden_at=now)
     )
+    await recount_usage(db, [item_id])
 
     await db.commit()
     token, expires_at = await _issue_undo_token(item_id)
@@ -408,6 +742,97 @@ async def undo_soft_delete_item(
         .where(models.MealEntry.soft_hidden_at.is_not(None))
         .values(soft_hidden_at=None, undo_token=None)
     )
+    await recount_usage(db, [item_id])
 
     await db.commit()
     return await get_item(db, item_id)
+
+
+# ---------------------------------------------------------------------------
+# Serialized read cache
+# ---------------------------------------------------------------------------
+# GET /items and GET /items/{id} serve the ItemRead JSON from Redis. Keys
+# embed the catalog version — the collection_versions rows of the tables an
+# ItemRead is built from — so there is nothing to delete on write: the triggers
+# bump the version in the writing transaction (create/update/soft-delete/undo
+# here, but also usage counters, imports and icon uploads), and the next read
+# misses. Superseded keys age out after _CACHE_TTL. Redis being down only
+# costs the cache; reads fall through to Postgres.
+#
+# Every lookup logs an `item_cache.lookup` metric with outcome hit / miss /
+# error.
+
+CATALOG_TABLES = ("items", "recipe_details", "food_item_details")
+_CACHE_KEY_PREFIX = "itemcache:"
+_CACHE_TTL = int(timedelta(hours=1).total_seconds())
+_ITEM_LIST_ADAPTER = TypeAdapter(list[schemas.ItemRead])
+
+
+async def _catalog_version(db: AsyncSession) -> str:
+    versions = await get_versions(db, CATALOG_TABLES)
+    return ".".join(str(versions[table]) for table in CATALOG_TABLES)
+
+
+def _log_lookup(scope: str, outcome: str) -> None:
+    logger.info("item_cache.lookup", extra={"scope": scope, "outcome": outcome})
+
+
+async def _cached_json(scope: str, key: str, load) -> str | None:
+    """Return the JSON cached under `key`, or `await load()` and cache it.
+    `load` returning None (not found) is not cached."""
+    try:
+        cached = await _get_redis().get(key)
+    except redis.RedisError:
+        _log_lookup(scope, "error")
+        return await load()
+    if cached is not None:
+        _log_lookup(scope, "hit")
+        return cached
+
+    _log_lookup(scope, "miss")
+    body = await load()
+    if body is not None:
+        try:
+            await _get_redis().set(key, body, ex=_CACHE_TTL)
+        except redis.RedisError:
+            pass
+    return body
+
+
+async def get_item_json(db: AsyncSession, item_id: int) -> str | None:
+    """`get_item` serialized as ItemRead JSON, through the cache. None if the
+    item doesn't exist or is deleted."""
+    version = await _catalog_version(db)
+
+    async def load():
+        item = await get_item(db, item_id)
+        if item is None:
+            return None
+        return schemas.ItemRead.model_validate(item).model_dump_json()
+
+    return await _cached_json("item", f"{_CACHE_KEY_PREFIX}{version}:item:{item_id}", load)
+
+
+async def list_items_json(
+    db: AsyncSession,
+    *,
+    item_type: str | None = None,
+    favorites_only: bool = False,
+    search: str | None = None,
+    sort: str = "name",
+) -> str:
+    """The unpaged `list_items` serialized as a JSON array of ItemRead,
+    through the cache."""
+    version = await _catalog_version(db)
+    params = json.dumps([item_type, favorites_only, search, sort])
+    digest = hashlib.sha1(params.encode()).hexdigest()[:16]
+
+    async def load():
+        items = await list_items(
+            db, item_type=item_type, favorites_only=favorites_only, search=search, sort=sort
+        )
+        return _ITEM_LIST_ADAPTER.dump_json(
+            _ITEM_LIST_ADAPTER.validate_python(items, from_attributes=True)
+        ).decode()
+
+    return await _cached_json("list", f"{_CACHE_KEY_PREFIX}{version}:list:{digest}", load)
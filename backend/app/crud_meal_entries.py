@@ -38,10 +38,11 @@ import hashlib
 import logging
 import secrets
 from datetime import datetime, timedelta
-from sqlalchemy import exists, or_, select, update, delete, text
+from sqlalchemy import Date, Integer, column, exists, func, insert, or_, select, update, delete, text, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from . import models, schemas
+from . import crud_app_settings, crud_items, crud_meal_slot_types, models, schemas
+from .utils.task_dedupe import submit_once
 
 
 def _token_fingerprint(token: str) -> str:
@@ -84,13 +85,26 @@ def visible_meal_entries_stmt():
     )
 
 
-async def get_meal_entries(
-    db: AsyncSession,
-    start_date,
-    end_date,
-    family_member_id: int | None = None,
-):
-    """Get meal entries for a date range, with optional per-person filter."""
+def _has_participant(family_member_id: int):
+    """Entries `family_member_id` takes part in. A bare EXISTS on the junction
+    (no join to family_members), so it probes `meal_entry_participants_member_idx`."""
+    junction = models.meal_entry_participants
+    # correlate_except: the board query also joins the junction for its
+    # participant_ids aggregate, and this EXISTS must still scan its own copy
+    return exists().where(
+        junction.c.meal_entry_id == models.MealEntry.id,
+        junction.c.family_member_id == family_member_id,
+    ).correlate_except(junction)
+
+
+def meal_entries_in_range_stmt(start_date, end_date, family_member_id: int | None = None):
+    """Visible entries in [start_date, end_date] in board order, optionally
+    only those `family_member_id` takes part in.
+
+    Served by `meal_entries_visible_board_idx` (partial on visible rows, keyed
+    in this order) and, for the per-person filter,
+    `meal_entry_participants_member_idx`.
+    """
     stmt = (
         visible_meal_entries_stmt()
         .where(models.MealEntry.date >= start_date)
@@ -103,15 +117,89 @@ async def get_meal_entries(
     )
 
     if family_member_id is not None:
-        # Filter to entries where this family member is a participant
-        stmt = stmt.where(
-            models.MealEntry.participants.any(
-                models.FamilyMember.id == family_member_id
+        stmt = stmt.where(_has_participant(family_member_id))
+    return stmt
+
+
+async def get_meal_entries(
+    db: AsyncSession,
+    start_date,
+    end_date,
+    family_member_id: int | None = None,
+):
+    """Get meal entries for a date range, with optional per-person filter."""
+    result = await db.execute(meal_entries_in_range_stmt(start_date, end_date, family_member_id))
+    return result.scalars().unique().all()
+
+
+async def get_week_board(db: AsyncSession, start, family_member_id: int | None = None) -> dict:
+    """Everything the meal board renders for the 7 days from `start`, in a
+    fixed five queries however many meals are planned (settings, slot types,
+    family members, entries, items).
+
+    Unlike `get_meal_entries` this never loads Item / MealEntry entities: the
+    entries query selects plain columns with participant ids aggregated in
+    SQL, and each referenced item is read once, flattened to the fields a
+    meal card shows. Shape matches `schemas.MealboardWeek`.
+    """
+    end = start + timedelta(days=6)
+    settings = await crud_app_settings.get_settings(db)
+    slot_types = await crud_meal_slot_types.get_meal_slot_types(db)
+    members = (await db.execute(
+        select(models.FamilyMember)
+        .order_by(models.FamilyMember.is_system.desc(), models.FamilyMember.name)
+    )).scalars().all()
+
+    entry = models.MealEntry
+    participants = models.meal_entry_participants.c
+    entry_stmt = (
+        select(
+            entry.id, entry.date, entry.meal_slot_type_id, entry.item_id,
+            entry.custom_meal_name, entry.servings, entry.was_cooked, entry.notes,
+            entry.sort_order, entry.shopping_sync_status,
+            func.coalesce(
+                func.array_agg(participants.family_member_id)
+                .filter(participants.family_member_id.is_not(None)),
+                text("'{}'::int[]"),
+            ).label("participant_ids"),
+        )
+        .outerjoin(models.meal_entry_participants, participants.meal_entry_id == entry.id)
+        .where(entry.soft_hidden_at.is_(None))
+        .where(entry.date >= start, entry.date <= end)
+        .group_by(entry.id)
+        .order_by(entry.date, entry.meal_slot_type_id, entry.sort_order)
+    )
+    if family_member_id is not None:
+        entry_stmt = entry_stmt.where(_has_participant(family_member_id))
+    entries = [dict(row._mapping) for row in (await db.execute(entry_stmt)).all()]
+
+    items = []
+    item_ids = {e["item_id"] for e in entries if e["item_id"] is not None}
+    if item_ids:
+        recipe, food = models.RecipeDetail, models.FoodItemDetail
+        result = await db.execute(
+            select(
+                models.Item.id, models.Item.name, models.Item.item_type,
+                models.Item.icon_emoji, models.Item.icon_url, models.Item.is_favorite,
+                recipe.prep_time_minutes, recipe.cook_time_minutes, recipe.servings,
+                recipe.image_url, food.category,
             )
+            .outerjoin(recipe, recipe.item_id == models.Item.id)
+            .outerjoin(food, food.item_id == models.Item.id)
+            .where(models.Item.id.in_(item_ids))
+            .order_by(models.Item.id)
         )
+        items = [dict(row._mapping) for row in result.all()]
 
-    result = await db.execute(stmt)
-    return result.scalars().unique().all()
+    return {
+        "start": start,
+        "end": end,
+        "settings": settings,
+        "slot_types": slot_types,
+        "family_members": members,
+        "items": items,
+        "entries": entries,
+    }
 
 
 async def get_meal_entry(db: AsyncSession, entry_id: int):
@@ -197,13 +285,14 @@ async def create_meal_entry(db: AsyncSession, entry: schemas.MealEntryCreate):
                     meal_entry_id=db_entry.id, family_member_id=pid
                 )
             )
+    await crud_items.record_usage(db, db_entry.item_id, db_entry.date)
 
     await db.commit()
 
     # Dispatch shopping list sync AFTER the commit so the worker can find the row.
     try:
         from .tasks import sync_shopping_list_add
-        sync_shopping_list_add.delay(db_entry.id)
+        submit_once(sync_shopping_list_add, f"shopping:add:{db_entry.id}", (db_entry.id,))
         logger.info(f"Dispatched shopping sync for meal entry {db_entry.id}")
     except Exception as e:
         logger.warning(f"Failed to dispatch shopping sync: {e}")
@@ -224,6 +313,7 @@ async def update_meal_entry(
         return None
 
     update_data = entry_update.model_dump(exclude_unset=True, exclude={"participant_ids"})
+    previous_item_id = db_entry.item_id
 
     # Apply scalar field updates via UPDATE statement (avoids lazy-load issues)
     if update_data:
@@ -233,6 +323,10 @@ async def update_meal_entry(
             .values(**update_data)
         )
         await db.execute(stmt)
+        if "item_id" in update_data or "date" in update_data:
+            await crud_items.recount_usage(
+                db, [previous_item_id, update_data.get("item_id", previous_item_id)]
+            )
 
     # Update participants if provided — replace all junction rows
     if entry_update.participant_ids is not None:
@@ -282,6 +376,7 @@ async def delete_meal_entry(db: AsyncSession, entry_id: int):
     # Capture the list id BEFORE the soft-delete commit since the Celery task
     # needs it to target the right list.
     synced_to_list_id = entry.synced_to_list_id
+    item_id = entry.item_id
 
     undo_token = secrets.token_hex(16)  # 32-char hex fits our VARCHAR(64)
     now = datetime.utcnow()
@@ -291,6 +386,7 @@ async def delete_meal_entry(db: AsyncSession, entry_id: int):
         .where(models.MealEntry.id == entry_id)
         .values(soft_hidden_at=now, undo_token=undo_token)
     )
+    await crud_items.release_usage(db, item_id)
     await db.commit()
     logger.info(
         "soft_delete meal_entry_id=%s token_fp=%s",
@@ -307,8 +403,10 @@ async def delete_meal_entry(db: AsyncSession, entry_id: int):
     # no-op when the entry was undone back to live.
     try:
         from .tasks import sync_shopping_list_remove
-        sync_shopping_list_remove.apply_async(
-            args=[entry_id, synced_to_list_id],
+        submit_once(
+            sync_shopping_list_remove,
+            f"shopping:remove:{entry_id}",
+            (entry_id, synced_to_list_id),
             countdown=int(UNDO_WINDOW_SECONDS) + 1,
         )
         logger.info(
@@ -365,6 +463,7 @@ async def undo_delete_meal_entry(db: AsyncSession, entry_id: int, token: str):
     pre_undo_token = existing.undo_token
     pre_soft_hidden_at = existing.soft_hidden_at
     pre_item_deleted_at = existing.item.deleted_at if existing.item is not None else None
+    pre_item_id, pre_date = existing.item_id, existing.date
 
     # Refuse rows that aren't user-undo rows. Cascade-hidden rows (undo_token
     # IS NULL) are owned by the parent-item delete lifecycle, not this flow.
@@ -423,6 +522,7 @@ async def undo_delete_meal_entry(db: AsyncSession, entry_id: int, token: str):
         await db.rollback()
         raise UndoFailedError(reason)
 
+    await crud_items.record_usage(db, pre_item_id, pre_date)
     await db.commit()
     elapsed = (datetime.utcnow() - pre_soft_hidden_at).total_seconds()
     logger.info("undo_success meal_entry_id=%s within_s=%.2f", entry_id, elapsed)
@@ -432,8 +532,196 @@ async def undo_delete_meal_entry(db: AsyncSession, entry_id: int, token: str):
     # restore.
     try:
         from .tasks import sync_shopping_list_add
-        sync_shopping_list_add.delay(entry_id)
+        submit_once(sync_shopping_list_add, f"shopping:add:{entry_id}", (entry_id,))
     except Exception as e:
         logger.warning("undo_sync_add_failed meal_entry_id=%s err=%s", entry_id, e)
 
     return await get_meal_entry(db, entry_id)
+
+
+# ---------------------------------------------------------------------------
+# Bulk planning
+# ---------------------------------------------------------------------------
+# A templated week used to be one POST per meal, each resolving participants,
+# committing and dispatching its own shopping sync. The bulk writers resolve
+# every reference once, write with multi-row statements in one transaction
+# and hand the shopping list a single drain.
+
+
+class BulkPlanningError(Exception):
+    """A bulk request references a slot type, item, family member or meal
+    entry that doesn't exist. Raised before anything is written; the route
+    translates it into 400."""
+
+
+def _missing(kind: str, wanted, found) -> None:
+    missing = sorted(set(wanted) - set(found))
+    if missing:
+        raise BulkPlanningError(f"Unknown {kind}: {missing}")
+
+
+async def _slot_defaults(db: AsyncSession, slot_ids) -> dict[int, list[int] | None]:
+    result = await db.execute(
+        select(models.MealSlotType.id, models.MealSlotType.default_participants)
+        .where(models.MealSlotType.id.in_(set(slot_ids)))
+    )
+    defaults = dict(result.all())
+    _missing("meal slot types", slot_ids, defaults)
+    return defaults
+
+
+async def _insert_entries(db: AsyncSession, rows: list[dict], participants: list[list[int]]):
+    """Insert `rows` (MealEntry column dicts) with `participants[i]` for
+    row i, then commit and queue one shopping drain. Returns the new entries."""
+    result = await db.execute(
+        insert(models.MealEntry).returning(models.MealEntry.id, sort_by_parameter_order=True),
+        [{**row, "shopping_sync_status": "pending"} for row in rows],
+    )
+    entry_ids = list(result.scalars().all())
+
+    links = [
+        {"meal_entry_id": entry_id, "family_member_id": member_id}
+        for entry_id, member_ids in zip(entry_ids, participants)
+        for member_id in member_ids
+    ]
+    if links:
+        await db.execute(models.meal_entry_participants.insert().values(links))
+    await crud_items.recount_usage(db, [row.get("item_id") for row in rows])
+    await db.commit()
+
+    try:
+        from .tasks import sync_pending_shopping_entries
+        submit_once(sync_pending_shopping_entries, "shopping:drain")
+        logger.info("Dispatched shopping drain for %d new meal entries", len(entry_ids))
+    except Exception as e:
+        logger.warning(f"Failed to dispatch shopping sync: {e}")
+
+    return await _get_entries(db, entry_ids)
+
+
+async def _get_entries(db: AsyncSession, entry_ids):
+    result = await db.execute(
+        visible_meal_entries_stmt()
+        .where(models.MealEntry.id.in_(entry_ids))
+        .order_by(
+            models.MealEntry.date,
+            models.MealEntry.meal_slot_type_id,
+            models.MealEntry.sort_order,
+            models.MealEntry.id,
+        )
+    )
+    return result.scalars().unique().all()
+
+
+async def create_meal_entries(db: AsyncSession, entries: list[schemas.MealEntryCreate]):
+    """Create many meal entries in one transaction.
+
+    Same participant resolution as `create_meal_entry`, but slot defaults and
+    the family roster are read once for the whole batch, and unknown slot
+    types, items or participants reject the batch up front.
+    """
+    defaults = await _slot_defaults(db, [e.meal_slot_type_id for e in entries])
+    member_ids = (await db.execute(select(models.FamilyMember.id))).scalars().all()
+    item_ids = {e.item_id for e in entries if e.item_id is not None}
+    if item_ids:
+        live = await db.execute(
+            select(models.Item.id)
+            .where(models.Item.id.in_(item_ids))
+            .where(models.Item.deleted_at.is_(None))
+        )
+        _missing("items", item_ids, live.scalars().all())
+    _missing(
+        "family members",
+        {pid for e in entries for pid in (e.participant_ids or [])},
+        member_ids,
+    )
+
+    participants = []
+    for e in entries:
+        if e.participant_ids is not None:
+            participants.append(list(dict.fromkeys(e.participant_ids)))
+        else:
+            # Same fallback as _resolve_participant_ids: defaults, else everyone
+            participants.append(defaults[e.meal_slot_type_id] or list(member_ids))
+    rows = [e.model_dump(exclude={"participant_ids"}) for e in entries]
+    return await _insert_entries(db, rows, participants)
+
+
+async def copy_week(db: AsyncSession, source_start, target_start):
+    """Copy every visible entry of the week starting `source_start` to the
+    same weekday and slot of the week starting `target_start`, participants
+    included. Copies start un-cooked. Returns the new entries."""
+    shift = target_start - source_start
+    entry = models.MealEntry
+    junction = models.meal_entry_participants.c
+    result = await db.execute(
+        select(
+            entry.date, entry.meal_slot_type_id, entry.item_id, entry.custom_meal_name,
+            entry.servings, entry.notes, entry.sort_order,
+            func.array_remove(func.array_agg(junction.family_member_id), None),
+        )
+        .outerjoin(models.meal_entry_participants, junction.meal_entry_id == entry.id)
+        .where(entry.soft_hidden_at.is_(None))
+        .where(entry.date >= source_start, entry.date <= source_start + timedelta(days=6))
+        .group_by(entry.id)
+        .order_by(entry.date, entry.meal_slot_type_id, entry.sort_order, entry.id)
+    )
+    source = result.all()
+    if not source:
+        return []
+    rows, participants = [], []
+    for day, slot_id, item_id, custom_name, servings, notes, sort_order, member_ids in source:
+        rows.append({
+            "date": day + shift,
+            "meal_slot_type_id": slot_id,
+            "item_id": item_id,
+            "custom_meal_name": custom_name,
+            "servings": servings,
+            "notes": notes,
+            "sort_order": sort_order,
+            "was_cooked": False,
+        })
+        participants.append(list(member_ids))
+    return await _insert_entries(db, rows, participants)
+
+
+async def move_meal_entries(db: AsyncSession, moves: list[schemas.MealEntryMove]):
+    """Re-date (and optionally re-slot / re-order) many entries with a single
+    UPDATE … FROM (VALUES …). Participants and shopping rows are untouched,
+    as with a single PATCH. Returns the moved entries."""
+    entry_ids = [m.id for m in moves]
+    if len(set(entry_ids)) != len(entry_ids):
+        raise BulkPlanningError("Each meal entry can only be moved once per request")
+    result = await db.execute(
+        select(models.MealEntry.id, models.MealEntry.item_id)
+        .where(models.MealEntry.id.in_(entry_ids))
+        .where(models.MealEntry.soft_hidden_at.is_(None))
+    )
+    item_by_entry = dict(result.all())
+    _missing("meal entries", entry_ids, item_by_entry)
+    slot_ids = {m.meal_slot_type_id for m in moves if m.meal_slot_type_id is not None}
+    if slot_ids:
+        await _slot_defaults(db, slot_ids)
+
+    moved = values(
+        column("id", Integer),
+        column("date", Date),
+        column("meal_slot_type_id", Integer),
+        column("sort_order", Integer),
+        name="moved",
+    ).data([(m.id, m.date, m.meal_slot_type_id, m.sort_order) for m in moves])
+    await db.execute(
+        update(models.MealEntry)
+        .where(models.MealEntry.id == moved.c.id)
+        .values(
+            date=moved.c.date,
+            meal_slot_type_id=func.coalesce(moved.c.meal_slot_type_id, models.MealEntry.meal_slot_type_id),
+            sort_order=func.coalesce(moved.c.sort_order, models.MealEntry.sort_order),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await crud_items.recount_usage(db, item_by_entry.values())
+    await db.commit()
+    # Identity-map entries still hold the old dates
+    db.expunge_all()
+    return await _get_entries(db, entry_ids)
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from . import models, schemas
+from .utils.task_dedupe import submit_once
 
 
 def _children_2_levels():
@@ -110,7 +111,9 @@ async def create_task(db: AsyncSession, task: schemas.TaskCreate):
     if db_task.calendar_integration_id and db_task.sync_status == "PENDING_PUSH":
         try:
             from .tasks import push_task_to_icloud_task
-            push_task_to_icloud_task.apply_async(args=[db_task.id], countdown=30)
+            submit_once(
+                push_task_to_icloud_task, f"push:task:{db_task.id}", (db_task.id,), countdown=30
+            )
         except (ImportError, ConnectionError, OSError):
             pass  # Celery not available — push will happen on next pull
 
@@ -157,7 +160,7 @@ async def update_task(db: AsyncSession, task_id: int, task: schemas.TaskUpdate):
         await db.commit()
         try:
             from .tasks import push_task_to_icloud_task
-            push_task_to_icloud_task.apply_async(args=[task_id], countdown=30)
+            submit_once(push_task_to_icloud_task, f"push:task:{task_id}", (task_id,), countdown=30)
         except (ImportError, ConnectionError, OSError):
             pass  # Celery not available (e.g. in tests) — push will happen on next pull
     else:
@@ -7,7 +7,8 @@ from pathlib import Path
 import os
 from sqlalchemy.ext.asyncio import AsyncSession
 from .database import get_db
-from .routes import tasks, family_members, responsibilities, uploads, lists, items, calendar_events, integrations, app_settings, calendars, sections, meal_slot_types, meal_entries
+from .routes import tasks, family_members, responsibilities, uploads, lists, items, calendar_events, integrations, app_settings, calendars, sections, meal_slot_types, meal_entries, mealboard, ingredient_aliases
+from .utils import conditional_get
 from app.auth import get_current_user, router as auth_router
 
 UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "/app/uploads"))
@@ -64,9 +65,30 @@ def _initialize_auth_config() -> None:
         )
 
 
+async def _load_ingredient_aliases() -> None:
+    """Lifespan startup hook: warm the shopping-list alias dictionary.
+
+    Best effort — if the database isn't reachable yet, the first shopping
+    sync loads it instead (see services/ingredient_aliases.py).
+    """
+    import logging
+
+    from .database import AsyncSessionLocal
+    from .services.ingredient_aliases import load_aliases
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await load_aliases(db)
+    except Exception as exc:
+        logging.getLogger(__name__).warning(
+            "Ingredient aliases not loaded at startup: %s", exc
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _initialize_auth_config()
+    await _load_ingredient_aliases()
     yield
 
 
@@ -106,6 +128,13 @@ def _parse_cors_origins(raw: str | None, app_env: str | None = None) -> list[str
     return [o.strip() for o in source.split(",") if o.strip()]
 
 
+# Conditional GETs on the polled collection routes (routes declare their
+# tables with `conditional_get.versioned(...)`). Registered before CORS so it
+# runs inside it.
+app.middleware("http")(conditional_get.etag_middleware)
+app.add_exception_handler(conditional_get.NotModified, conditional_get.not_modified_handler)
+
+
 # Env-driven so the visual-regression test stack can inject
 # `http://frontend-preview:4173` without changing prod config. Prod behavior is
 # unchanged when CORS_ALLOW_ORIGINS is unset.
@@ -118,6 +147,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[items.NEXT_CURSOR_HEADER, "ETag"],
     max_age=3600,
 )
 
@@ -173,6 +203,8 @@ protected.include_router(calendars.router)
 protected.include_router(sections.router)
 protected.include_router(meal_slot_types.router)
 protected.include_router(meal_entries.router)
+protected.include_router(mealboard.router)
+protected.include_router(ingredient_aliases.router)
 app.include_router(protected)
 
 # Public surface — registered directly on `app`, NOT on `protected`.
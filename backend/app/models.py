@@ -1,6 +1,9 @@
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     CheckConstraint,
     Column,
+    Computed,
     Index,
     Integer,
     Float,
@@ -17,10 +20,11 @@ from sqlalchemy import (
     func,
     text,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship, declarative_base
 from enum import Enum as PyEnum
 
 Base = declarative_base()
@@ -107,7 +111,6 @@ class Task(Base):
     )
     integration = relationship("CalendarIntegration", back_populates="synced_tasks")
     # Mealboard shopping sync fields (nullable — only for auto-generated shopping items)
-    source_meals = Column(JSON, nullable=True)  # [{meal_entry_id, source_kind, ...}]
     aggregation_key_name = Column(String, nullable=True)  # Canonical normalized name
     aggregation_unit_group = Column(String, nullable=True)  # "weight", "volume", "count", "none"
     aggregation_source = Column(String, nullable=True)  # "mealboard_auto" or NULL for manual
@@ -139,6 +142,51 @@ class Task(Base):
         ),
     )
 
+    shopping_sources = relationship(
+        "ShoppingItemSource", back_populates="task", passive_deletes=True
+    )
+
+
+class ShoppingItemSource(Base):
+    """One meal entry's contribution to an aggregated shopping item.
+
+    A task's aggregation_base_quantity is the SUM of its sources' base_quantity.
+    Indexed by meal_entry_id so removing a meal touches only the rows it
+    contributed, however long the shopping list is.
+    """
+    __tablename__ = "shopping_item_sources"
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(
+        Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    meal_entry_id = Column(
+        Integer, ForeignKey("meal_entries.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    source_kind = Column(String, nullable=False)  # "recipe_ingredient" or "food_item"
+    item_id = Column(Integer, nullable=True)  # Recipe / food Item the ingredient came from
+    display_name = Column(String, nullable=False)
+    ingredient_name = Column(String, nullable=False)  # Canonical name
+    base_quantity = Column(Float, nullable=False, default=0)  # In the task's base unit
+    unit = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    task = relationship("Task", back_populates="shopping_sources")
+
+
+class IngredientAlias(Base):
+    """Maps an ingredient name onto another name's shopping bucket.
+
+    Both columns hold canonicalized names (lowercase, singular), so
+    "Scallions" → "Green Onions" is stored as scallion → green onion.
+    """
+    __tablename__ = "ingredient_aliases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    alias = Column(String, nullable=False, unique=True)
+    canonical_name = Column(String, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+
 
 class Responsibility(Base):
     __tablename__ = "responsibilities"
@@ -213,6 +261,22 @@ class Item(Base):
     updated_at = Column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
+    # Count and latest date of the item's visible meal_entries. Maintained in
+    # the same transaction by every writer that shows or hides an entry (see
+    # "Usage counters" in crud_items.py); the nightly reconcile repairs drift.
+    usage_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_used_on = Column(Date, nullable=True)
+    # Full-text search document (name weighted A, tags B); recipe description
+    # and ingredient names live in RecipeDetail.search_vector. Deferred — only
+    # crud_items.search_items reads it, and only inside SQL.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', name), 'A') || "
+            "setweight(jsonb_to_tsvector('english', tags, '[\"string\"]'), 'B')",
+            persisted=True,
+        ),
+    ))
 
     # Eager-load detail relationships via selectinload to avoid N+1 on list queries.
     # Adversarial review #3 + #7: default lazy loading produces N+1 on any query that
@@ -234,10 +298,19 @@ class Item(Base):
     # Back-reference only — DO NOT read `item.meal_entries` from UI/CRUD code.
     # It loads ALL rows including soft-hidden ones. Use `visible_meal_entries_stmt()`
     # in `crud_meal_entries.py` instead. See Eng Review #3 Issue 6.
+    # lazy="raise": every Item load (list, detail, each MealEntry.item) used to
+    # drag in the item's whole meal history. Touching it now raises instead of
+    # silently querying; a caller that really needs it must opt in with
+    # `selectinload(models.Item.meal_entries)` on its own statement.
     meal_entries = relationship(
-        "MealEntry", back_populates="item", lazy="selectin"
+        "MealEntry", back_populates="item", lazy="raise"
     )
 
+    @property
+    def meal_entry_count(self) -> int:
+        """API name for `usage_count` (schemas.ItemRead.meal_entry_count)."""
+        return self.usage_count or 0
+
     __table_args__ = (
         CheckConstraint(
             "item_type IN ('recipe', 'food_item')",
@@ -261,6 +334,17 @@ class Item(Base):
             unique=True,
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        Index("items_search_vector_gin", "search_vector", postgresql_using="gin"),
+        # Keyset pagination order for GET /items (crud_items.list_items)
+        Index(
+            "items_active_name_id_idx", "name", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # "Most used" ordering, scanned backwards (usage_count DESC, id DESC)
+        Index(
+            "items_active_usage_idx", "usage_count", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
 
@@ -279,9 +363,23 @@ class RecipeDetail(Base):
     servings = Column(Integer, nullable=True)
     image_url = Column(Text, nullable=True)
     source_url = Column(Text, nullable=True)
+    # Ingredient names weighted B, description C. See Item.search_vector.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(jsonb_to_tsvector('english', "
+            "jsonb_path_query_array(ingredients, '$[*].name'), '[\"string\"]'), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    ))
 
     item = relationship("Item", back_populates="recipe_detail", lazy="selectin")
 
+    __table_args__ = (
+        Index("recipe_details_search_vector_gin", "search_vector", postgresql_using="gin"),
+    )
+
 
 class FoodItemDetail(Base):
     """Food-item-only fields keyed by item_id. Never queried directly; always through Item."""
@@ -370,6 +468,12 @@ class MealEntry(Base):
         Index(
             "meal_entries_item_id_idx", "item_id",
         ),
+        # Weekly board: date range over visible rows, in the board's order
+        # (crud_meal_entries.meal_entries_in_range_stmt)
+        Index(
+            "meal_entries_visible_board_idx", "date", "meal_slot_type_id", "sort_order",
+            postgresql_where=text("soft_hidden_at IS NULL"),
+        ),
         Index(
             "meal_entries_soft_hidden_at_idx", "soft_hidden_at",
             postgresql_where=text("soft_hidden_at IS NOT NULL"),
@@ -387,6 +491,8 @@ meal_entry_participants = Table(
     Base.metadata,
     Column("meal_entry_id", Integer, ForeignKey("meal_entries.id", ondelete="CASCADE"), primary_key=True),
     Column("family_member_id", Integer, ForeignKey("family_members.id", ondelete="CASCADE"), primary_key=True),
+    # The PK leads with meal_entry_id; per-person filters start from the member
+    Index("meal_entry_participants_member_idx", "family_member_id", "meal_entry_id"),
 )
 
 
@@ -451,6 +557,59 @@ class Calendar(Base):
     )
 
 
+class RecurringEventSeries(Base):
+    """Master VEVENT of a recurring iCloud event (DTSTART + RRULE).
+
+    Occurrences inside the sync window are materialized as CalendarEvent rows
+    (series_id / recurrence_id set) by services.recurrence; expanded_until is
+    the high-water mark so the window can slide forward without re-expanding.
+    """
+
+    __tablename__ = "recurring_event_series"
+
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(String, nullable=False)  # iCalendar UID
+    calendar_integration_id = Column(
+        Integer,
+        ForeignKey("calendar_integrations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    calendar_id = Column(
+        Integer,
+        ForeignKey("calendars.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    title = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    # Naive wall-clock start in `timezone` (midnight for all-day series)
+    dtstart = Column(DateTime, nullable=False)
+    all_day = Column(Boolean, default=False, nullable=False)
+    timezone = Column(String, nullable=True)
+    duration_minutes = Column(Integer, nullable=True)  # null = no DTEND
+    rrule = Column(String, nullable=False)  # raw RRULE value, e.g. FREQ=WEEKLY;BYDAY=MO
+    # Recurrence keys (see services.recurrence.occurrence_key)
+    exdates = Column(JSON, nullable=False, default=list)
+    # {recurrence key: override fields, or null for a cancelled instance}
+    overrides = Column(JSON, nullable=False, default=dict)
+    etag = Column(String, nullable=True)
+    last_modified_remote = Column(DateTime, nullable=True)
+    expanded_until = Column(Date, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now(), nullable=True)
+
+    occurrences = relationship(
+        "CalendarEvent", back_populates="series", passive_deletes=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "external_id",
+            "calendar_integration_id",
+            name="uq_recurring_series_external_integration",
+        ),
+    )
+
+
 class CalendarEvent(Base):
     __tablename__ = "calendar_events"
 
@@ -484,8 +643,16 @@ class CalendarEvent(Base):
         ForeignKey("calendars.id", ondelete="SET NULL"),
         nullable=True,
     )
+    # Set on occurrences materialized from a RecurringEventSeries
+    series_id = Column(
+        Integer,
+        ForeignKey("recurring_event_series.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    recurrence_id = Column(String, nullable=True)
     integration = relationship("CalendarIntegration", back_populates="calendar_events")
     calendar = relationship("Calendar", back_populates="events")
+    series = relationship("RecurringEventSeries", back_populates="occurrences")
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now(), nullable=True)
 
@@ -495,6 +662,11 @@ class CalendarEvent(Base):
             "calendar_integration_id",
             name="uq_calendar_event_external_integration",
         ),
+        UniqueConstraint(
+            "series_id",
+            "recurrence_id",
+            name="uq_calendar_event_series_occurrence",
+        ),
     )
 
 
@@ -544,3 +716,96 @@ class Section(Base):
     tasks = relationship("Task", back_populates="section")
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now(), nullable=True)
+
+
+class CollectionVersion(Base):
+    """Change counter per table, behind the ETags of the polled GET endpoints
+    (see utils/conditional_get.py).
+
+    Bumped by triggers on every table in `VERSIONED_TABLES`, so every
+    writer — API, Celery sync, manual SQL — is covered, and a reader only
+    sees the new version once the write has committed. The bump itself is
+    deferred to commit (see `collection_version_pending` below), so a row
+    here is only locked for the instant its writer commits.
+    """
+    __tablename__ = "collection_versions"
+
+    scope = Column(Text, primary_key=True)  # table name
+    version = Column(BigInteger, nullable=False, server_default="0")
+
+
+# Tables whose writes bump their collection_versions row. Keep in sync with
+# the triggers created by migration a4c6e8f0b2d4 (deferred by c8e0a2b4d6f8).
+VERSIONED_TABLES = (
+    "app_settings",
+    "calendar_events",
+    "calendars",
+    "family_members",
+    "food_item_details",
+    "items",
+    "meal_entries",
+    "meal_entry_participants",
+    "meal_slot_types",
+    "recipe_details",
+    "tasks",
+)
+
+# Scopes the current transaction has written but not yet bumped. The version
+# triggers only record the table here (keyed by transaction, so writers never
+# touch each other's rows); the deferred constraint trigger applies all of a
+# transaction's bumps at commit, in scope order. Bumping in place instead held
+# each hot collection_versions row for the rest of the transaction, which
+# serialized unrelated writers and deadlocked the ones that write the same
+# tables in opposite orders (soft_delete_item: items -> meal_entries;
+# create_meal_entry: meal_entries -> items). Rows never outlive their
+# transaction, hence UNLOGGED.
+collection_version_pending = Table(
+    "collection_version_pending",
+    Base.metadata,
+    Column("txid", BigInteger, primary_key=True),
+    Column("scope", Text, primary_key=True),
+    prefixes=["UNLOGGED"],
+)
+
+# Schemas built with metadata.create_all (tests) get the same triggers as the
+# migration. Statement-level with a transition table, so a bulk write bumps
+# once and an UPDATE/DELETE that matched nothing doesn't bump at all.
+event.listen(Base.metadata, "before_create", DDL("""
+    CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM changed) THEN
+            INSERT INTO collection_version_pending (txid, scope)
+            VALUES (txid_current(), TG_TABLE_NAME)
+            ON CONFLICT DO NOTHING;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""))
+event.listen(Base.metadata, "before_create", DDL("""
+    CREATE OR REPLACE FUNCTION apply_collection_version_bumps() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO collection_versions (scope, version)
+        SELECT scope, 1 FROM collection_version_pending
+        WHERE txid = txid_current()
+        ORDER BY scope
+        ON CONFLICT (scope) DO UPDATE SET version = collection_versions.version + 1;
+        DELETE FROM collection_version_pending WHERE txid = txid_current();
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""))
+# Fires once per pending row; the first firing applies and clears them all,
+# the rest find nothing.
+event.listen(collection_version_pending, "after_create", DDL(
+    "CREATE CONSTRAINT TRIGGER collection_version_pending_apply "
+    "AFTER INSERT ON collection_version_pending DEFERRABLE INITIALLY DEFERRED "
+    "FOR EACH ROW EXECUTE FUNCTION apply_collection_version_bumps()"
+))
+for _table in VERSIONED_TABLES:
+    for _op, _transition in (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD")):
+        event.listen(Base.metadata.tables[_table], "after_create", DDL(
+            f"CREATE TRIGGER {_table}_{_op}_bump_version AFTER {_op.upper()} ON {_table} "
+            f"REFERENCING {_transition} TABLE AS changed "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version()"
+        ))
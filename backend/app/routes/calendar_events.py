@@ -8,6 +8,8 @@ from .. import schemas, crud_calendar_events, crud_calendars
 from ..models import CalendarEventSource
 from ..database import get_db
 from ..crud_app_settings import get_settings
+from ..utils.conditional_get import versioned
+from ..utils.task_dedupe import submit_once
 
 router = APIRouter(
     prefix="/calendar-events",
@@ -16,7 +18,11 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[schemas.CalendarEvent])
+@router.get(
+    "/",
+    response_model=List[schemas.CalendarEvent],
+    dependencies=[versioned("calendar_events", "family_members", "calendars")],
+)
 async def get_calendar_events(
     start_date: date,
     end_date: date,
@@ -62,7 +68,7 @@ async def create_calendar_event(
             db, result.id, cal.calendar_integration_id, cal.id, "PENDING_PUSH"
         )
         from ..tasks import push_event_to_icloud
-        push_event_to_icloud.apply_async(args=[result.id], countdown=30)
+        submit_once(push_event_to_icloud, f"push:event:{result.id}", (result.id,), countdown=30)
         return await crud_calendar_events.get_calendar_event(db, result.id)
 
     return await crud_calendar_events.create_calendar_event(db=db, event=event)
@@ -83,6 +89,11 @@ async def update_calendar_event(
             status_code=400,
             detail="Google Calendar events cannot be edited yet",
         )
+    if existing.series_id is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Occurrences of recurring events cannot be edited yet",
+        )
 
     # Detect calendar_id transitions
     new_calendar_id = event_update.calendar_id if "calendar_id" in event_update.model_fields_set else None
@@ -105,7 +116,7 @@ async def update_calendar_event(
                 source=CalendarEventSource.ICLOUD,
             )
             from ..tasks import push_event_to_icloud
-            push_event_to_icloud.apply_async(args=[event_id], countdown=30)
+            submit_once(push_event_to_icloud, f"push:event:{event_id}", (event_id,), countdown=30)
             return await crud_calendar_events.get_calendar_event(db, event_id)
 
         elif old_calendar_id is not None and new_calendar_id is None:
@@ -152,7 +163,7 @@ async def update_calendar_event(
     if existing.source == CalendarEventSource.ICLOUD:
         await crud_calendar_events.set_sync_status(db, event_id, "PENDING_PUSH")
         from ..tasks import push_event_to_icloud
-        push_event_to_icloud.apply_async(args=[event_id], countdown=30)
+        submit_once(push_event_to_icloud, f"push:event:{event_id}", (event_id,), countdown=30)
         # Re-fetch after set_sync_status commit to avoid expired attributes
         result = await crud_calendar_events.get_calendar_event(db, event_id)
     return result
@@ -169,6 +180,11 @@ async def delete_calendar_event(event_id: int, db: AsyncSession = Depends(get_db
             status_code=400,
             detail="Google Calendar events cannot be deleted yet",
         )
+    if existing.series_id is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Occurrences of recurring events cannot be deleted yet",
+        )
     # For ICLOUD events: save info needed to push delete to remote
     push_delete = (
         existing.source == CalendarEventSource.ICLOUD
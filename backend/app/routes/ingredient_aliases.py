@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from .. import schemas, crud_ingredient_aliases
+from ..database import get_db
+
+router = APIRouter(
+    prefix="/ingredient-aliases",
+    tags=["ingredient-aliases"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/", response_model=List[schemas.IngredientAlias])
+async def get_ingredient_aliases(db: AsyncSession = Depends(get_db)):
+    """Get the shopping-list synonym dictionary."""
+    return await crud_ingredient_aliases.get_ingredient_aliases(db)
+
+
+@router.post("/", response_model=schemas.IngredientAlias, status_code=status.HTTP_201_CREATED)
+async def create_ingredient_alias(
+    alias_in: schemas.IngredientAliasCreate, db: AsyncSession = Depends(get_db)
+):
+    """Bucket `alias` with `canonical_name` on the shopping list.
+
+    Existing shopping rows are merged by a background re-bucket job.
+    """
+    try:
+        return await crud_ingredient_aliases.create_ingredient_alias(db, alias_in)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"'{alias_in.alias}' is already an alias",
+        )
+
+
+@router.delete("/{alias_id}", response_model=schemas.IngredientAlias)
+async def delete_ingredient_alias(alias_id: int, db: AsyncSession = Depends(get_db)):
+    """Remove an alias. Existing shopping rows are split back out by the re-bucket job."""
+    deleted = await crud_ingredient_aliases.delete_ingredient_alias(db, alias_id)
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Ingredient alias not found")
+    return deleted
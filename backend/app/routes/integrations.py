@@ -12,6 +12,7 @@ from typing import List
 from .. import schemas, crud_calendar_integrations, models
 from ..database import get_db
 from ..services import caldav_client
+from ..utils.task_dedupe import submit_once
 
 logger = logging.getLogger(__name__)
 
@@ -155,7 +156,7 @@ async def connect_icloud(
 
     from ..tasks import sync_single_integration
 
-    sync_single_integration.delay(integration.id)
+    submit_once(sync_single_integration, f"sync:integration:{integration.id}", (integration.id,))
 
     return await crud_calendar_integrations.get_integration(db, integration.id)
 
@@ -197,7 +198,7 @@ async def trigger_sync(
 
     from ..tasks import sync_single_integration
 
-    sync_single_integration.delay(integration_id)
+    submit_once(sync_single_integration, f"sync:integration:{integration_id}", (integration_id,))
 
     return await crud_calendar_integrations.get_integration(db, integration_id)
 
@@ -376,7 +377,11 @@ async def connect_reminders(
 
     from ..tasks import sync_single_reminders_integration
 
-    sync_single_reminders_integration.delay(payload.integration_id)
+    submit_once(
+        sync_single_reminders_integration,
+        f"sync:reminders:{payload.integration_id}",
+        (payload.integration_id,),
+    )
 
     return await crud_calendar_integrations.get_integration(db, payload.integration_id)
 
@@ -406,7 +411,11 @@ async def trigger_reminders_sync(
 
     from ..tasks import sync_single_reminders_integration
 
-    sync_single_reminders_integration.delay(integration_id)
+    submit_once(
+        sync_single_reminders_integration,
+        f"sync:reminders:{integration_id}",
+        (integration_id,),
+    )
 
     return await crud_calendar_integrations.get_integration(db, integration_id)
 
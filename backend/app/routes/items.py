@@ -1,29 +1,32 @@
 """Canonical /items routes — replaces /recipes and /food-items.
 
 Endpoints:
-    GET    /items                          — list all items
+    GET    /items                          — list all items (or a keyset page: ?limit=&cursor=&expand=&sort=)
+    GET    /items/search?q=                — ranked full-text search with highlights
     GET    /items/{id}                     — fetch one item with its detail
     POST   /items                          — create
     PATCH  /items/{id}                     — update (partial)
     DELETE /items/{id}                     — soft-delete, returns {undo_token, expires_at}
     POST   /items/{id}/undo                — restore soft-deleted item
     POST   /items/suggest-icon             — AI-backed emoji suggestion
+    POST   /items/parse-ingredients        — split pasted ingredient lines locally
     POST   /items/import-from-url          — kick off async recipe extraction from a URL
     GET    /items/import-status/{task_id}  — poll extraction status / result
     POST   /uploads/item-icon              — file upload (lives in routes/uploads.py)
 """
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import os
 import re
 import uuid
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Union
 from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field, HttpUrl
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -33,6 +36,7 @@ from .. import crud_items, schemas
 from ..celery_app import celery_app
 from ..constants import import_errors as codes
 from ..database import get_db
+from ..utils.conditional_get import versioned
 from ..utils.url_safety import SSRFBlocked, URLResolutionFailed, validate_url_for_fetch
 
 log = logging.getLogger(__name__)
@@ -63,32 +67,123 @@ class UndoRequest(BaseModel):
     undo_token: str
 
 
+class ItemSearchResult(BaseModel):
+    item: schemas.ItemRead
+    rank: float
+    # HTML-escaped, matches wrapped in <mark>
+    name_highlight: str
+    description_highlight: Optional[str] = None
+
+
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
 
-@router.get("/", response_model=List[schemas.ItemRead])
+# Paged GET /items: the cursor for the next page travels in this header so
+# the body stays a plain list. Absent on the last page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+_DEFAULT_PAGE_SIZE = 50
+
+
+# Sort order → (item attribute leading the keyset, its JSON type in the cursor)
+_SORT_KEYS = {"name": ("name", str), "usage": ("usage_count", int)}
+
+
+def _encode_cursor(item, sort: str) -> str:
+    attr, _ = _SORT_KEYS[sort]
+    return base64.urlsafe_b64encode(json.dumps([getattr(item, attr), item.id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    _, key_type = _SORT_KEYS[sort]
+    try:
+        key, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(key, key_type) or not isinstance(item_id, int):
+            raise ValueError
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key, item_id
+
+
+@router.get(
+    "/",
+    response_model=List[Union[schemas.ItemRead, schemas.ItemSummary]],
+    dependencies=[versioned("items", "recipe_details", "food_item_details")],
+)
 async def list_items(
+    response: Response,
     type: Optional[Literal["recipe", "food_item"]] = Query(
         None, description="Filter by item type"
     ),
     favorites_only: bool = Query(False, description="Only show favorited items"),
     search: Optional[str] = Query(None, description="Case-insensitive name search"),
+    sort: Literal["name", "usage"] = Query("name", description="Alphabetical, or most used first"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; enables paging"),
+    cursor: Optional[str] = Query(None, description=f"{NEXT_CURSOR_HEADER} from the previous page"),
+    expand: Optional[Literal["details"]] = Query(
+        None, description="Include recipe ingredients/instructions in paged results"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """List items, optionally filtered by type/favorites/search."""
-    return await crud_items.list_items(
-        db, item_type=type, favorites_only=favorites_only, search=search
+    """List items, optionally filtered by type/favorites/search.
+
+    Without `limit`/`cursor` every item is returned in full, as before.
+    Passing either pages in `sort` order and returns `ItemSummary` rows unless
+    `expand=details`; the next page's cursor is in the X-Next-Cursor header.
+    """
+    paged = limit is not None or cursor is not None
+    if not paged:
+        body = await crud_items.list_items_json(
+            db, item_type=type, favorites_only=favorites_only, search=search, sort=sort
+        )
+        return Response(content=body, media_type="application/json")
+
+    page_size = limit or _DEFAULT_PAGE_SIZE
+    summary = expand != "details"
+    items = await crud_items.list_items(
+        db,
+        item_type=type,
+        favorites_only=favorites_only,
+        search=search,
+        limit=page_size + 1,
+        after=_decode_cursor(cursor, sort) if cursor else None,
+        summary=summary,
+        sort=sort,
     )
+    if len(items) > page_size:
+        items = items[:page_size]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(items[-1], sort)
+    schema = schemas.ItemSummary if summary else schemas.ItemRead
+    return [schema.model_validate(item) for item in items]
+
+
+@router.get("/search", response_model=List[ItemSearchResult])
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms (prefix-matched)"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ranked search over names, tags, recipe descriptions and ingredients."""
+    rows = await crud_items.search_items(db, q, limit=limit)
+    return [
+        ItemSearchResult(
+            item=schemas.ItemRead.model_validate(item),
+            rank=rank,
+            name_highlight=name_highlight,
+            description_highlight=description_highlight,
+        )
+        for item, rank, name_highlight, description_highlight in rows
+    ]
 
 
 @router.get("/{item_id}", response_model=schemas.ItemRead)
 async def get_item(item_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a single item by id with its detail eagerly loaded."""
-    item = await crud_items.get_item(db, item_id)
-    if item is None:
+    """Get a single item by id with its detail eagerly loaded. Served from
+    the item cache when the catalog hasn't changed."""
+    body = await crud_items.get_item_json(db, item_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=schemas.ItemRead, status_code=status.HTTP_201_CREATED)
@@ -227,6 +322,49 @@ def suggest_icon(payload: SuggestIconRequest) -> SuggestIconResponse:
     return SuggestIconResponse(emoji=match.group(0), fallback_used=False)
 
 
+# ---------------------------------------------------------------------------
+# Pasted ingredient parsing (local, no LLM)
+# ---------------------------------------------------------------------------
+
+
+class ParseIngredientsRequest(BaseModel):
+    text: str = Field(..., min_length=1, max_length=20_000)
+
+
+class ParsedIngredientLine(BaseModel):
+    raw: str
+    name: str
+    quantity: Optional[float] = None
+    unit: Optional[str] = None
+    confidence: float
+
+
+class ParseIngredientsResponse(BaseModel):
+    ingredients: List[ParsedIngredientLine]
+
+
+@router.post("/parse-ingredients", response_model=ParseIngredientsResponse)
+def parse_ingredients(payload: ParseIngredientsRequest) -> ParseIngredientsResponse:
+    """Split pasted ingredient text, one ingredient per line, into
+    name / quantity / unit with the rule-based parser.
+
+    Lines scoring below ``ingredient_parser.CONFIDENT`` are still returned
+    so the client can highlight them for review.
+    """
+    from ..services import ingredient_parser
+
+    parsed = ingredient_parser.parse_ingredient_lines(payload.text.splitlines())
+    return ParseIngredientsResponse(
+        ingredients=[
+            ParsedIngredientLine(
+                raw=p.raw, name=p.name, quantity=p.quantity, unit=p.unit,
+                confidence=p.confidence,
+            )
+            for p in parsed
+        ]
+    )
+
+
 # ---------------------------------------------------------------------------
 # AI: Recipe URL import (async via Celery)
 # ---------------------------------------------------------------------------
@@ -5,6 +5,8 @@ from typing import List, Optional
 
 from .. import schemas, crud_meal_entries
 from ..database import get_db
+from ..utils.conditional_get import versioned
+from ..services import shopping_sync
 
 router = APIRouter(
     prefix="/meal-entries",
@@ -13,7 +15,14 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[schemas.MealEntry])
+@router.get(
+    "/",
+    response_model=List[schemas.MealEntry],
+    dependencies=[versioned(
+        "meal_entries", "meal_entry_participants", "items", "recipe_details",
+        "food_item_details", "meal_slot_types", "family_members",
+    )],
+)
 async def get_meal_entries(
     start_date: date,
     end_date: date,
@@ -26,6 +35,52 @@ async def get_meal_entries(
     )
 
 
+@router.get("/shopping-preview", response_model=List[schemas.ShoppingPreviewItem])
+async def preview_shopping_list(
+    start: date,
+    end: date,
+    db: AsyncSession = Depends(get_db),
+):
+    """Preview the shopping list for the meals planned in a date range.
+
+    Buckets every ingredient the same way the shopping sync does, but writes
+    nothing — the linked list is left untouched.
+    """
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    return await shopping_sync.preview_shopping_list(db, start_date=start, end_date=end)
+
+
+@router.post("/bulk", response_model=List[schemas.MealEntry], status_code=status.HTTP_201_CREATED)
+async def create_meal_entries(body: schemas.MealEntryBulkCreate, db: AsyncSession = Depends(get_db)):
+    """Create many meal entries atomically (e.g. a templated week).
+
+    Participants resolve exactly as for POST /meal-entries. One shopping sync
+    is queued for the whole batch.
+    """
+    try:
+        return await crud_meal_entries.create_meal_entries(db, body.entries)
+    except crud_meal_entries.BulkPlanningError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/copy-week", response_model=List[schemas.MealEntry], status_code=status.HTTP_201_CREATED)
+async def copy_week(body: schemas.MealEntryCopyWeek, db: AsyncSession = Depends(get_db)):
+    """Copy a week's meals onto another week, same weekday and slot."""
+    if body.target_start == body.source_start:
+        raise HTTPException(status_code=400, detail="target_start must differ from source_start")
+    return await crud_meal_entries.copy_week(db, body.source_start, body.target_start)
+
+
+@router.patch("/bulk-move", response_model=List[schemas.MealEntry])
+async def move_meal_entries(body: schemas.MealEntryBulkMove, db: AsyncSession = Depends(get_db)):
+    """Move many meal entries to new dates (and optionally slots / positions)."""
+    try:
+        return await crud_meal_entries.move_meal_entries(db, body.moves)
+    except crud_meal_entries.BulkPlanningError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{entry_id}", response_model=schemas.MealEntry)
 async def get_meal_entry(entry_id: int, db: AsyncSession = Depends(get_db)):
     """Get a single meal entry by ID."""
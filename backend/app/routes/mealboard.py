@@ -0,0 +1,32 @@
+from datetime import date
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from .. import schemas, crud_meal_entries
+from ..database import get_db
+from ..utils.conditional_get import versioned
+
+router = APIRouter(
+    prefix="/mealboard",
+    tags=["mealboard"],
+)
+
+
+@router.get(
+    "/week",
+    response_model=schemas.MealboardWeek,
+    dependencies=[versioned(
+        "app_settings", "meal_slot_types", "family_members", "meal_entries",
+        "meal_entry_participants", "items", "recipe_details", "food_item_details",
+    )],
+)
+async def get_week(
+    start: date = Query(..., description="First day of the week"),
+    family_member_id: Optional[int] = Query(None, description="Filter by family member participant"),
+    db: AsyncSession = Depends(get_db),
+):
+    """One-round-trip meal board: settings, slot types, family members, the
+    week's entries and each referenced item once (entries point at items and
+    participants by id)."""
+    return await crud_meal_entries.get_week_board(db, start, family_member_id=family_member_id)
@@ -6,6 +6,7 @@ from typing import List
 
 from .. import schemas, crud_tasks
 from ..database import get_db
+from ..utils.conditional_get import versioned
 
 router = APIRouter(
     prefix="/tasks",
@@ -14,7 +15,11 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[schemas.Task])
+@router.get(
+    "/",
+    response_model=List[schemas.Task],
+    dependencies=[versioned("tasks", "family_members")],
+)
 async def get_tasks(
     skip: int = 0,
     limit: int = 100,
@@ -415,11 +415,42 @@ class ItemRead(ItemBase):
     updated_at: Optional[datetime] = None
     recipe_detail: Optional[RecipeDetailRead] = None
     food_item_detail: Optional[FoodItemDetailRead] = None
-    # Usage count: non-hidden meal_entries that reference this item. Populated
-    # by crud_items._attach_usage_counts on every read path. Defaults to 0 so
-    # the delete confirm dialog copy always has a value even when the backend
-    # hasn't attached it yet (older sessions, unit tests with mock items).
+    # Usage count: non-hidden meal_entries that reference this item, read from
+    # the maintained `items.usage_count` column (Item.meal_entry_count). Defaults
+    # to 0 so the delete confirm dialog copy always has a value (unit tests with
+    # mock items).
     meal_entry_count: int = 0
+    # Latest date the item is planned on, None if it has never been used.
+    last_used_on: Optional[_Date] = None
+
+
+class RecipeDetailSummary(BaseModel):
+    """RecipeDetailRead minus `ingredients` and `instructions` — the bulk of
+    a recipe's payload, and not needed to render a library card."""
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: int
+    description: Optional[str] = None
+    prep_time_minutes: Optional[int] = None
+    cook_time_minutes: Optional[int] = None
+    servings: Optional[int] = None
+    image_url: Optional[str] = None
+    source_url: Optional[str] = None
+
+
+class ItemSummary(ItemBase):
+    """Library-list projection of ItemRead (GET /items paged without
+    `expand=details`)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    deleted_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    recipe_detail: Optional[RecipeDetailSummary] = None
+    food_item_detail: Optional[FoodItemDetailRead] = None
+    meal_entry_count: int = 0
+    last_used_on: Optional[_Date] = None
 
 
 # =============================================================================
@@ -508,6 +539,27 @@ class MealEntryCreate(MealEntryBase):
     participant_ids: Optional[TypingList[int]] = None  # Family member IDs; None = use slot defaults
 
 
+class MealEntryBulkCreate(BaseModel):
+    entries: TypingList[MealEntryCreate] = Field(..., min_length=1, max_length=200)
+
+
+class MealEntryCopyWeek(BaseModel):
+    """Copy the 7 days from `source_start` onto the 7 days from `target_start`."""
+    source_start: _Date
+    target_start: _Date
+
+
+class MealEntryMove(BaseModel):
+    id: int = Field(..., ge=1)
+    date: _Date
+    meal_slot_type_id: Optional[int] = Field(None, ge=1)  # None = keep
+    sort_order: Optional[int] = Field(None, ge=0)  # None = keep
+
+
+class MealEntryBulkMove(BaseModel):
+    moves: TypingList[MealEntryMove] = Field(..., min_length=1, max_length=200)
+
+
 class MealEntryUpdate(BaseModel):
     date: Optional[_Date] = None
     meal_slot_type_id: Optional[int] = Field(None, ge=1)
@@ -533,6 +585,28 @@ class MealEntry(MealEntryBase):
     updated_at: Optional[datetime] = None
 
 
+class ShoppingPreviewSource(BaseModel):
+    """One meal entry's contribution to a previewed shopping item."""
+    meal_entry_id: int
+    source_kind: str
+    item_id: Optional[int] = None
+    display_name: str
+    ingredient_name: str
+    base_quantity: float
+    unit: Optional[str] = None
+
+
+class ShoppingPreviewItem(BaseModel):
+    """A shopping item as a sync of the previewed meals would write it."""
+    title: str
+    display_name: str
+    aggregation_key_name: str
+    aggregation_unit_group: str
+    aggregation_unit: Optional[str] = None
+    aggregation_base_quantity: float
+    sources: TypingList[ShoppingPreviewSource]
+
+
 class MealEntryDeleteResponse(BaseModel):
     """Response shape for DELETE /meal-entries/{id}.
 
@@ -637,6 +711,8 @@ class CalendarEvent(CalendarEventBase):
     sync_status: Optional[str] = None
     calendar_integration_id: Optional[int] = None
     calendar_id: Optional[int] = None
+    series_id: Optional[int] = None
+    recurrence_id: Optional[str] = None
     calendar: Optional[CalendarResponse] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -769,3 +845,74 @@ class AppSettingsUpdate(BaseModel):
         if v is not None and v not in ("imperial", "metric"):
             raise ValueError("measurement_system must be 'imperial' or 'metric'")
         return v
+
+
+# =============================================================================
+# Mealboard Schemas (GET /mealboard/week)
+# =============================================================================
+
+
+class MealboardItem(BaseModel):
+    """What a meal card shows for an item — flattened, no instructions or
+    ingredients. Listed once per week however many entries use it."""
+    id: int
+    name: str
+    item_type: ItemType
+    icon_emoji: Optional[str] = None
+    icon_url: Optional[str] = None
+    is_favorite: bool = False
+    # recipe_detail
+    prep_time_minutes: Optional[int] = None
+    cook_time_minutes: Optional[int] = None
+    servings: Optional[int] = None
+    image_url: Optional[str] = None
+    # food_item_detail
+    category: Optional[str] = None
+
+
+class MealboardEntry(BaseModel):
+    """A meal entry with its item and participants referenced by id."""
+    id: int
+    date: _Date
+    meal_slot_type_id: int
+    item_id: Optional[int] = None
+    custom_meal_name: Optional[str] = None
+    servings: Optional[int] = None
+    was_cooked: bool = False
+    notes: Optional[str] = None
+    sort_order: int = 0
+    participant_ids: TypingList[int] = []
+    shopping_sync_status: Optional[ShoppingSyncStatus] = None
+
+
+class MealboardWeek(BaseModel):
+    start: _Date
+    end: _Date
+    settings: AppSettingsResponse
+    slot_types: TypingList[MealSlotType]
+    family_members: TypingList[FamilyMember]
+    items: TypingList[MealboardItem]
+    entries: TypingList[MealboardEntry]
+
+
+# =============================================================================
+# IngredientAlias Schemas
+# =============================================================================
+
+
+class IngredientAliasCreate(BaseModel):
+    """`alias` will be bucketed with `canonical_name` on the shopping list.
+
+    Both are canonicalized (lowercased, singularized) before storing.
+    """
+    alias: str = Field(..., min_length=1, max_length=200)
+    canonical_name: str = Field(..., min_length=1, max_length=200)
+
+
+class IngredientAlias(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    alias: str
+    canonical_name: str
+    created_at: Optional[datetime] = None
@@ -12,6 +12,8 @@ from zoneinfo import ZoneInfo
 import caldav
 import icalendar
 
+from . import ics_fastpath, recurrence
+
 logger = logging.getLogger(__name__)
 
 ICLOUD_CALDAV_URL = "https://caldav.icloud.com/"
@@ -39,6 +41,21 @@ def _extract_tzid(dt: datetime) -> str:
     return "UTC"
 
 
+def _parse_components(data, component_name: str) -> list:
+    """Return the `component_name` components of a raw CalDAV object.
+
+    Tries the line-oriented fast path in `ics_fastpath` first and falls back
+    to a full `icalendar` parse when it declines (unusual TZIDs, encodings,
+    malformed lines). Both return objects `ics_to_event_data` /
+    `vtodo_to_task_data` accept.
+    """
+    components = ics_fastpath.extract_components(data, component_name)
+    if components is not None:
+        return components
+    cal_data = icalendar.Calendar.from_ical(data)
+    return [c for c in cal_data.walk() if c.name == component_name]
+
+
 # ---------------------------------------------------------------------------
 # Connection
 # ---------------------------------------------------------------------------
@@ -106,8 +123,10 @@ def fetch_events(
 ) -> list[dict]:
     """Fetch events from a calendar within a date range.
 
-    Filters out recurring events (RRULE present) for v1.
-    Returns a list of dicts from ics_to_event_data().
+    Recurring events are NOT expanded server-side: each CalDAV object with an
+    RRULE comes back once as a series dict from ics_to_series_data() (it has
+    an "rrule" key) and the sync engine expands it locally. Everything else
+    is a dict from ics_to_event_data().
     """
     start_dt = datetime.combine(start_date, datetime.min.time()).replace(
         tzinfo=timezone.utc
@@ -121,33 +140,33 @@ def fetch_events(
             start=start_dt,
             end=end_dt,
             event=True,
-            expand=True,
         )
     except Exception:
         # Fallback to date_search for older CalDAV servers
         raw_events = calendar.date_search(
             start=start_dt,
             end=end_dt,
-            expand=True,
+            expand=False,
         )
 
     results = []
     for event_obj in raw_events:
         try:
-            cal_data = icalendar.Calendar.from_ical(event_obj.data)
-            for component in cal_data.walk():
-                if component.name != "VEVENT":
-                    continue
-
-                # Skip recurring events in v1
-                if component.get("RRULE"):
-                    uid = str(component.get("UID", "unknown"))
-                    logger.debug(
-                        "Skipping recurring event UID=%s (v1: single events only)",
-                        uid,
-                    )
-                    continue
+            components = _parse_components(event_obj.data, "VEVENT")
+            master = next(
+                (c for c in components
+                 if c.get("RRULE") and not c.get("RECURRENCE-ID")),
+                None,
+            )
+            if master is not None:
+                overrides = [c for c in components if c.get("RECURRENCE-ID")]
+                parsed = ics_to_series_data(master, overrides)
+                if parsed:
+                    parsed["etag"] = getattr(event_obj, "etag", None)
+                    results.append(parsed)
+                continue
 
+            for component in components:
                 parsed = ics_to_event_data(component)
                 if parsed:
                     # Attach the etag from the CalDAV object for change detection
@@ -346,6 +365,114 @@ def ics_to_event_data(vevent) -> dict | None:
     }
 
 
+def _rrule_value(vevent) -> str | None:
+    """RRULE as its raw ICS value (the fast path keeps it as a str already)."""
+    rrule = vevent.get("RRULE")
+    if rrule is None or isinstance(rrule, str):
+        return rrule
+    if isinstance(rrule, list):
+        return None  # multiple RRULEs — not supported
+    return rrule.to_ical().decode("utf-8")
+
+
+def _exdate_values(vevent) -> list:
+    """Flatten EXDATE into plain date/datetime values.
+
+    icalendar yields one vDDDLists per EXDATE line (a list of them when the
+    property repeats); the fast path already yields a flat list of values.
+    """
+    raw = vevent.get("EXDATE")
+    if raw is None:
+        return []
+    if not isinstance(raw, list):
+        raw = [raw]
+    values = []
+    for item in raw:
+        dts = getattr(item, "dts", None)
+        if dts is None:
+            values.append(item)
+        else:
+            values.extend(d.dt for d in dts)
+    return values
+
+
+def ics_to_series_data(master, overrides: list) -> dict | None:
+    """Convert a recurring master VEVENT (+ RECURRENCE-ID overrides) to a series dict.
+
+    Returns the ics_to_event_data() fields for the master plus:
+    - rrule: raw RRULE value
+    - dtstart: naive wall-clock start in the event's own timezone
+    - duration_minutes: DTEND - DTSTART, or None
+    - exdates: recurrence keys of excluded instances
+    - overrides: {recurrence key: event fields, or None if STATUS:CANCELLED}
+    Recurrence keys are produced by recurrence.occurrence_key().
+    """
+    base = ics_to_event_data(master)
+    if base is None:
+        return None
+    rrule = _rrule_value(master)
+    if not rrule:
+        logger.warning(
+            "VEVENT UID=%s has an unsupported RRULE, skipping", base["external_id"]
+        )
+        return None
+
+    tz_name = base["timezone"]
+    all_day = base["all_day"]
+    dtstart = master.get("DTSTART").dt
+    duration_minutes = None
+    if all_day:
+        dtstart = datetime.combine(dtstart, datetime.min.time())
+    else:
+        dtend_prop = master.get("DTEND")
+        if dtend_prop and isinstance(dtend_prop.dt, datetime):
+            dtend = dtend_prop.dt
+            if dtend.tzinfo is not None and dtstart.tzinfo is not None:
+                dtend = dtend.astimezone(dtstart.tzinfo)
+            delta = dtend.replace(tzinfo=None) - dtstart.replace(tzinfo=None)
+            duration_minutes = int(delta.total_seconds() // 60)
+        dtstart = dtstart.replace(tzinfo=None)
+
+    exdates = sorted({
+        recurrence.occurrence_key(v, tz_name, all_day) for v in _exdate_values(master)
+    })
+
+    last_modified = base["last_modified_remote"]
+    override_map = {}
+    for comp in overrides:
+        key = recurrence.occurrence_key(comp.get("RECURRENCE-ID").dt, tz_name, all_day)
+        if str(comp.get("STATUS", "")).upper() == "CANCELLED":
+            override_map[key] = None
+            continue
+        fields = ics_to_event_data(comp)
+        if fields is None:
+            continue
+        # Edits to a single instance only bump that instance's LAST-MODIFIED
+        if fields["last_modified_remote"] and (
+            last_modified is None or fields["last_modified_remote"] > last_modified
+        ):
+            last_modified = fields["last_modified_remote"]
+        override_map[key] = {
+            "title": fields["title"],
+            "description": fields["description"],
+            "date": fields["date"].isoformat(),
+            "start_time": fields["start_time"],
+            "end_time": fields["end_time"],
+            "all_day": fields["all_day"],
+            "timezone": fields["timezone"],
+        }
+
+    return {
+        **base,
+        "last_modified_remote": last_modified,
+        "rrule": rrule,
+        "dtstart": dtstart,
+        "duration_minutes": duration_minutes,
+        "exdates": exdates,
+        "overrides": override_map,
+    }
+
+
 def event_data_to_ics(event_data: dict, tz: ZoneInfo | None = None) -> icalendar.Calendar:
     """Convert CalendarEvent fields to an iCalendar object for pushing to iCloud.
 
@@ -496,9 +623,8 @@ def fetch_todos(calendar: caldav.Calendar) -> list[dict]:
         incomplete_uids = set()
         for t in incomplete:
             try:
-                cal_data = icalendar.Calendar.from_ical(t.data)
-                for comp in cal_data.walk():
-                    if comp.name == "VTODO" and comp.get("UID"):
+                for comp in _parse_components(t.data, "VTODO"):
+                    if comp.get("UID"):
                         incomplete_uids.add(str(comp.get("UID")))
             except Exception:
                 pass
@@ -509,10 +635,7 @@ def fetch_todos(calendar: caldav.Calendar) -> list[dict]:
 
     for todo_obj in incomplete + completed:
         try:
-            cal_data = icalendar.Calendar.from_ical(todo_obj.data)
-            for component in cal_data.walk():
-                if component.name != "VTODO":
-                    continue
+            for component in _parse_components(todo_obj.data, "VTODO"):
                 parsed = vtodo_to_task_data(component)
                 if parsed:
                     parsed["etag"] = getattr(todo_obj, "etag", None)
@@ -526,9 +649,8 @@ def fetch_todos(calendar: caldav.Calendar) -> list[dict]:
 def _get_todo_uid(todo_obj) -> str | None:
     """Extract UID from a CalDAV todo object."""
     try:
-        cal_data = icalendar.Calendar.from_ical(todo_obj.data)
-        for comp in cal_data.walk():
-            if comp.name == "VTODO" and comp.get("UID"):
+        for comp in _parse_components(todo_obj.data, "VTODO"):
+            if comp.get("UID"):
                 return str(comp.get("UID"))
     except Exception:
         pass
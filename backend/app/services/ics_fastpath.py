@@ -0,0 +1,229 @@
+"""Line-oriented fast path for pulling VEVENT/VTODO properties out of raw ICS.
+
+`ics_to_event_data` and `vtodo_to_task_data` read about a dozen properties,
+but `icalendar.Calendar.from_ical` builds a full component tree (every
+property typed, every VTIMEZONE/VALARM materialized) for each CalDAV object
+we fetch. On a 90-day iCloud window that parse dominates sync CPU.
+
+`extract_components()` unfolds the content lines, tracks BEGIN/END nesting,
+and keeps only the properties in `_WANTED` on top-level components of the
+requested type. The result is a list of `FastComponent` objects that quack
+like `icalendar` components for everything the mapping functions touch
+(`.name`, `.get(...)`, `.dt` on date properties), so the mapping code runs
+unchanged on either representation.
+
+Anything unusual returns None and the caller falls back to `icalendar`:
+  - malformed content lines or unbalanced BEGIN/END
+  - a wanted single-valued property repeated on one component
+  - ENCODING / non-DATE(-TIME) VALUE params, PERIOD or list values
+  - TZIDs that don't resolve as IANA names (custom VTIMEZONE definitions,
+    Windows zone names, etc.)
+"""
+
+import re
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+# Properties the mapping functions read. Everything else is skipped without
+# being parsed. RRULE / RECURRENCE-ID / EXDATE are kept raw for the recurring
+# event path.
+_TEXT_PROPS = frozenset({
+    "UID", "SUMMARY", "DESCRIPTION", "STATUS", "RELATED-TO", "RRULE",
+})
+_DATE_PROPS = frozenset({
+    "DTSTART", "DTEND", "DUE", "LAST-MODIFIED", "COMPLETED", "RECURRENCE-ID",
+})
+_INT_PROPS = frozenset({"PRIORITY"})
+_LIST_DATE_PROPS = frozenset({"EXDATE"})
+_WANTED = _TEXT_PROPS | _DATE_PROPS | _INT_PROPS | _LIST_DATE_PROPS
+
+_DATE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+_DATETIME_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})(Z?)$")
+
+# Same timezone object icalendar hands back for a trailing "Z".
+_UTC = ZoneInfo("UTC")
+
+
+class FastComponent:
+    """Minimal stand-in for `icalendar.cal.Component` (read-only)."""
+
+    __slots__ = ("name", "_props")
+
+    def __init__(self, name: str, props: dict):
+        self.name = name
+        self._props = props
+
+    def get(self, key: str, default=None):
+        return self._props.get(key.upper(), default)
+
+    def __contains__(self, key: str) -> bool:
+        return key.upper() in self._props
+
+    def __repr__(self) -> str:
+        return f"FastComponent({self.name!r}, {self._props!r})"
+
+
+class _DateProp:
+    """Mirrors `icalendar.prop.vDDDTypes` — the mapping code only reads `.dt`."""
+
+    __slots__ = ("dt",)
+
+    def __init__(self, dt):
+        self.dt = dt
+
+    def __repr__(self) -> str:
+        return f"_DateProp({self.dt!r})"
+
+
+class _Unsupported(Exception):
+    """Internal signal: bail out to the icalendar parser."""
+
+
+def _unfold(text: str) -> list[str]:
+    """RFC 5545 §3.1 unfolding: CRLF followed by one space/tab is a continuation."""
+    lines: list[str] = []
+    for raw in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if raw[:1] in (" ", "\t"):
+            if not lines:
+                raise _Unsupported("continuation before first line")
+            lines[-1] += raw[1:]
+        elif raw:
+            lines.append(raw)
+    return lines
+
+
+def _split_line(line: str) -> tuple[str, dict, str]:
+    """Split `NAME;P1=a;P2="b:c":value` into (NAME, {P1: a, P2: b:c}, value)."""
+    head, sep, value = line.partition(":")
+    if not sep:
+        raise _Unsupported("content line without ':'")
+    if '"' in head:
+        # A quoted parameter value may itself contain ':' — rescan slowly.
+        in_quotes = False
+        for i, ch in enumerate(line):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                head, value = line[:i], line[i + 1:]
+                break
+        else:
+            raise _Unsupported("content line without ':'")
+
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw_param in raw_params:
+        key, sep, val = raw_param.partition("=")
+        if not sep:
+            raise _Unsupported("malformed parameter")
+        params[key.upper()] = val.strip('"')
+    return name.upper(), params, value
+
+
+def _unescape_text(value: str) -> str:
+    # Same order as icalendar.parser.unescape_char so output is identical.
+    return (
+        value.replace("\\N", "\\n")
+        .replace("\\n", "\n")
+        .replace("\\,", ",")
+        .replace("\\;", ";")
+        .replace("\\\\", "\\")
+    )
+
+
+def _parse_date_value(value: str, params: dict):
+    value_type = params.get("VALUE", "").upper()
+    if value_type not in ("", "DATE", "DATE-TIME"):
+        raise _Unsupported(f"VALUE={value_type}")
+
+    m = _DATE_RE.match(value)
+    if m:
+        if value_type == "DATE-TIME":
+            raise _Unsupported("VALUE=DATE-TIME with a date value")
+        return date(int(m[1]), int(m[2]), int(m[3]))
+
+    m = _DATETIME_RE.match(value)
+    if not m or value_type == "DATE":
+        raise _Unsupported(f"unrecognised date value {value!r}")
+
+    if m[7]:
+        tz = _UTC
+    elif "TZID" in params:
+        try:
+            tz = ZoneInfo(params["TZID"])
+        except Exception as e:
+            raise _Unsupported(f"TZID {params['TZID']!r}") from e
+    else:
+        tz = None  # floating time
+    return datetime(
+        int(m[1]), int(m[2]), int(m[3]), int(m[4]), int(m[5]), int(m[6]), tzinfo=tz
+    )
+
+
+def _parse_property(name: str, params: dict, value: str):
+    if "ENCODING" in params:
+        raise _Unsupported("ENCODING param")
+    if name in _TEXT_PROPS:
+        return _unescape_text(value)
+    if name in _DATE_PROPS:
+        return _DateProp(_parse_date_value(value, params))
+    if name in _INT_PROPS:
+        try:
+            return int(value)
+        except ValueError as e:
+            raise _Unsupported(f"{name}={value!r}") from e
+    # _LIST_DATE_PROPS — comma-separated dates sharing one set of params
+    return [_parse_date_value(v, params) for v in value.split(",")]
+
+
+def extract_components(data: str | bytes, component_name: str) -> list[FastComponent] | None:
+    """Return the top-level `component_name` components in `data`, or None.
+
+    None means "not handled here" — the caller must parse with `icalendar`.
+    An empty list means the object parsed cleanly but has no such component.
+    """
+    if isinstance(data, bytes):
+        try:
+            data = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    component_name = component_name.upper()
+    try:
+        lines = _unfold(data)
+        if not lines or lines[0].upper() != "BEGIN:VCALENDAR":
+            return None
+
+        results: list[FastComponent] = []
+        stack: list[str] = []
+        current: dict | None = None
+        for line in lines:
+            name, params, value = _split_line(line)
+            if name == "BEGIN":
+                stack.append(value.upper())
+                # Only components directly under VCALENDAR are collected —
+                # properties of nested VALARMs must not leak into the parent.
+                if len(stack) == 2 and stack[-1] == component_name:
+                    current = {}
+                continue
+            if name == "END":
+                if not stack or stack.pop() != value.upper():
+                    raise _Unsupported("unbalanced BEGIN/END")
+                if current is not None and len(stack) == 1:
+                    results.append(FastComponent(component_name, current))
+                    current = None
+                continue
+            if current is None or len(stack) != 2 or name not in _WANTED:
+                continue
+            if name in _LIST_DATE_PROPS:
+                # EXDATE may legitimately appear on several lines; flatten.
+                current.setdefault(name, []).extend(_parse_property(name, params, value))
+                continue
+            if name in current:
+                raise _Unsupported(f"repeated {name}")
+            current[name] = _parse_property(name, params, value)
+
+        if stack:
+            raise _Unsupported("unterminated component")
+        return results
+    except _Unsupported:
+        return None
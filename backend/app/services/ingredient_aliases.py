@@ -0,0 +1,48 @@
+"""In-memory ingredient alias dictionary for shopping-list aggregation.
+
+`shopping_sync.canonicalize_name` singularizes a name and then looks it up
+here, so "scallions" and "green onions" land in the same bucket once the
+alias scallion → green onion exists. The `ingredient_aliases` table is the
+source of truth; every process (API, each Celery worker) keeps a copy that
+is loaded at startup and re-read at most every `REFRESH_SECONDS` by the
+sync entry points. A stale copy only means a new alias applies a little
+later — the re-bucket job run after each alias change fixes existing rows.
+"""
+
+import logging
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = 60
+
+_aliases: dict[str, str] = {}
+_loaded_at: float | None = None
+
+
+def resolve(name: str) -> str:
+    """Map a canonicalized name through the alias dictionary."""
+    return _aliases.get(name, name)
+
+
+async def load_aliases(db: AsyncSession) -> int:
+    """(Re)load the alias dictionary from the database. Returns its size."""
+    global _aliases, _loaded_at
+    result = await db.execute(
+        select(models.IngredientAlias.alias, models.IngredientAlias.canonical_name)
+    )
+    _aliases = dict(result.all())
+    _loaded_at = time.monotonic()
+    logger.debug("Loaded %d ingredient aliases", len(_aliases))
+    return len(_aliases)
+
+
+async def refresh_if_stale(db: AsyncSession):
+    """Reload the dictionary if this process hasn't in `REFRESH_SECONDS`."""
+    if _loaded_at is None or time.monotonic() - _loaded_at >= REFRESH_SECONDS:
+        await load_aliases(db)
@@ -0,0 +1,165 @@
+"""Rule-based parser for free-text ingredient lines.
+
+Recipe import hands the whole page to the LLM, which spends most of its
+2–10s decomposing lines like "1 ½ cups all-purpose flour, sifted" into
+name / quantity / unit. When recipe-scrapers has already pulled the
+ingredient lines out of the page's structured data, most of them are regular
+enough to split locally in microseconds.
+
+`parse_ingredient_line()` handles:
+  - integers, decimals, fractions and mixed numbers ("1 1/2", "1½", "½")
+  - ranges ("2-3", "2 to 3") — the upper bound, so the shopping list has enough
+  - parentheticals ("1 (14 oz) can tomatoes") — dropped from the name
+  - unit spellings via `normalize_unit` / `FREEFORM_UNIT_MAP`, incl. "fl oz"
+  - trailing prep notes after a comma ("garlic, minced" → "garlic")
+  - pantry phrasing ("salt, to taste") — quantity None, like the LLM output
+
+A quantity followed by a word that looks like a unit but isn't one of ours
+("1 env. yeast", "1 pinch salt", "1 pk yeast") would otherwise leave the unit
+in the name, so such lines are marked not confident.
+
+Every result carries a `confidence` in [0, 1]. Lines the rules can't place
+confidently (numbers buried mid-line, "or" alternatives, very long names)
+score below `CONFIDENT`, and the caller should fall back to the LLM.
+"""
+
+import re
+from dataclasses import dataclass
+
+from ..constants.units import FREEFORM_UNIT_MAP, normalize_unit
+
+# Minimum per-line confidence for skipping the LLM.
+CONFIDENT = 0.8
+
+_VULGAR_FRACTIONS = {
+    "½": "1/2", "⅓": "1/3", "⅔": "2/3", "¼": "1/4", "¾": "3/4",
+    "⅕": "1/5", "⅖": "2/5", "⅗": "3/5", "⅘": "4/5", "⅙": "1/6",
+    "⅚": "5/6", "⅛": "1/8", "⅜": "3/8", "⅝": "5/8", "⅞": "7/8",
+}
+_VULGAR_RE = re.compile(r"(\d?)\s*([" + "".join(_VULGAR_FRACTIONS) + r"])")
+
+_BULLET_RE = re.compile(r"^[\s\-–•*▢□◦·]+")
+_PAREN_RE = re.compile(r"\s*\([^)]*\)")
+# "1", "1.5", "1/2", "1 1/2"
+_NUMBER = r"\d+(?:\.\d+)?(?:\s+\d+/\d+)?(?:/\d+)?"
+_QUANTITY_RE = re.compile(
+    rf"^(?P<low>{_NUMBER})(?:\s*(?:-|–|—|to)\s*(?P<high>{_NUMBER}))?\s*"
+)
+# Measures with no entry in the unit system. After a quantity they mean the
+# line is a unit we can't represent, not an ingredient name.
+_UNKNOWN_MEASURES = {
+    "pinch", "pinches", "dash", "dashes", "splash", "splashes", "drop", "drops",
+    "handful", "handfuls", "sprinkle", "knob", "knobs", "stick", "sticks",
+    "jar", "jars", "bag", "bags", "box", "boxes", "bottle", "bottles",
+    "packet", "packets", "envelope", "envelopes", "carton", "cartons",
+    "container", "containers", "scoop", "scoops", "sheet", "sheets",
+}
+# "pk", "bx": a one- or two-letter word right after the quantity is an
+# abbreviated unit far more often than the start of an ingredient name.
+_SHORT_ABBREVIATION_RE = re.compile(r"[A-Za-z]{1,2}\.?")
+_PANTRY_SUFFIX_RE = re.compile(
+    r"[,\s]*\b(to taste|as needed|for serving|for garnish|optional)\b.*$", re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class ParsedIngredient:
+    raw: str
+    name: str
+    quantity: float | None
+    unit: str | None
+    confidence: float
+
+
+def _to_number(text: str) -> float:
+    """"1", "1.5", "1/2" or "1 1/2" → float."""
+    total = 0.0
+    for part in text.split():
+        if "/" in part:
+            num, den = part.split("/", 1)
+            total += int(num) / int(den)
+        else:
+            total += float(part)
+    return total
+
+
+def _expand_vulgar(match: re.Match) -> str:
+    whole, frac = match.group(1), _VULGAR_FRACTIONS[match.group(2)]
+    return f"{whole} {frac}" if whole else frac
+
+
+def _take_unit(rest: str) -> tuple[str | None, str]:
+    """Split a leading unit off `rest`. Tries two-word units ("fl oz") first."""
+    words = rest.split()
+    for width in (2, 1):
+        if len(words) < width:
+            continue
+        candidate = " ".join(words[:width]).rstrip(".")
+        # Exact map lookup first so "T" (tbsp) and "t" (tsp) stay distinct
+        unit = FREEFORM_UNIT_MAP.get(candidate) or normalize_unit(candidate)
+        if unit:
+            return unit, " ".join(words[width:])
+    return None, rest
+
+
+def parse_ingredient_line(line: str) -> ParsedIngredient:
+    """Parse one ingredient line. Never raises; unparseable lines get
+    confidence 0."""
+    text = _BULLET_RE.sub("", line or "").strip()
+    text = _VULGAR_RE.sub(_expand_vulgar, text)
+    text = re.sub(r"(?<=\d)⁄(?=\d)", "/", text)  # fraction slash
+    confidence = 1.0
+
+    # Parentheticals ("(14 oz)", "(optional)") never belong in the name
+    pantry = _PANTRY_SUFFIX_RE.search(text) is not None
+    text = _PANTRY_SUFFIX_RE.sub("", _PAREN_RE.sub("", text)).strip()
+
+    quantity = None
+    match = _QUANTITY_RE.match(text)
+    if match:
+        try:
+            low = _to_number(match.group("low"))
+            high = _to_number(match.group("high")) if match.group("high") else None
+        except (ValueError, ZeroDivisionError):
+            return ParsedIngredient(line, "", None, None, 0.0)
+        quantity = high if high is not None else low
+        if high is not None:
+            confidence *= 0.9
+        text = text[match.end():]
+
+    unit = None
+    if quantity is not None:
+        unit, text = _take_unit(text)
+        first_word = text.split(maxsplit=1)[0] if text.strip() else ""
+        # "env." / "pk" style abbreviation, or a measure we have no unit for
+        if unit is None and (
+            first_word.endswith(".")
+            or _SHORT_ABBREVIATION_RE.fullmatch(first_word)
+            or first_word.lower() in _UNKNOWN_MEASURES
+        ):
+            confidence *= 0.5
+    text = re.sub(r"^of\s+", "", text, flags=re.IGNORECASE)
+
+    # Prep notes follow the first comma: "garlic, minced"
+    name = re.sub(r"\s+", " ", text.split(",", 1)[0]).strip(" .;:-")
+
+    if not name:
+        return ParsedIngredient(line, "", quantity, unit, 0.0)
+    if quantity is None and not pantry:
+        # "Kosher salt" is a pantry staple; "Juice of 2 lemons" is not parsed
+        confidence *= 0.3 if re.search(r"\d", name) else 0.8
+    elif re.search(r"\d", name):
+        confidence *= 0.5
+    if re.search(r"\bor\b", name, re.IGNORECASE):
+        confidence *= 0.7
+    if len(name) > 60 or len(name.split()) > 8:
+        confidence *= 0.6
+    if quantity == 0:
+        quantity = None
+
+    return ParsedIngredient(line, name[:200], quantity, unit, round(confidence, 2))
+
+
+def parse_ingredient_lines(lines: list[str]) -> list[ParsedIngredient]:
+    """Parse every non-blank line."""
+    return [parse_ingredient_line(line) for line in lines if line and line.strip()]
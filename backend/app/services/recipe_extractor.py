@@ -8,6 +8,8 @@ Anthropic required):
         └─ _fetch_with_safe_redirects   → (html, final_url)
         └─ _clean_and_budget            → cleaned text ≤ 24 KB
         └─ _try_recipe_scrapers         → optional structured hint
+        └─ _try_local_parse             → finished recipe, skipping the LLM, when
+                                          every ingredient line parses confidently
         └─ _build_llm_prompt            → (system_prompt, user_prompt)
         └─ ai_client.extract_structured → validated RecipeDetailCreate
         └─ _validate_semantics          → final RecipeDetailCreate or raise
@@ -18,6 +20,7 @@ translate it to a stable ``error_code`` from ``app.constants.import_errors``.
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any, Callable
 from urllib.parse import urlparse
 
@@ -29,7 +32,7 @@ from typing import List as TypingList, Optional
 from app.constants import import_errors as codes
 from app.constants.units import VALID_UNITS
 from app.schemas import RecipeDetailCreate
-from app.services import ai_client
+from app.services import ai_client, ingredient_parser
 from app.utils.url_safety import SSRFBlocked, URLResolutionFailed, validate_url_for_fetch
 
 
@@ -363,6 +366,71 @@ def _try_recipe_scrapers(url: str, html: str) -> dict[str, Any] | None:
     }
 
 
+def _try_local_parse(
+    scraper_hint: dict[str, Any] | None,
+    source_url: str,
+) -> RecipeExtraction | None:
+    """Build the recipe from the recipe-scrapers hint alone, without the LLM.
+
+    Only when the hint has a title, real instructions and at least two
+    ingredient lines, and every line clears ``ingredient_parser.CONFIDENT``.
+    Otherwise returns ``None`` and the LLM path runs as before. Locally parsed
+    recipes get no tags and every ingredient is categorized as "Other" —
+    those two fields are the LLM's contribution.
+    """
+    if not scraper_hint:
+        return None
+    name = scraper_hint.get("title")
+    lines = scraper_hint.get("ingredients")
+    instructions = scraper_hint.get("instructions")
+    if not isinstance(name, str) or not name.strip():
+        return None
+    if not isinstance(instructions, str) or len(instructions.strip()) < 20:
+        return None
+    if not isinstance(lines, list):
+        return None
+
+    parsed = ingredient_parser.parse_ingredient_lines([l for l in lines if isinstance(l, str)])
+    if len(parsed) < 2 or min(p.confidence for p in parsed) < ingredient_parser.CONFIDENT:
+        return None
+
+    def _minutes(value: Any) -> int | None:
+        return value if isinstance(value, int) and value >= 0 else None
+
+    servings = None
+    match = re.search(r"\d+", str(scraper_hint.get("yields") or ""))
+    if match and int(match.group()) >= 1:
+        servings = int(match.group())
+    description = scraper_hint.get("description")
+    image = scraper_hint.get("image")
+
+    from app.schemas import Ingredient
+
+    try:
+        recipe_detail = RecipeDetailCreate(
+            description=description[:1000] if isinstance(description, str) else None,
+            ingredients=[
+                Ingredient(name=p.name, quantity=p.quantity, unit=p.unit) for p in parsed
+            ],
+            instructions=instructions.strip(),
+            prep_time_minutes=_minutes(scraper_hint.get("prep_time")),
+            cook_time_minutes=_minutes(scraper_hint.get("cook_time")),
+            servings=servings,
+            image_url=image if isinstance(image, str) and image.startswith(("http://", "https://")) else None,
+            source_url=source_url,
+        )
+    except ValueError as exc:  # pydantic.ValidationError
+        log.debug("recipe_extractor.local_parse_invalid", extra={"err": str(exc)[:200]})
+        return None
+
+    return RecipeExtraction(
+        name=name.strip()[:200],
+        tags=[],
+        recipe_detail=recipe_detail,
+        source_url=source_url,
+    )
+
+
 def _build_llm_prompt(
     cleaned: str,
     scraper_hint: dict[str, Any] | None,
@@ -530,6 +598,16 @@ def extract_recipe(
     # 3. recipe-scrapers hint
     scraper_hint = _try_recipe_scrapers(final_url, html)
 
+    # 3b. Local fast path — structured ingredient lines the parser is sure of
+    local = _try_local_parse(scraper_hint, final_url)
+    if local is not None:
+        log.info(
+            "recipe_extractor.local_parse",
+            extra={"url_host": url_host, "ingredients": len(local.recipe_detail.ingredients)},
+        )
+        _progress("parsing_ingredients")
+        return local
+
     # 4. LLM extraction
     # max_tokens budget: recipes with 20+ ingredients and detailed step-by-step
     # instructions (e.g. seriouseats) exceed the ai_client default of 2048 output
@@ -0,0 +1,176 @@
+"""Local expansion of recurring iCloud events.
+
+`fetch_events` hands the sync engine the *master* VEVENT of a recurring
+series (DTSTART + RRULE, EXDATEs, and any RECURRENCE-ID overrides) instead
+of asking the CalDAV server to expand every instance. The sync engine stores
+that as a `RecurringEventSeries` row and materializes the occurrences that
+fall inside the sync window as ordinary `CalendarEvent` rows, so the
+calendar UI reads them with no special casing.
+
+Occurrences are identified by their *recurrence key*: the original start of
+the instance as wall-clock time in the series' timezone
+(``"2026-03-02T09:00:00"``) or the bare date for all-day series
+(``"2026-03-02"``). EXDATE and RECURRENCE-ID values are normalized to the
+same key so they can be matched against the expansion with a dict lookup.
+
+All times here are wall-clock — RRULE arithmetic is defined in local time,
+so a 09:00 weekly event stays at 09:00 across DST transitions.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import rrulestr
+
+logger = logging.getLogger(__name__)
+
+# Guard against pathological rules (FREQ=MINUTELY, etc.) blowing up a sync.
+MAX_OCCURRENCES_PER_WINDOW = 1000
+
+
+def _zone(tz_name: str | None) -> ZoneInfo | None:
+    if not tz_name:
+        return None
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return None
+
+
+def occurrence_key(value: date | datetime, tz_name: str | None, all_day: bool) -> str:
+    """Normalize a DTSTART / EXDATE / RECURRENCE-ID value to a recurrence key."""
+    if isinstance(value, datetime):
+        if all_day:
+            return value.date().isoformat()
+        zone = _zone(tz_name)
+        if value.tzinfo is not None and zone is not None:
+            value = value.astimezone(zone)
+        return value.replace(tzinfo=None).isoformat(timespec="seconds")
+    if all_day:
+        return value.isoformat()
+    # A DATE-valued EXDATE on a timed series — match by midnight wall time.
+    return datetime.combine(value, time.min).isoformat(timespec="seconds")
+
+
+def _parse_rule(rrule: str, dtstart: datetime):
+    """Return (rule, dtstart actually used) — see the fallback below."""
+    try:
+        return rrulestr(rrule, dtstart=dtstart, ignoretz=dtstart.tzinfo is None), dtstart
+    except ValueError:
+        # Floating UNTIL on a zoned DTSTART (not RFC-conformant, but seen in
+        # the wild). Expand in naive wall time instead.
+        if dtstart.tzinfo is None:
+            raise
+        naive = dtstart.replace(tzinfo=None)
+        return rrulestr(rrule, dtstart=naive, ignoretz=True), naive
+
+
+def expand_starts(
+    rrule: str,
+    dtstart: datetime,
+    tz_name: str | None,
+    all_day: bool,
+    start_date: date,
+    end_date: date,
+) -> list[datetime]:
+    """Return naive wall-clock starts of every instance in [start_date, end_date].
+
+    `dtstart` is the master's naive wall-clock start (midnight for all-day
+    series). Instances are generated in the series' timezone when it is a
+    known IANA zone so RRULE UNTIL (always UTC) compares correctly.
+    """
+    zone = None if all_day else _zone(tz_name)
+    rule, anchor = _parse_rule(rrule, dtstart.replace(tzinfo=zone))
+
+    tzinfo = anchor.tzinfo
+    window_start = datetime.combine(start_date, time.min, tzinfo=tzinfo)
+    window_end = datetime.combine(end_date, time.max, tzinfo=tzinfo)
+
+    starts: list[datetime] = []
+    for occ in rule.xafter(window_start, inc=True):
+        if occ > window_end:
+            break
+        starts.append(occ.replace(tzinfo=None))
+        if len(starts) >= MAX_OCCURRENCES_PER_WINDOW:
+            logger.warning(
+                "RRULE %r produced over %d instances in %s..%s, truncating",
+                rrule, MAX_OCCURRENCES_PER_WINDOW, start_date, end_date,
+            )
+            break
+    return starts
+
+
+def _from_override(series, key: str, override: dict) -> dict:
+    return {
+        "recurrence_id": key,
+        "title": override["title"],
+        "description": override.get("description"),
+        "date": date.fromisoformat(override["date"]),
+        "start_time": override.get("start_time"),
+        "end_time": override.get("end_time"),
+        "all_day": override.get("all_day", series.all_day),
+        "timezone": override.get("timezone"),
+    }
+
+
+def build_occurrences(series, start_date: date, end_date: date) -> list[dict]:
+    """Materialize a series into CalendarEvent field dicts for a date window.
+
+    `series` is a `RecurringEventSeries` (or anything with the same
+    attributes). EXDATEs and cancelled overrides are dropped; overridden
+    instances take their fields from the override. Each dict carries
+    `recurrence_id` so rows can be matched back to the series.
+
+    Overrides are placed by their *original* start, so an instance moved
+    outside the window still appears if its original slot is inside it. An
+    instance moved *into* the window from a slot outside it appears too, so
+    the same key can come out of two different windows; callers expanding
+    incrementally must skip keys they already have.
+    """
+    exdates = set(series.exdates or [])
+    overrides = series.overrides or {}
+    duration = (
+        timedelta(minutes=series.duration_minutes)
+        if series.duration_minutes is not None and not series.all_day
+        else None
+    )
+
+    occurrences = []
+    expanded: set[str] = set()
+    for start in expand_starts(
+        series.rrule, series.dtstart, series.timezone, series.all_day,
+        start_date, end_date,
+    ):
+        key = occurrence_key(start, series.timezone, series.all_day)
+        expanded.add(key)
+        if key in exdates:
+            continue
+
+        if key in overrides:
+            override = overrides[key]
+            if override is None:
+                continue  # STATUS:CANCELLED instance
+            occurrences.append(_from_override(series, key, override))
+            continue
+
+        occurrences.append({
+            "recurrence_id": key,
+            "title": series.title,
+            "description": series.description,
+            "date": start.date(),
+            "start_time": None if series.all_day else start.strftime("%H:%M"),
+            "end_time": (start + duration).strftime("%H:%M") if duration else None,
+            "all_day": series.all_day,
+            "timezone": None if series.all_day else series.timezone,
+        })
+
+    # Instances whose original slot is outside the window but that were moved
+    # into it.
+    for key, override in overrides.items():
+        if override is None or key in expanded or key in exdates:
+            continue
+        if start_date <= date.fromisoformat(override["date"]) <= end_date:
+            occurrences.append(_from_override(series, key, override))
+    return occurrences
+
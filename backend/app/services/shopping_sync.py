@@ -9,29 +9,65 @@ Celery guard flow for ADD tasks:
 
 REMOVE tasks use provenance (meal_entry.synced_to_list_id), NOT the current linked list.
 
+Each meal's contribution to a row is a shopping_item_sources row; a row's
+aggregation_base_quantity is the SUM of its sources' base_quantity.
+
 Recipe ingredients with quantity=0 are treated as pantry staples
 (aggregation_unit=NULL, name-only match). NOT falling back to 1.0.
+
+Concurrency: every writer of a list's mealboard_auto rows (add, remove,
+swap, unlink, recompute, check-flip) first takes a transaction-scoped advisory lock on
+that list id, so writers on the same list run one after another instead of
+racing on bucket row locks. Lock order is advisory lock(s) in list-id
+order → meal entries in id order → task rows. Transactions commit as soon
+as the list is written.
 """
 import json
 import logging
 import re
-
-from sqlalchemy import select, update, delete
+import time
+from functools import lru_cache
+
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by, array_agg, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm.attributes import flag_modified
 
 from .. import models
+from . import ingredient_aliases
 from ..constants.irregulars import IRREGULAR_PLURALS
 from ..constants.units import (
+    COUNT_UNITS,
     UNIT_TO_GROUP,
+    VOLUME_UNITS,
+    WEIGHT_UNITS,
     to_base_unit,
-    from_base_unit,
-    format_ingredient_title,
+    from_base_units,
+    format_ingredient_titles,
 )
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock namespace: pg_advisory_xact_lock(hashtext(namespace), list_id)
+_LIST_LOCK_NAMESPACE = "shopping_list"
+
 
 # =============================================================================
 # Name canonicalization
@@ -40,9 +76,17 @@ logger = logging.getLogger(__name__)
 def canonicalize_name(name: str) -> str:
     """Normalize an ingredient name for aggregation matching.
 
-    Steps: lowercase, trim, collapse whitespace, singularize.
-    No fuzzy matching, no synonyms.
+    Steps: lowercase, trim, collapse whitespace, singularize, then map
+    through the ingredient alias dictionary ("scallion" → "green onion").
+    No fuzzy matching.
     """
+    return ingredient_aliases.resolve(singularize_name(name))
+
+
+@lru_cache(maxsize=4096)
+def singularize_name(name: str) -> str:
+    """The rule-based part of canonicalize_name. Pure, so memoized — the same
+    few hundred ingredient names recur on every sync."""
     if not name:
         return ""
     # Lowercase + trim + collapse whitespace
@@ -87,34 +131,76 @@ def canonicalize_name(name: str) -> str:
 # Internal helpers
 # =============================================================================
 
-async def _get_settings(db: AsyncSession) -> models.AppSettings:
-    """Get app settings (singleton)."""
-    from ..crud_app_settings import get_settings
-    return await get_settings(db)
+async def _measurement_system(db: AsyncSession) -> str:
+    """The configured measurement system, "imperial" if unset.
 
+    A plain read — unlike crud_app_settings.get_settings it never creates the
+    row, so it never commits. Commits end the transaction, and with it the
+    advisory lock `_lock_list` holds, so nothing called under that lock may
+    commit.
+    """
+    return (
+        await db.execute(select(models.AppSettings.measurement_system).limit(1))
+    ).scalar_one_or_none() or "imperial"
 
-async def _upsert_shopping_item(
-    db: AsyncSession,
-    list_id: int,
+
+async def _lock_list(db: AsyncSession, list_id: int):
+    """Take the transaction-scoped advisory lock for a list's auto rows.
+
+    Tries without blocking first so contention can be measured: every wait
+    is logged as a `shopping_sync.list_lock` metric with its duration.
+    """
+    key = (func.hashtext(_LIST_LOCK_NAMESPACE), list_id)
+    acquired = await db.execute(select(func.pg_try_advisory_xact_lock(*key)))
+    if acquired.scalar_one():
+        return
+
+    t0 = time.monotonic()
+    await db.execute(select(func.pg_advisory_xact_lock(*key)))
+    logger.info(
+        "shopping_sync.list_lock",
+        extra={
+            "list_id": list_id,
+            "contended": True,
+            "wait_ms": int((time.monotonic() - t0) * 1000),
+        },
+    )
+
+
+async def _lock_linked_list(db: AsyncSession) -> int | None:
+    """Lock the currently linked shopping list and return its id.
+
+    The link can change while we wait (change_mealboard_list holds the lock
+    for the whole swap), so re-read it once the lock is held and follow it.
+    """
+    stmt = select(models.AppSettings.mealboard_shopping_list_id).limit(1)
+    list_id = (await db.execute(stmt)).scalar_one_or_none()
+    while list_id is not None:
+        await _lock_list(db, list_id)
+        current = (await db.execute(stmt)).scalar_one_or_none()
+        if current == list_id:
+            break
+        list_id = current
+    return list_id
+
+
+def _bucket_ingredient(
     meal_entry_id: int,
     source_kind: str,
     source_id: int | None,
     display_name: str,
     quantity: float | None,
     unit: str | None,
-    measurement_system: str,
-):
-    """Insert or update a shopping list task for an ingredient.
+) -> dict | None:
+    """Canonicalize one ingredient and compute its aggregation bucket.
 
     Bucket: (list_id, 'mealboard_auto', canonical_name, aggregation_unit)
 
-    Flow:
-      input → canonicalize → bucket SELECT FOR UPDATE →
-        existing → add qty + update title + append source_meals
-        missing → INSERT, catch unique-violation → retry as UPDATE
+    Returns the bucket fields plus the `ShoppingItemSource` row it
+    contributes, or None for a nameless ingredient. Pure — no database access.
     """
     if not display_name:
-        return
+        return None
 
     canonical = canonicalize_name(display_name)
     unit_group = UNIT_TO_GROUP.get(unit, "none") if unit else "none"
@@ -144,111 +230,204 @@ async def _upsert_shopping_item(
         agg_base_unit = None
         unit_group = "none"
 
-    source_entry = {
-        "meal_entry_id": meal_entry_id,
-        "source_kind": source_kind,
-        "item_id": source_id,  # unified — was split into recipe_id/food_item_id pre-refactor
+    return {
         "display_name": display_name,
-        "ingredient_name": canonical,
-        "quantity": base_qty,
-        "unit": base_unit,
+        "aggregation_key_name": canonical,
+        "aggregation_unit_group": unit_group,
+        "aggregation_unit": agg_unit,
+        "aggregation_base_unit": agg_base_unit,
+        "aggregation_base_quantity": base_qty,
+        "source_entry": {
+            "meal_entry_id": meal_entry_id,
+            "source_kind": source_kind,
+            "item_id": source_id,
+            "display_name": display_name,
+            "ingredient_name": canonical,
+            "base_quantity": base_qty,
+            "unit": base_unit,
+        },
     }
 
-    # SELECT FOR UPDATE existing task with same aggregation bucket
-    if agg_unit is not None:
-        # Standard case: match on source + key + unit
-        stmt = (
-            select(models.Task)
-            .where(
-                models.Task.list_id == list_id,
-                models.Task.aggregation_source == "mealboard_auto",
-                models.Task.aggregation_key_name == canonical,
-                models.Task.aggregation_unit == agg_unit,
+
+def _meal_ingredients(meal_entry_id: int, item: models.Item | None) -> list[dict]:
+    """Bucket every shopping ingredient a meal entry contributes."""
+    if item and item.item_type == "recipe" and item.recipe_detail and item.recipe_detail.ingredients:
+        buckets = [
+            _bucket_ingredient(
+                meal_entry_id,
+                source_kind="recipe_ingredient",
+                source_id=item.id,
+                display_name=ingredient.get("name", ""),
+                quantity=ingredient.get("quantity"),
+                unit=ingredient.get("unit"),
             )
-            .with_for_update()
-        )
-    else:
-        # Pantry staple: aggregation_unit is NULL — explicit lookup
-        stmt = (
-            select(models.Task)
-            .where(
-                models.Task.list_id == list_id,
-                models.Task.aggregation_source == "mealboard_auto",
-                models.Task.aggregation_key_name == canonical,
-                models.Task.aggregation_unit.is_(None),
+            for ingredient in item.recipe_detail.ingredients
+        ]
+    elif item and item.item_type == "food_item" and item.food_item_detail:
+        fid = item.food_item_detail
+        buckets = [
+            _bucket_ingredient(
+                meal_entry_id,
+                source_kind="food_item",
+                source_id=item.id,
+                display_name=item.name,
+                quantity=float(fid.shopping_quantity) if fid.shopping_quantity is not None else None,
+                unit=fid.shopping_unit,
             )
-            .with_for_update()
-        )
+        ]
+    else:
+        buckets = []
+    return [b for b in buckets if b is not None]
 
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
 
-    if existing:
-        # Aggregate: add quantity, update title, append source
-        sources = existing.source_meals or []
-        sources.append(source_entry)
-        total_base_qty = sum(s.get("quantity", 0) for s in sources)
+def _merge_buckets(ingredients: list[dict]) -> dict[tuple[str, str | None], dict]:
+    """Merge bucketed ingredients that share (canonical name, aggregation unit).
 
-        # Format display title
-        title = _format_title(total_base_qty, agg_base_unit, unit_group, display_name, measurement_system)
+    Each merged bucket carries the summed base quantity and a `sources` list
+    of the `source_entry` dicts it absorbed.
+    """
+    merged: dict[tuple[str, str | None], dict] = {}
+    for ingredient in ingredients:
+        key = (ingredient["aggregation_key_name"], ingredient["aggregation_unit"])
+        bucket = merged.get(key)
+        if bucket is None:
+            merged[key] = {**ingredient, "sources": [ingredient["source_entry"]]}
+        else:
+            bucket["aggregation_base_quantity"] += ingredient["aggregation_base_quantity"]
+            bucket["sources"].append(ingredient["source_entry"])
+            # Latest display name wins, as with sequential per-ingredient adds
+            bucket["display_name"] = ingredient["display_name"]
+    return merged
 
-        existing.title = title
-        existing.source_meals = sources
-        existing.aggregation_base_quantity = total_base_qty
-        flag_modified(existing, "source_meals")
-        await db.flush()
-        logger.debug("Aggregated '%s' → '%s' (sources: %d)", canonical, title, len(sources))
-    else:
-        # Insert new task
-        title = _format_title(base_qty, agg_base_unit, unit_group, display_name, measurement_system)
-
-        fm_result = await db.execute(select(models.FamilyMember.id).limit(1))
-        default_fm_id = fm_result.scalar_one_or_none() or 1
-
-        new_task = models.Task(
-            title=title,
-            list_id=list_id,
-            assigned_to=default_fm_id,
-            completed=False,
-            source_meals=[source_entry],
-            aggregation_key_name=canonical,
-            aggregation_unit_group=unit_group,
-            aggregation_source="mealboard_auto",
-            aggregation_unit=agg_unit,
-            aggregation_base_unit=agg_base_unit,
-            aggregation_base_quantity=base_qty,
-        )
-        # Use a SAVEPOINT so a unique-constraint collision rolls back ONLY this
-        # insert, not every prior ingredient already added to the outer
-        # transaction by the caller's per-ingredient loop.
-        try:
-            async with db.begin_nested():
-                db.add(new_task)
-                await db.flush()
-            logger.debug("Created shopping item '%s'", title)
-        except IntegrityError:
-            logger.debug("Unique constraint hit for '%s' — retrying as update", canonical)
-            await _upsert_shopping_item(
-                db, list_id, meal_entry_id, source_kind, source_id,
-                display_name, quantity, unit, measurement_system,
-            )
 
+async def _upsert_shopping_items(
+    db: AsyncSession,
+    list_id: int,
+    ingredients: list[dict],
+    measurement_system: str,
+):
+    """Add bucketed ingredients to a shopping list in one statement.
+
+    Flow:
+      merge same-bucket ingredients in Python →
+        INSERT ... ON CONFLICT (bucket) DO UPDATE (add qty) RETURNING the rows →
+        INSERT the shopping_item_sources rows → fix up titles of rows that
+        already existed
+
+    Merging first is required: one INSERT may not touch the same conflict
+    row twice. The conflict target is inferred from the partial unique index
+    `uq_task_ingredient_aggregate` (an index, not a constraint, so it can't
+    be named with ON CONSTRAINT); NULLS NOT DISTINCT makes pantry staples
+    with a NULL aggregation_unit conflict like any other bucket.
+    """
+    merged = _merge_buckets(ingredients)
+    if not merged:
+        return
 
-def _format_title(
-    total_base_qty: float,
-    base_unit: str | None,
-    unit_group: str,
-    display_name: str,
+    fm_result = await db.execute(select(models.FamilyMember.id).limit(1))
+    default_fm_id = fm_result.scalar_one_or_none() or 1
+
+    titles = _format_titles(
+        [
+            (b["aggregation_base_quantity"], b["aggregation_base_unit"],
+             b["aggregation_unit_group"], b["display_name"])
+            for b in merged.values()
+        ],
+        measurement_system,
+    )
+    rows = [
+        {
+            "title": title,
+            "list_id": list_id,
+            "assigned_to": default_fm_id,
+            "completed": False,
+            "aggregation_key_name": b["aggregation_key_name"],
+            "aggregation_unit_group": b["aggregation_unit_group"],
+            "aggregation_source": "mealboard_auto",
+            "aggregation_unit": b["aggregation_unit"],
+            "aggregation_base_unit": b["aggregation_base_unit"],
+            "aggregation_base_quantity": b["aggregation_base_quantity"],
+        }
+        for b, title in zip(merged.values(), titles)
+    ]
+
+    insert_stmt = pg_insert(models.Task).values(rows)
+    excluded = insert_stmt.excluded
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[
+            models.Task.list_id,
+            models.Task.aggregation_source,
+            models.Task.aggregation_key_name,
+            models.Task.aggregation_unit,
+        ],
+        index_where=models.Task.aggregation_source.isnot(None),
+        set_={
+            "aggregation_base_quantity": (
+                func.coalesce(models.Task.aggregation_base_quantity, 0)
+                + excluded.aggregation_base_quantity
+            ),
+        },
+    ).returning(models.Task)
+
+    # populate_existing refreshes any of these rows already in the session
+    result = await db.execute(
+        select(models.Task)
+        .from_statement(upsert_stmt)
+        .execution_options(populate_existing=True)
+    )
+    tasks = result.scalars().all()
+
+    sources = []
+    for task in tasks:
+        bucket = merged[(task.aggregation_key_name, task.aggregation_unit)]
+        sources.extend({**source, "task_id": task.id} for source in bucket["sources"])
+    await db.execute(insert(models.ShoppingItemSource).values(sources))
+
+    # Rows that already existed kept their old title; recompute from the new
+    # total. Freshly inserted rows already match and are left alone.
+    titles = _format_titles(
+        [
+            (task.aggregation_base_quantity, task.aggregation_base_unit,
+             task.aggregation_unit_group,
+             merged[(task.aggregation_key_name, task.aggregation_unit)]["display_name"])
+            for task in tasks
+        ],
+        measurement_system,
+    )
+    for task, title in zip(tasks, titles):
+        if task.title != title:
+            task.title = title
+            logger.debug("Aggregated '%s' → '%s'", task.aggregation_key_name, title)
+    await db.flush()
+
+
+def _format_titles(
+    rows: list[tuple[float, str | None, str, str]],
     measurement_system: str,
-) -> str:
-    """Format a shopping item title from aggregation data."""
-    if unit_group in ("weight", "volume") and base_unit:
-        display_qty, display_unit = from_base_unit(total_base_qty, base_unit, measurement_system)
-        return format_ingredient_title(display_qty, display_unit, display_name)
-    elif unit_group == "count" and base_unit:
-        return format_ingredient_title(round(total_base_qty), base_unit, display_name)
-    else:
-        return display_name
+) -> list[str]:
+    """Format many titles at once from (total_base_qty, base_unit, unit_group,
+    display_name) tuples.
+
+    Weight/volume rows are converted to display units in one
+    `from_base_units` call, so re-titling a whole list is a single batch
+    conversion rather than one per row.
+    """
+    quantities: list[float | None] = [None] * len(rows)
+    units: list[str | None] = [None] * len(rows)
+    convert = [
+        i for i, (_, base_unit, unit_group, _) in enumerate(rows)
+        if unit_group in ("weight", "volume") and base_unit
+    ]
+    if convert:
+        display_qtys, display_units = from_base_units(
+            [rows[i][0] for i in convert], [rows[i][1] for i in convert], measurement_system,
+        )
+        for i, qty, unit in zip(convert, display_qtys, display_units):
+            quantities[i], units[i] = qty, unit
+    for i, (total_base_qty, base_unit, unit_group, _) in enumerate(rows):
+        if unit_group == "count" and base_unit:
+            quantities[i], units[i] = round(total_base_qty), base_unit
+    return format_ingredient_titles(quantities, units, [row[3] for row in rows])
 
 
 # =============================================================================
@@ -264,36 +443,68 @@ async def sync_meal_to_shopping_list(
     Called by Celery task after meal entry creation.
     Guards: status must be "pending", linked list must exist.
     """
-    # Lock the meal entry
+    await sync_meals_to_shopping_list(db, [meal_entry_id])
+
+
+async def sync_meals_to_shopping_list(
+    db: AsyncSession,
+    meal_entry_ids: list[int],
+) -> int:
+    """Sync several meal entries to the linked shopping list in one transaction.
+
+    Same guards as `sync_meal_to_shopping_list`, applied per entry. Every
+    ingredient of every entry is aggregated in memory first, so each bucket
+    is written exactly once no matter how many of the entries share it —
+    planning a week costs one upsert instead of one per meal.
+
+    Returns the number of entries synced.
+    """
+    if not meal_entry_ids:
+        return 0
+
+    measurement_system = await _measurement_system(db)
+    await ingredient_aliases.refresh_if_stale(db)
+    shopping_list_id = await _lock_linked_list(db)
+
+    # Lock the entries (id order, so concurrent batches can't deadlock) and
+    # load the unified item + both detail relationships with them.
+    from sqlalchemy.orm import selectinload
     stmt = (
         select(models.MealEntry)
-        .where(models.MealEntry.id == meal_entry_id)
-        .with_for_update()
+        .options(
+            selectinload(models.MealEntry.item).selectinload(models.Item.recipe_detail),
+            selectinload(models.MealEntry.item).selectinload(models.Item.food_item_detail),
+        )
+        .where(models.MealEntry.id.in_(meal_entry_ids))
+        .order_by(models.MealEntry.id)
+        .with_for_update(of=models.MealEntry)
     )
     result = await db.execute(stmt)
-    entry = result.scalar_one_or_none()
-
-    if not entry:
-        logger.warning("Meal entry %d not found — skipping sync", meal_entry_id)
-        return
-
-    # Guard: status must be "pending"
-    if entry.shopping_sync_status != "pending":
-        logger.info(
-            "Meal entry %d status is '%s', not 'pending' — no-op",
-            meal_entry_id, entry.shopping_sync_status,
-        )
-        return
-
-    settings = await _get_settings(db)
-    shopping_list_id = settings.mealboard_shopping_list_id
+    locked = result.scalars().all()
+
+    missing = set(meal_entry_ids) - {entry.id for entry in locked}
+    if missing:
+        logger.warning("Meal entries %s not found — skipping sync", sorted(missing))
+
+    entries = []
+    for entry in locked:
+        # Guard: status must be "pending"
+        if entry.shopping_sync_status != "pending":
+            logger.info(
+                "Meal entry %d status is '%s', not 'pending' — no-op",
+                entry.id, entry.shopping_sync_status,
+            )
+            continue
+        entries.append(entry)
+    if not entries:
+        await db.commit()
+        return 0
 
     if not shopping_list_id:
-        logger.warning("No shopping list linked — marking meal entry %d as skipped", meal_entry_id)
-        entry.shopping_sync_status = "skipped"
-        entry.synced_to_list_id = None
+        logger.warning("No shopping list linked — marking %d meal entries as skipped", len(entries))
+        _mark_entries(entries, "skipped", None)
         await db.commit()
-        return
+        return 0
 
     # Verify the linked list still exists
     list_exists = await db.execute(
@@ -301,62 +512,104 @@ async def sync_meal_to_shopping_list(
     )
     if not list_exists.scalar_one_or_none():
         logger.warning("Linked shopping list %d not found — marking skipped", shopping_list_id)
-        entry.shopping_sync_status = "skipped"
-        entry.synced_to_list_id = None
+        _mark_entries(entries, "skipped", None)
         await db.commit()
-        return
+        return 0
 
-    # Load the unified item + both detail relationships (selectinload avoids N+1).
-    from sqlalchemy.orm import selectinload
-    entry_stmt = (
-        select(models.MealEntry)
-        .options(
-            selectinload(models.MealEntry.item).selectinload(models.Item.recipe_detail),
-            selectinload(models.MealEntry.item).selectinload(models.Item.food_item_detail),
-        )
-        .where(models.MealEntry.id == meal_entry_id)
+    ingredients = []
+    for entry in entries:
+        ingredients.extend(_meal_ingredients(entry.id, entry.item))
+    await _upsert_shopping_items(
+        db,
+        list_id=shopping_list_id,
+        ingredients=ingredients,
+        measurement_system=measurement_system,
     )
-    entry_result = await db.execute(entry_stmt)
-    entry = entry_result.scalar_one_or_none()
-
-    measurement_system = settings.measurement_system or "imperial"
-
-    item = entry.item if entry else None
-    if item and item.item_type == "recipe" and item.recipe_detail and item.recipe_detail.ingredients:
-        for ingredient in item.recipe_detail.ingredients:
-            await _upsert_shopping_item(
-                db,
-                list_id=shopping_list_id,
-                meal_entry_id=meal_entry_id,
-                source_kind="recipe_ingredient",
-                source_id=item.id,
-                display_name=ingredient.get("name", ""),
-                quantity=ingredient.get("quantity"),
-                unit=ingredient.get("unit"),
-                measurement_system=measurement_system,
-            )
-    elif item and item.item_type == "food_item" and item.food_item_detail:
-        fid = item.food_item_detail
-        await _upsert_shopping_item(
-            db,
-            list_id=shopping_list_id,
-            meal_entry_id=meal_entry_id,
-            source_kind="food_item",
-            source_id=item.id,
-            display_name=item.name,
-            quantity=float(fid.shopping_quantity) if fid.shopping_quantity is not None else None,
-            unit=fid.shopping_unit,
-            measurement_system=measurement_system,
-        )
 
     # Mark sync complete
-    entry.shopping_sync_status = "synced"
-    entry.synced_to_list_id = shopping_list_id
+    _mark_entries(entries, "synced", shopping_list_id)
     await db.commit()
     logger.info(
-        "Shopping sync complete for meal entry %d → list %d",
-        meal_entry_id, shopping_list_id,
+        "Shopping sync complete for meal entries %s → list %d",
+        [entry.id for entry in entries], shopping_list_id,
+    )
+    return len(entries)
+
+
+def _mark_entries(entries: list[models.MealEntry], status: str, list_id: int | None):
+    for entry in entries:
+        entry.shopping_sync_status = status
+        entry.synced_to_list_id = list_id
+
+
+async def pending_meal_entry_ids(db: AsyncSession) -> list[int]:
+    """Ids of visible meal entries still waiting for their shopping sync."""
+    result = await db.execute(
+        select(models.MealEntry.id)
+        .where(
+            models.MealEntry.shopping_sync_status == "pending",
+            models.MealEntry.soft_hidden_at.is_(None),
+        )
+        .order_by(models.MealEntry.id)
     )
+    return list(result.scalars().all())
+
+
+async def preview_shopping_list(db: AsyncSession, start_date, end_date) -> list[dict]:
+    """What the shopping list would hold for the meals planned in a date range.
+
+    Read-only: one SELECT loads every visible meal entry in the range with its
+    item and details, and the ingredients are bucketed and merged in memory
+    exactly as a sync would (same canonicalization, base units and titles).
+    No locks are taken and nothing is written.
+
+    Returns one dict per bucket, ordered by canonical name, each with a
+    `sources` list of the meal entries that contribute to it.
+    """
+    from sqlalchemy.orm import joinedload
+    measurement_system = await _measurement_system(db)
+    await ingredient_aliases.refresh_if_stale(db)
+
+    result = await db.execute(
+        select(models.MealEntry)
+        .options(
+            joinedload(models.MealEntry.item).joinedload(models.Item.recipe_detail),
+            joinedload(models.MealEntry.item).joinedload(models.Item.food_item_detail),
+        )
+        .where(
+            models.MealEntry.soft_hidden_at.is_(None),
+            models.MealEntry.date >= start_date,
+            models.MealEntry.date <= end_date,
+        )
+        .order_by(models.MealEntry.date, models.MealEntry.id)
+    )
+    ingredients = []
+    for entry in result.scalars().unique():
+        ingredients.extend(_meal_ingredients(entry.id, entry.item))
+
+    buckets = [b for _, b in sorted(
+        _merge_buckets(ingredients).items(), key=lambda kv: (kv[0][0], kv[0][1] or ""),
+    )]
+    titles = _format_titles(
+        [
+            (b["aggregation_base_quantity"], b["aggregation_base_unit"],
+             b["aggregation_unit_group"], b["display_name"])
+            for b in buckets
+        ],
+        measurement_system,
+    )
+    return [
+        {
+            "title": title,
+            "display_name": b["display_name"],
+            "aggregation_key_name": b["aggregation_key_name"],
+            "aggregation_unit_group": b["aggregation_unit_group"],
+            "aggregation_unit": b["aggregation_unit"],
+            "aggregation_base_quantity": b["aggregation_base_quantity"],
+            "sources": b["sources"],
+        }
+        for b, title in zip(buckets, titles)
+    ]
 
 
 async def remove_meal_from_shopping_list(
@@ -372,63 +625,77 @@ async def remove_meal_from_shopping_list(
     Rules:
     - Checked (completed) tasks: leave alone (they flipped to manual via on_item_checked)
     - Unchecked mealboard_auto tasks: subtract this meal's contribution
-    - If quantity reaches 0: delete the task
+    - If no sources remain: delete the task
     """
     if target_list_id is None:
         logger.info("Meal entry %d has no synced_to_list_id — no-op", meal_entry_id)
         return
 
-    settings = await _get_settings(db)
-    measurement_system = settings.measurement_system or "imperial"
+    await _lock_list(db, target_list_id)
+    measurement_system = await _measurement_system(db)
 
-    # Find all mealboard_auto tasks on the target list
+    # Lock only the unchecked auto rows this meal contributed to — an indexed
+    # lookup on shopping_item_sources.meal_entry_id, not a scan of the list.
+    source = models.ShoppingItemSource
     stmt = (
         select(models.Task)
         .where(
+            models.Task.id.in_(
+                select(source.task_id).where(source.meal_entry_id == meal_entry_id)
+            ),
             models.Task.list_id == target_list_id,
             models.Task.aggregation_source == "mealboard_auto",
-            models.Task.source_meals.isnot(None),
             models.Task.completed == False,
         )
+        .order_by(models.Task.id)
         .with_for_update()
     )
     result = await db.execute(stmt)
-    tasks = result.scalars().all()
-
-    for task in tasks:
-        sources = task.source_meals or []
-        matching = [s for s in sources if s.get("meal_entry_id") == meal_entry_id]
-        if not matching:
-            continue
+    tasks = {task.id: task for task in result.scalars().all()}
 
-        remaining = [s for s in sources if s.get("meal_entry_id") != meal_entry_id]
-
-        if not remaining:
-            await db.delete(task)
-            logger.debug("Deleted shopping item '%s' (no remaining sources)", task.title)
-        else:
-            total_base_qty = sum(s.get("quantity", 0) for s in remaining)
-            # Preserve the user-facing display name from the remaining source(s)
-            # rather than regenerating from the canonicalized aggregation key,
-            # which would lowercase + singularize the title on every partial
-            # remove ("Tomatoes" → "tomato").
-            preserved_display_name = (
-                remaining[0].get("display_name")
-                or task.aggregation_key_name
-                or task.title
+    if tasks:
+        await db.execute(
+            delete(source).where(
+                source.meal_entry_id == meal_entry_id,
+                source.task_id.in_(tasks.keys()),
             )
-            title = _format_title(
-                total_base_qty,
-                task.aggregation_base_unit,
-                task.aggregation_unit_group,
-                preserved_display_name,
-                measurement_system,
+        )
+        # Preserve the user-facing display name from the earliest remaining
+        # source rather than regenerating from the canonicalized aggregation
+        # key, which would lowercase + singularize the title on every partial
+        # remove ("Tomatoes" → "tomato").
+        remaining_result = await db.execute(
+            select(
+                source.task_id,
+                func.sum(source.base_quantity),
+                array_agg(aggregate_order_by(source.display_name, source.id))[1],
             )
+            .where(source.task_id.in_(tasks.keys()))
+            .group_by(source.task_id)
+        )
+        remaining = {
+            task_id: (total_base_qty, display_name)
+            for task_id, total_base_qty, display_name in remaining_result.all()
+        }
+
+        for task_id, task in tasks.items():
+            if task_id not in remaining:
+                await db.delete(task)
+                logger.debug("Deleted shopping item '%s' (no remaining sources)", task.title)
+
+        kept = [task for task_id, task in tasks.items() if task_id in remaining]
+        titles = _format_titles(
+            [
+                (remaining[task.id][0], task.aggregation_base_unit, task.aggregation_unit_group,
+                 remaining[task.id][1] or task.aggregation_key_name or task.title)
+                for task in kept
+            ],
+            measurement_system,
+        )
+        for task, title in zip(kept, titles):
             task.title = title
-            task.source_meals = remaining
-            task.aggregation_base_quantity = total_base_qty
-            flag_modified(task, "source_meals")
-            logger.debug("Updated shopping item → '%s' (sources: %d)", title, len(remaining))
+            task.aggregation_base_quantity = remaining[task.id][0]
+            logger.debug("Updated shopping item → '%s'", title)
 
     # Clear synced_to_list_id on the meal entry
     await db.execute(
@@ -454,6 +721,10 @@ async def on_item_checked(db: AsyncSession, task: models.Task):
     if task.aggregation_source != "mealboard_auto":
         return
 
+    # Flipping the source is a write to the list's auto rows: list lock
+    # first, per the module's lock order.
+    await _lock_list(db, task.list_id)
+
     # Lock the row
     stmt = (
         select(models.Task)
@@ -482,6 +753,8 @@ async def swap_mealboard_list(db: AsyncSession, old_list_id: int, new_list_id: i
     3. Recompute fresh rows on new list from meal entries
     """
     logger.info("swap_mealboard_list: %d → %d", old_list_id, new_list_id)
+    for list_id in sorted((old_list_id, new_list_id)):
+        await _lock_list(db, list_id)
 
     # 1. Rebucket meal entries
     await db.execute(
@@ -519,6 +792,7 @@ async def unlink_mealboard_list(db: AsyncSession, list_id: int):
     2. Mark all meal entries with synced_to_list_id=list_id as skipped
     """
     logger.info("unlink_mealboard_list: %d", list_id)
+    await _lock_list(db, list_id)
 
     del_result = await db.execute(
         delete(models.Task)
@@ -592,51 +866,342 @@ async def change_mealboard_list(db: AsyncSession, new_list_id: int | None):
     )
 
 
-async def _recompute_shopping_list(db: AsyncSession, list_id: int):
-    """Recompute all mealboard_auto shopping rows on a list from synced meal entries."""
-    settings = await _get_settings(db)
-    measurement_system = settings.measurement_system or "imperial"
+def _units_relation():
+    """The unit tables from constants.units as an inline SQL relation.
 
-    from sqlalchemy.orm import selectinload
-    stmt = (
-        select(models.MealEntry)
-        .options(
-            selectinload(models.MealEntry.item).selectinload(models.Item.recipe_detail),
-            selectinload(models.MealEntry.item).selectinload(models.Item.food_item_detail),
+    (unit, unit_group, base_unit, to_base) — the same data `to_base_unit`
+    reads, so SQL-side and Python-side bucketing can't drift apart.
+    """
+    rows = [
+        (unit, group, spec.get("base", unit), spec.get("to_base", 1.0))
+        for group, table in (
+            ("weight", WEIGHT_UNITS), ("volume", VOLUME_UNITS), ("count", COUNT_UNITS),
         )
-        .where(
-            models.MealEntry.synced_to_list_id == list_id,
-            models.MealEntry.shopping_sync_status == "synced",
+        for unit, spec in table.items()
+    ]
+    return values(
+        column("unit", String),
+        column("unit_group", String),
+        column("base_unit", String),
+        column("to_base", Float),
+        name="units",
+    ).data(rows)
+
+
+def _synced_sources_query(list_id: int):
+    """One row per ingredient of every meal entry synced to `list_id`.
+
+    Mirrors `_bucket_ingredient` in SQL: recipe ingredients come from
+    jsonb_array_elements(recipe_details.ingredients), food items from their
+    shopping quantity/unit, and the bucket unit + base quantity from a join
+    against the units relation.
+    """
+    entry, item = models.MealEntry, models.Item
+    synced = and_(
+        entry.synced_to_list_id == list_id,
+        entry.shopping_sync_status == "synced",
+    )
+
+    ingredient = (
+        func.jsonb_array_elements(models.RecipeDetail.ingredients)
+        .table_valued(column("value", JSONB), with_ordinality="position")
+        .render_derived(name="ingredient")
+        .lateral()
+    )
+    recipe_sources = (
+        select(
+            entry.id.label("meal_entry_id"),
+            literal("recipe_ingredient").label("source_kind"),
+            item.id.label("item_id"),
+            ingredient.c.value["name"].astext.label("display_name"),
+            ingredient.c.value["quantity"].astext.cast(Float).label("quantity"),
+            ingredient.c.value["unit"].astext.label("unit"),
+            ingredient.c.position,
         )
+        .join(item, item.id == entry.item_id)
+        .join(models.RecipeDetail, models.RecipeDetail.item_id == item.id)
+        .join(ingredient, true())
+        .where(synced, item.item_type == "recipe")
+    )
+    food_sources = (
+        select(
+            entry.id,
+            literal("food_item"),
+            item.id,
+            item.name,
+            cast(models.FoodItemDetail.shopping_quantity, Float),
+            models.FoodItemDetail.shopping_unit,
+            literal(1, type_=BigInteger),
+        )
+        .join(item, item.id == entry.item_id)
+        .join(models.FoodItemDetail, models.FoodItemDetail.item_id == item.id)
+        .where(synced, item.item_type == "food_item")
+    )
+    src = union_all(recipe_sources, food_sources).subquery("src")
+
+    units = _units_relation()
+    has_qty = src.c.quantity > 0
+    convertible = and_(has_qty, units.c.unit_group.in_(("weight", "volume")))
+    counted = and_(has_qty, units.c.unit_group == "count")
+    bare = and_(has_qty, src.c.unit.is_(None))
+    return (
+        select(
+            src.c.meal_entry_id,
+            src.c.source_kind,
+            src.c.item_id,
+            src.c.display_name,
+            src.c.position,
+            case(
+                (convertible, src.c.quantity * units.c.to_base),
+                (or_(counted, bare), src.c.quantity),
+                else_=literal(0.0),
+            ).label("base_quantity"),
+            case(
+                (convertible, units.c.base_unit),
+                (counted, src.c.unit),
+                (bare, literal("each")),
+            ).label("aggregation_unit"),
+            case(
+                (convertible, units.c.unit_group),
+                (or_(counted, bare), literal("count")),
+                else_=literal("none"),
+            ).label("aggregation_unit_group"),
+        )
+        .select_from(src.outerjoin(units, units.c.unit == src.c.unit))
+        .where(func.coalesce(src.c.display_name, "") != "")
+        .subquery("sources")
     )
-    result = await db.execute(stmt)
-    entries = result.scalars().all()
 
-    for entry in entries:
-        item = entry.item
-        if item and item.item_type == "recipe" and item.recipe_detail and item.recipe_detail.ingredients:
-            for ingredient in item.recipe_detail.ingredients:
-                await _upsert_shopping_item(
-                    db,
-                    list_id=list_id,
-                    meal_entry_id=entry.id,
-                    source_kind="recipe_ingredient",
-                    source_id=item.id,
-                    display_name=ingredient.get("name", ""),
-                    quantity=ingredient.get("quantity"),
-                    unit=ingredient.get("unit"),
-                    measurement_system=measurement_system,
-                )
-        elif item and item.item_type == "food_item" and item.food_item_detail:
-            fid = item.food_item_detail
-            await _upsert_shopping_item(
-                db,
-                list_id=list_id,
-                meal_entry_id=entry.id,
-                source_kind="food_item",
-                source_id=item.id,
-                display_name=item.name,
-                quantity=float(fid.shopping_quantity) if fid.shopping_quantity is not None else None,
-                unit=fid.shopping_unit,
-                measurement_system=measurement_system,
+
+async def _recompute_shopping_list(db: AsyncSession, list_id: int) -> int:
+    """Recompute all mealboard_auto shopping rows on a list from synced meal entries.
+
+    Set-based, so linking a list with a long meal history stays one pass:
+
+      1. SELECT DISTINCT ingredient names → canonicalize in Python (the
+         pluralization rules live there)
+      2. one INSERT ... SELECT ... GROUP BY bucket ... ON CONFLICT DO UPDATE
+         for the tasks, chained to an INSERT of every shopping_item_sources row
+      3. format the titles of the touched rows and flush them as one batch
+    """
+    await _lock_list(db, list_id)
+    measurement_system = await _measurement_system(db)
+    await ingredient_aliases.refresh_if_stale(db)
+
+    sources = _synced_sources_query(list_id)
+    names_result = await db.execute(select(sources.c.display_name).distinct())
+    names = names_result.scalars().all()
+    if not names:
+        return 0
+
+    canonical_names = values(
+        column("display_name", String), column("canonical", String), name="canonical_names",
+    ).data([(name, canonicalize_name(name)) for name in names])
+    bucketed = (
+        select(sources, canonical_names.c.canonical)
+        .join(canonical_names, canonical_names.c.display_name == sources.c.display_name)
+        .subquery("bucketed")
+    )
+
+    default_fm_id = func.coalesce(
+        select(models.FamilyMember.id).limit(1).scalar_subquery(), 1
+    )
+    # Latest ingredient's display name wins, as with sequential adds. It's a
+    # placeholder title until step 3 formats it with the total.
+    display_name = array_agg(
+        aggregate_order_by(
+            bucketed.c.display_name,
+            bucketed.c.meal_entry_id.desc(),
+            bucketed.c.position.desc(),
+        )
+    )[1]
+    task_columns = [
+        "title", "list_id", "assigned_to", "completed", "priority", "sort_order",
+        "aggregation_source", "aggregation_key_name", "aggregation_unit",
+        "aggregation_unit_group", "aggregation_base_unit", "aggregation_base_quantity",
+    ]
+    task_insert = pg_insert(models.Task).from_select(
+        task_columns,
+        select(
+            display_name,
+            literal(list_id),
+            default_fm_id,
+            literal(False),
+            literal(0),
+            literal(0),
+            literal("mealboard_auto"),
+            bucketed.c.canonical,
+            bucketed.c.aggregation_unit,
+            func.min(bucketed.c.aggregation_unit_group),
+            bucketed.c.aggregation_unit,
+            func.sum(bucketed.c.base_quantity),
+        ).group_by(bucketed.c.canonical, bucketed.c.aggregation_unit),
+    )
+    upserted = (
+        task_insert.on_conflict_do_update(
+            index_elements=[
+                models.Task.list_id,
+                models.Task.aggregation_source,
+                models.Task.aggregation_key_name,
+                models.Task.aggregation_unit,
+            ],
+            index_where=models.Task.aggregation_source.isnot(None),
+            set_={
+                "title": task_insert.excluded.title,
+                "aggregation_base_quantity": (
+                    func.coalesce(models.Task.aggregation_base_quantity, 0)
+                    + task_insert.excluded.aggregation_base_quantity
+                ),
+            },
+        )
+        .returning(
+            models.Task.id, models.Task.aggregation_key_name, models.Task.aggregation_unit,
+        )
+        .cte("upserted")
+    )
+    source_insert = (
+        insert(models.ShoppingItemSource)
+        .from_select(
+            [
+                "task_id", "meal_entry_id", "source_kind", "item_id", "display_name",
+                "ingredient_name", "base_quantity", "unit",
+            ],
+            select(
+                upserted.c.id,
+                bucketed.c.meal_entry_id,
+                bucketed.c.source_kind,
+                bucketed.c.item_id,
+                bucketed.c.display_name,
+                bucketed.c.canonical,
+                bucketed.c.base_quantity,
+                bucketed.c.aggregation_unit,
             )
+            .join(upserted, and_(
+                upserted.c.aggregation_key_name == bucketed.c.canonical,
+                upserted.c.aggregation_unit.is_not_distinct_from(bucketed.c.aggregation_unit),
+            ))
+            .order_by(bucketed.c.meal_entry_id, bucketed.c.position),
+        )
+        .add_cte(upserted)
+        .returning(models.ShoppingItemSource.task_id)
+    )
+    result = await db.execute(source_insert)
+    task_ids = set(result.scalars().all())
+
+    result = await db.execute(
+        select(models.Task)
+        .where(models.Task.id.in_(task_ids))
+        .execution_options(populate_existing=True)
+    )
+    tasks = result.scalars().all()
+    titles = _format_titles(
+        [
+            (task.aggregation_base_quantity, task.aggregation_base_unit,
+             task.aggregation_unit_group, task.title)
+            for task in tasks
+        ],
+        measurement_system,
+    )
+    for task, title in zip(tasks, titles):
+        task.title = title
+    await db.flush()
+    logger.info("Recomputed %d shopping rows on list %d", len(task_ids), list_id)
+    return len(task_ids)
+
+
+async def rebucket_shopping_list(db: AsyncSession) -> int:
+    """Re-bucket the linked list's auto rows under the current alias dictionary.
+
+    Run after an alias is added or removed. Only the unchecked auto rows are
+    rebuilt, and only from their own `shopping_item_sources`: each source is
+    re-keyed from its display name and the sources regrouped, so e.g.
+    separate "scallion" and "green onion" rows merge. Checked rows (flipped
+    to manual by `on_item_checked`) have no auto row behind them any more, so
+    groceries already bought don't come back. Returns the number of rows
+    rebuilt.
+    """
+    await ingredient_aliases.load_aliases(db)
+    list_id = await _lock_linked_list(db)
+    if list_id is None:
+        await db.commit()
+        return 0
+    measurement_system = await _measurement_system(db)
+
+    task, source = models.Task, models.ShoppingItemSource
+    is_auto_row = and_(task.list_id == list_id, task.aggregation_source == "mealboard_auto")
+    result = await db.execute(
+        select(
+            source.meal_entry_id, source.source_kind, source.item_id,
+            source.display_name, source.base_quantity, source.unit,
+            task.aggregation_unit_group, task.assigned_to,
+        )
+        .join(task, task.id == source.task_id)
+        .where(is_auto_row)
+        .order_by(source.meal_entry_id, source.id)
+    )
+    buckets: dict[tuple[str, str | None], dict] = {}
+    for row in result.all():
+        canonical = canonicalize_name(row.display_name)
+        bucket = buckets.setdefault((canonical, row.unit), {
+            "unit_group": row.aggregation_unit_group,
+            "assigned_to": row.assigned_to,
+            "base_quantity": 0.0,
+            "sources": [],
+        })
+        # Latest ingredient's display name wins, as in _recompute_shopping_list
+        bucket["display_name"] = row.display_name
+        bucket["base_quantity"] += row.base_quantity or 0.0
+        bucket["sources"].append({
+            "meal_entry_id": row.meal_entry_id,
+            "source_kind": row.source_kind,
+            "item_id": row.item_id,
+            "display_name": row.display_name,
+            "ingredient_name": canonical,
+            "base_quantity": row.base_quantity,
+            "unit": row.unit,
+        })
+
+    # The old rows' sources go with them (ON DELETE CASCADE)
+    await db.execute(delete(task).where(is_auto_row))
+    if buckets:
+        keys = list(buckets)
+        titles = _format_titles(
+            [
+                (buckets[key]["base_quantity"], key[1], buckets[key]["unit_group"],
+                 buckets[key]["display_name"])
+                for key in keys
+            ],
+            measurement_system,
+        )
+        result = await db.execute(
+            insert(task).returning(task.id, sort_by_parameter_order=True),
+            [
+                {
+                    "title": title,
+                    "list_id": list_id,
+                    "assigned_to": buckets[key]["assigned_to"],
+                    "completed": False,
+                    "priority": 0,
+                    "sort_order": 0,
+                    "aggregation_source": "mealboard_auto",
+                    "aggregation_key_name": key[0],
+                    "aggregation_unit": key[1],
+                    "aggregation_unit_group": buckets[key]["unit_group"],
+                    "aggregation_base_unit": key[1],
+                    "aggregation_base_quantity": buckets[key]["base_quantity"],
+                }
+                for key, title in zip(keys, titles)
+            ],
+        )
+        task_ids = result.scalars().all()
+        await db.execute(
+            insert(source),
+            [
+                {**row, "task_id": task_id}
+                for key, task_id in zip(keys, task_ids)
+                for row in buckets[key]["sources"]
+            ],
+        )
+    await db.commit()
+    logger.info("Re-bucketed list %d into %d shopping rows", list_id, len(buckets))
+    return len(buckets)
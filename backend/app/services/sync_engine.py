@@ -14,31 +14,34 @@ Local-only fields preserved during pull:
 Fields updated from remote:
   - title, description, date, start_time, end_time, all_day
   - etag, last_modified_remote, sync_status
+
+Recurring events: the master VEVENT is stored as a RecurringEventSeries and
+its occurrences inside the sync window are materialized as CalendarEvent rows
+(see services.recurrence). The series' expanded_until lets later pulls only
+expand the days the window has slid forward over; any change to the rule,
+EXDATEs or overrides rebuilds the occurrences in the window.
 """
 
 import logging
 from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from .. import models
 from ..crud_calendars import get_or_create_calendar, get_calendar
 from ..utils.encryption import decrypt_password
-from . import caldav_client
+from . import caldav_client, recurrence
 from .sync_base import SYNCED, PENDING_PUSH
 
 logger = logging.getLogger(__name__)
 
 
-async def pull_from_icloud(db: AsyncSession, integration_id: int) -> dict:
-    """Pull events from iCloud into local DB.
-
-    Returns: {created: int, updated: int, deleted: int, skipped: int, errors: int}
-    """
-    # Load integration
+async def _load_integration(
+    db: AsyncSession, integration_id: int
+) -> models.CalendarIntegration:
     stmt = select(models.CalendarIntegration).where(
         models.CalendarIntegration.id == integration_id
     )
@@ -46,73 +49,211 @@ async def pull_from_icloud(db: AsyncSession, integration_id: int) -> dict:
     integration = result.scalar_one_or_none()
     if not integration:
         raise ValueError(f"Integration {integration_id} not found")
+    return integration
+
+
+def sync_window(integration: models.CalendarIntegration) -> tuple[date, date]:
+    """The [start, end] date range an integration pulls."""
+    today = date.today()
+    return (
+        today - timedelta(days=integration.sync_range_past_days),
+        today + timedelta(days=integration.sync_range_future_days),
+    )
+
+
+def _empty_stats() -> dict:
+    return {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "errors": 0}
+
+
+async def pull_from_icloud(db: AsyncSession, integration_id: int) -> dict:
+    """Pull events from iCloud into local DB.
+
+    Returns: {created: int, updated: int, deleted: int, skipped: int, errors: int}
+    """
+    integration = await _load_integration(db, integration_id)
 
     # Decrypt and connect
     password = decrypt_password(integration.encrypted_password)
     client, principal = caldav_client.connect_icloud(integration.email, password)
 
-    # Calculate sync range
-    today = date.today()
-    start_date = today - timedelta(days=integration.sync_range_past_days)
-    end_date = today + timedelta(days=integration.sync_range_future_days)
-
-    stats = {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "errors": 0}
+    start_date, end_date = sync_window(integration)
+    stats = _empty_stats()
 
     # Track all remote UIDs we see (for detecting remote deletions)
     seen_external_ids = set()
+    seen_series_ids = set()
 
     # Use Calendar table rows; fall back to legacy selected_calendars JSON
     cal_rows = await _get_calendar_rows(db, integration)
     for cal_row in cal_rows:
-        cal_url = cal_row.calendar_url
         try:
-            calendar = caldav_client.get_calendar_by_url(principal, cal_url)
-            remote_events = caldav_client.fetch_events(calendar, start_date, end_date)
-
-            # Update Calendar name/color from iCloud metadata
-            try:
-                cal_info = next(
-                    (c for c in caldav_client.list_calendars(principal) if c["url"] == cal_url),
-                    None,
-                )
-                if cal_info:
-                    if cal_info["name"] and cal_info["name"] != cal_row.name:
-                        cal_row.name = cal_info["name"]
-                    if cal_info.get("color") != cal_row.color:
-                        cal_row.color = cal_info.get("color")
-            except Exception:
-                pass  # Non-critical: metadata update is best-effort
+            await _pull_calendar(
+                db, integration, principal, cal_row, start_date, end_date,
+                stats, seen_external_ids, seen_series_ids,
+            )
         except Exception:
             logger.error(
-                "Failed to fetch events from calendar %s", cal_url, exc_info=True
+                "Failed to fetch events from calendar %s",
+                cal_row.calendar_url,
+                exc_info=True,
             )
             stats["errors"] += 1
-            continue
-
-        for remote in remote_events:
-            external_id = remote["external_id"]
-            seen_external_ids.add(external_id)
-
-            try:
-                await _sync_single_event(
-                    db, integration, remote, stats, calendar_id=cal_row.id
-                )
-            except Exception:
-                logger.error(
-                    "Failed to sync event external_id=%s", external_id, exc_info=True
-                )
-                stats["errors"] += 1
 
     # Detect remote deletions: local ICLOUD events for this integration
     # that are within the sync range but NOT in the remote fetch
     await _detect_remote_deletions(
         db, integration_id, seen_external_ids, start_date, end_date, stats
     )
+    await _detect_remote_series_deletions(
+        db, integration_id, seen_series_ids, start_date, end_date, stats
+    )
+
+    await db.commit()
+    return stats
 
+
+async def pull_calendar_from_icloud(
+    db: AsyncSession,
+    integration_id: int,
+    calendar_id: int,
+    start_date: date,
+    end_date: date,
+) -> dict:
+    """Pull one calendar of an integration (fan-out half of the periodic sync).
+
+    Unlike pull_from_icloud, a failed CalDAV fetch raises so the caller can
+    retry this calendar on its own. Remote-deletion detection needs every
+    calendar's UIDs, so it is left to finalize_calendar_pulls; the seen UIDs
+    are returned for that.
+
+    Returns: {stats: {...}, seen_external_ids: [str], seen_series_ids: [str]}
+    """
+    integration = await _load_integration(db, integration_id)
+    cal_row = await get_calendar(db, calendar_id)
+    if not cal_row or cal_row.calendar_integration_id != integration_id:
+        raise ValueError(
+            f"Calendar {calendar_id} not found for integration {integration_id}"
+        )
+
+    password = decrypt_password(integration.encrypted_password)
+    client, principal = caldav_client.connect_icloud(integration.email, password)
+
+    stats = _empty_stats()
+    seen_external_ids = set()
+    seen_series_ids = set()
+    await _pull_calendar(
+        db, integration, principal, cal_row, start_date, end_date,
+        stats, seen_external_ids, seen_series_ids,
+    )
     await db.commit()
+    return {
+        "stats": stats,
+        "seen_external_ids": sorted(seen_external_ids),
+        "seen_series_ids": sorted(seen_series_ids),
+    }
+
+
+async def finalize_calendar_pulls(
+    db: AsyncSession,
+    integration_id: int,
+    results: list[dict],
+    start_date: date,
+    end_date: date,
+) -> dict:
+    """Fan-in for pull_calendar_from_icloud: merge stats, detect deletions.
+
+    `results` holds one entry per calendar — either the dict returned by
+    pull_calendar_from_icloud or {"error": str} for a calendar that failed
+    after its retries. Deletion detection only runs when every calendar
+    pulled cleanly; otherwise the missing UIDs may simply be in the calendar
+    we couldn't read.
+
+    Returns the merged stats dict (same keys as pull_from_icloud).
+    """
+    stats = _empty_stats()
+    seen_external_ids = set()
+    seen_series_ids = set()
+    failed = 0
+    for result in results:
+        if "error" in result:
+            failed += 1
+            continue
+        for key, value in result["stats"].items():
+            stats[key] = stats.get(key, 0) + value
+        seen_external_ids.update(result["seen_external_ids"])
+        seen_series_ids.update(result["seen_series_ids"])
+    stats["errors"] += failed
+
+    if failed:
+        logger.warning(
+            "Skipping remote-deletion detection for integration %d: "
+            "%d of %d calendars failed",
+            integration_id, failed, len(results),
+        )
+    else:
+        await _detect_remote_deletions(
+            db, integration_id, seen_external_ids, start_date, end_date, stats
+        )
+        await _detect_remote_series_deletions(
+            db, integration_id, seen_series_ids, start_date, end_date, stats
+        )
+        await db.commit()
     return stats
 
 
+async def _pull_calendar(
+    db: AsyncSession,
+    integration: models.CalendarIntegration,
+    principal,
+    cal_row: models.Calendar,
+    start_date: date,
+    end_date: date,
+    stats: dict,
+    seen_external_ids: set,
+    seen_series_ids: set,
+) -> None:
+    """Fetch one calendar and sync its events. Raises if the fetch fails."""
+    cal_url = cal_row.calendar_url
+    calendar = caldav_client.get_calendar_by_url(principal, cal_url)
+    remote_events = caldav_client.fetch_events(calendar, start_date, end_date)
+
+    # Update Calendar name/color from iCloud metadata
+    try:
+        cal_info = next(
+            (c for c in caldav_client.list_calendars(principal) if c["url"] == cal_url),
+            None,
+        )
+        if cal_info:
+            if cal_info["name"] and cal_info["name"] != cal_row.name:
+                cal_row.name = cal_info["name"]
+            if cal_info.get("color") != cal_row.color:
+                cal_row.color = cal_info.get("color")
+    except Exception:
+        pass  # Non-critical: metadata update is best-effort
+
+    for remote in remote_events:
+        external_id = remote["external_id"]
+
+        try:
+            if remote.get("rrule"):
+                seen_series_ids.add(external_id)
+                await _sync_series(
+                    db, integration, remote, start_date, end_date, stats,
+                    calendar_id=cal_row.id,
+                )
+                continue
+
+            seen_external_ids.add(external_id)
+            await _sync_single_event(
+                db, integration, remote, stats, calendar_id=cal_row.id
+            )
+        except Exception:
+            logger.error(
+                "Failed to sync event external_id=%s", external_id, exc_info=True
+            )
+            stats["errors"] += 1
+
+
 async def _sync_single_event(
     db: AsyncSession,
     integration: models.CalendarIntegration,
@@ -181,6 +322,161 @@ async def _sync_single_event(
     stats["updated"] += 1
 
 
+# Series fields taken verbatim from the remote dict. A difference in any of
+# them means the materialized occurrences are stale.
+_SERIES_FIELDS = (
+    "title", "description", "dtstart", "all_day", "timezone",
+    "duration_minutes", "rrule", "exdates", "overrides",
+)
+
+
+async def _sync_series(
+    db: AsyncSession,
+    integration: models.CalendarIntegration,
+    remote: dict,
+    start_date: date,
+    end_date: date,
+    stats: dict,
+    calendar_id: int | None = None,
+) -> None:
+    """Sync a recurring master event and its occurrence index."""
+    stmt = select(models.RecurringEventSeries).where(
+        models.RecurringEventSeries.external_id == remote["external_id"],
+        models.RecurringEventSeries.calendar_integration_id == integration.id,
+    )
+    result = await db.execute(stmt)
+    series = result.scalar_one_or_none()
+
+    if series is None:
+        series = models.RecurringEventSeries(
+            external_id=remote["external_id"],
+            calendar_integration_id=integration.id,
+            **{field: remote[field] for field in _SERIES_FIELDS},
+        )
+        db.add(series)
+        changed = True
+        stats["created"] += 1
+    else:
+        changed = any(
+            getattr(series, field) != remote[field] for field in _SERIES_FIELDS
+        )
+        if changed:
+            for field in _SERIES_FIELDS:
+                setattr(series, field, remote[field])
+            stats["updated"] += 1
+        else:
+            stats["skipped"] += 1
+
+    series.etag = remote.get("etag")
+    series.last_modified_remote = remote.get("last_modified_remote")
+    if calendar_id and series.calendar_id != calendar_id:
+        series.calendar_id = calendar_id
+        if series.id is not None:
+            await db.execute(
+                update(models.CalendarEvent)
+                .where(models.CalendarEvent.series_id == series.id)
+                .values(calendar_id=calendar_id)
+            )
+    await db.flush()
+
+    if changed:
+        # Rule or overrides moved — rebuild every occurrence whose *original*
+        # slot, or whose current date, is from the window start on. The
+        # recurrence key (it leads with the ISO date, so it sorts by original
+        # start) catches an override moved before the window, which would
+        # otherwise collide with its re-expanded row on
+        # uq_calendar_event_series_occurrence; the date catches one moved into
+        # the window from an earlier slot, which is rebuilt from the override.
+        await db.execute(
+            delete(models.CalendarEvent).where(
+                models.CalendarEvent.series_id == series.id,
+                or_(
+                    models.CalendarEvent.recurrence_id >= start_date.isoformat(),
+                    models.CalendarEvent.date >= start_date,
+                ),
+            )
+        )
+        expand_from = start_date
+    elif series.expanded_until is None or series.expanded_until < start_date:
+        expand_from = start_date
+    elif series.expanded_until < end_date:
+        # Unchanged series, window slid forward — only expand the new days.
+        expand_from = series.expanded_until + timedelta(days=1)
+    else:
+        return
+
+    occurrences = recurrence.build_occurrences(series, expand_from, end_date)
+    # An override moved across a window boundary is materialized by whichever
+    # expansion reaches it first — by its new date or by its original slot.
+    existing = set()
+    if occurrences:
+        result = await db.execute(
+            select(models.CalendarEvent.recurrence_id).where(
+                models.CalendarEvent.series_id == series.id,
+                models.CalendarEvent.recurrence_id.in_(
+                    [occ["recurrence_id"] for occ in occurrences]
+                ),
+            )
+        )
+        existing = set(result.scalars().all())
+
+    for occ in occurrences:
+        if occ["recurrence_id"] in existing:
+            continue
+        db.add(models.CalendarEvent(
+            **occ,
+            source=models.CalendarEventSource.ICLOUD,
+            assigned_to=integration.family_member_id,
+            sync_status=SYNCED,
+            calendar_integration_id=integration.id,
+            calendar_id=series.calendar_id,
+            series_id=series.id,
+        ))
+    series.expanded_until = end_date
+
+
+async def _detect_remote_series_deletions(
+    db: AsyncSession,
+    integration_id: int,
+    seen_series_ids: set,
+    start_date: date,
+    end_date: date,
+    stats: dict,
+) -> None:
+    """Delete recurring series that were removed from iCloud.
+
+    A series missing from the fetch is only treated as deleted when it has
+    occurrences inside the sync range — otherwise the server simply had no
+    instances to report. Occurrences go with it (ON DELETE CASCADE).
+    """
+    has_occurrence_in_range = (
+        select(models.CalendarEvent.id)
+        .where(
+            models.CalendarEvent.series_id == models.RecurringEventSeries.id,
+            models.CalendarEvent.date >= start_date,
+            models.CalendarEvent.date <= end_date,
+        )
+        .exists()
+    )
+    stmt = select(models.RecurringEventSeries).where(
+        models.RecurringEventSeries.calendar_integration_id == integration_id,
+        has_occurrence_in_range,
+    )
+    if seen_series_ids:
+        stmt = stmt.where(
+            models.RecurringEventSeries.external_id.not_in(seen_series_ids)
+        )
+    result = await db.execute(stmt)
+    for series in result.scalars().all():
+        logger.info(
+            "Remote deletion detected for recurring event '%s' (external_id=%s)",
+            series.title,
+            series.external_id,
+        )
+        await db.delete(series)
+        stats["deleted"] += 1
+
+
 def _update_local_from_remote(local_event: models.CalendarEvent, remote: dict) -> None:
     """Update local event fields from remote data.
 
@@ -485,6 +781,14 @@ async def move_event_on_icloud(
     return {"action": "moved"}
 
 
+async def get_calendar_ids(db: AsyncSession, integration_id: int) -> list[int]:
+    """Calendar row ids to fan a pull out over (materializes legacy JSON rows)."""
+    integration = await _load_integration(db, integration_id)
+    rows = await _get_calendar_rows(db, integration)
+    await db.commit()
+    return [row.id for row in rows]
+
+
 async def _get_calendar_rows(
     db: AsyncSession, integration: models.CalendarIntegration
 ) -> list[models.Calendar]:
@@ -3,6 +3,7 @@ import logging
 
 from .celery_app import celery_app
 from .database import AsyncSessionLocal
+from .utils.task_dedupe import mark_consumed
 
 logger = logging.getLogger(__name__)
 
@@ -35,77 +36,152 @@ def health_check():
 
 @celery_app.task(name="app.tasks.sync_all_icloud_integrations")
 def sync_all_icloud_integrations():
-    """Periodic task (every 10 min): sync all active iCloud integrations."""
+    """Periodic task (every 10 min): fan out a pull per (integration, calendar).
+
+    Each active integration gets a chord: one sync_integration_calendar
+    subtask per calendar (so a big household spreads across workers and a
+    failing calendar retries on its own), with finalize_integration_sync as
+    the callback that merges stats, detects remote deletions and updates the
+    integration's status. This task only dispatches, so beat time no longer
+    grows with the number of accounts.
+    """
+    from celery import chord, group
     from . import models
 
-    async def _sync_all():
-        from .services.sync_engine import pull_from_icloud
+    async def _plan():
+        from .services.sync_engine import get_calendar_ids, sync_window
+        from sqlalchemy import select
 
         async with AsyncSessionLocal() as db:
-            from sqlalchemy import select
-
             stmt = select(models.CalendarIntegration).where(
                 models.CalendarIntegration.status == models.IntegrationStatus.ACTIVE
             )
             result = await db.execute(stmt)
-            integrations = result.scalars().all()
-
-        results = {}
-        for integration in integrations:
-            try:
-                async with AsyncSessionLocal() as db:
-                    stats = await pull_from_icloud(db, integration.id)
-                    # Update last_sync_at
-                    from sqlalchemy import select as sel, func
-
-                    stmt = sel(models.CalendarIntegration).where(
-                        models.CalendarIntegration.id == integration.id
-                    )
-                    res = await db.execute(stmt)
-                    integ = res.scalar_one_or_none()
-                    if integ:
-                        integ.last_sync_at = func.now()
-                        integ.status = models.IntegrationStatus.ACTIVE
-                        integ.last_error = None
-                        await db.commit()
-
-                results[integration.id] = stats
-                logger.info(
-                    "Synced integration %d (%s): %s",
-                    integration.id,
-                    integration.email,
-                    stats,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to sync integration %d: %s",
-                    integration.id,
-                    str(e),
-                    exc_info=True,
-                )
-                # Set status to ERROR
+            # Resolve windows up front — a rollback below expires the ORM rows.
+            windows = [
+                (integration.id, *sync_window(integration))
+                for integration in result.scalars().all()
+            ]
+
+            plan = []
+            for integration_id, start_date, end_date in windows:
                 try:
-                    async with AsyncSessionLocal() as db:
-                        stmt = sel(models.CalendarIntegration).where(
-                            models.CalendarIntegration.id == integration.id
-                        )
-                        res = await db.execute(stmt)
-                        integ = res.scalar_one_or_none()
-                        if integ:
-                            integ.status = models.IntegrationStatus.ERROR
-                            integ.last_error = str(e)[:500]
-                            await db.commit()
+                    calendar_ids = await get_calendar_ids(db, integration_id)
                 except Exception:
                     logger.error(
-                        "Failed to set error status for integration %d",
-                        integration.id,
+                        "Failed to list calendars for integration %d",
+                        integration_id,
                         exc_info=True,
                     )
-                results[integration.id] = {"error": str(e)}
+                    await db.rollback()
+                    continue
+                plan.append((
+                    integration_id,
+                    calendar_ids,
+                    start_date.isoformat(),
+                    end_date.isoformat(),
+                ))
+            return plan
+
+    dispatched = {}
+    for integration_id, calendar_ids, start, end in run_async(_plan()):
+        callback = finalize_integration_sync.s(integration_id, start, end)
+        if calendar_ids:
+            chord(group(
+                sync_integration_calendar.s(integration_id, calendar_id, start, end)
+                for calendar_id in calendar_ids
+            ))(callback)
+        else:
+            callback.delay([])
+        dispatched[integration_id] = len(calendar_ids)
 
-        return results
+    logger.info("Dispatched iCloud calendar sync: %s", dispatched)
+    return {"dispatched": dispatched}
+
+
+@celery_app.task(
+    name="app.tasks.sync_integration_calendar",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+)
+def sync_integration_calendar(
+    self, integration_id: int, calendar_id: int, start: str, end: str
+):
+    """Chord header: pull one calendar of an integration.
+
+    Retries with exponential backoff (30s, 60s, 120s). Once retries are
+    exhausted it returns {"error": ...} instead of raising — a raised
+    exception would abort the whole chord and the callback (which owns the
+    integration status) would never run.
+    """
+    from datetime import date
+
+    async def _pull():
+        from .services.sync_engine import pull_calendar_from_icloud
+
+        async with AsyncSessionLocal() as db:
+            return await pull_calendar_from_icloud(
+                db, integration_id, calendar_id,
+                date.fromisoformat(start), date.fromisoformat(end),
+            )
+
+    try:
+        return run_async(_pull())
+    except Exception as e:
+        logger.error(
+            "Failed to sync calendar %d of integration %d: %s",
+            calendar_id,
+            integration_id,
+            str(e),
+            exc_info=True,
+        )
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e, countdown=self.default_retry_delay * (2 ** self.request.retries))
+        return {"calendar_id": calendar_id, "error": str(e)[:500]}
 
-    return run_async(_sync_all())
+
+@celery_app.task(name="app.tasks.finalize_integration_sync")
+def finalize_integration_sync(results: list, integration_id: int, start: str, end: str):
+    """Chord callback: merge per-calendar results and update integration status.
+
+    The integration is marked ERROR only when every calendar failed (bad
+    credentials, iCloud down); a single bad calendar is counted in
+    stats["errors"] and the integration stays ACTIVE, as before the fan-out.
+    """
+    from datetime import date
+    from . import models
+
+    async def _finalize():
+        from .services.sync_engine import finalize_calendar_pulls
+        from sqlalchemy import select, func
+
+        errors = [r["error"] for r in results if "error" in r]
+        async with AsyncSessionLocal() as db:
+            stats = await finalize_calendar_pulls(
+                db, integration_id, results,
+                date.fromisoformat(start), date.fromisoformat(end),
+            )
+
+            stmt = select(models.CalendarIntegration).where(
+                models.CalendarIntegration.id == integration_id
+            )
+            res = await db.execute(stmt)
+            integ = res.scalar_one_or_none()
+            if integ:
+                if results and len(errors) == len(results):
+                    integ.status = models.IntegrationStatus.ERROR
+                    integ.last_error = errors[0][:500]
+                else:
+                    integ.last_sync_at = func.now()
+                    integ.status = models.IntegrationStatus.ACTIVE
+                    integ.last_error = None
+                await db.commit()
+            return stats
+
+    stats = run_async(_finalize())
+    logger.info("Synced integration %d: %s", integration_id, stats)
+    return stats
 
 
 @celery_app.task(
@@ -118,6 +194,8 @@ def sync_single_integration(self, integration_id: int):
     """Sync a single integration. Used for initial sync + manual 'Sync Now'."""
     from . import models
 
+    mark_consumed(f"sync:integration:{integration_id}")
+
     async def _sync():
         from .services.sync_engine import pull_from_icloud
         from sqlalchemy import select, func
@@ -189,6 +267,8 @@ def push_event_to_icloud(self, event_id: int):
     Called when user edits/creates an ICLOUD event locally.
     Retries with exponential backoff (10s, 20s, 40s).
     """
+    # Release before reading the row so an edit made mid-push queues a new run.
+    mark_consumed(f"push:event:{event_id}")
 
     async def _push():
         from .services.sync_engine import push_to_icloud
@@ -346,6 +426,8 @@ def sync_single_reminders_integration(self, integration_id: int):
     """Sync reminders for a single integration. Used for initial + manual sync."""
     from . import models
 
+    mark_consumed(f"sync:reminders:{integration_id}")
+
     async def _sync():
         from .services.reminders_sync_engine import pull_reminders_from_icloud
         from sqlalchemy import select, func
@@ -412,6 +494,7 @@ def sync_single_reminders_integration(self, integration_id: int):
 )
 def push_task_to_icloud_task(self, task_id: int):
     """Push a single task change to iCloud as VTODO."""
+    mark_consumed(f"push:task:{task_id}")
 
     async def _push():
         from .services.reminders_sync_engine import push_task_to_icloud
@@ -496,6 +579,7 @@ def sync_shopping_list_add(self, meal_entry_id: int):
     Called after a meal entry is created. Aggregates ingredients with
     existing shopping items using the aggregation key + unique constraint.
     """
+    mark_consumed(f"shopping:add:{meal_entry_id}")
     from .services.shopping_sync import sync_meal_to_shopping_list
     from sqlalchemy import update
     from . import models
@@ -548,6 +632,7 @@ def sync_shopping_list_remove(self, meal_entry_id: int, synced_to_list_id: int |
     touching the shopping list — if the entry is live (soft_hidden_at IS NULL),
     the undo won; leave its groceries on the list.
     """
+    mark_consumed(f"shopping:remove:{meal_entry_id}")
     from sqlalchemy import select
     from . import models
     from .services.shopping_sync import remove_meal_from_shopping_list
@@ -589,6 +674,90 @@ def sync_shopping_list_remove(self, meal_entry_id: int, synced_to_list_id: int |
         raise self.retry(exc=e, countdown=self.default_retry_delay * (2 ** self.request.retries))
 
 
+@celery_app.task(
+    name="app.tasks.sync_pending_shopping_entries",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=10,
+)
+def sync_pending_shopping_entries(self):
+    """Drain every pending meal entry onto the linked shopping list at once.
+
+    One transaction and one write per aggregation bucket for the whole batch,
+    instead of a `sync_shopping_list_add` per entry contending on the same
+    shopping rows. Submit it with `submit_once(..., "shopping:drain")` after
+    creating many entries; beat also runs it to pick up entries whose
+    per-entry dispatch failed.
+    """
+    mark_consumed("shopping:drain")
+    from .services.shopping_sync import pending_meal_entry_ids, sync_meals_to_shopping_list
+
+    async def _drain():
+        async with AsyncSessionLocal() as db:
+            entry_ids = await pending_meal_entry_ids(db)
+            return await sync_meals_to_shopping_list(db, entry_ids)
+
+    try:
+        synced = run_async(_drain())
+        logger.info("Shopping sync (drain) complete: %d meal entries synced", synced)
+        return synced
+    except Exception as e:
+        logger.error("Shopping sync (drain) failed: %s", str(e), exc_info=True)
+        raise self.retry(exc=e, countdown=self.default_retry_delay * (2 ** self.request.retries))
+
+
+@celery_app.task(
+    name="app.tasks.rebucket_shopping_list",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+)
+def rebucket_shopping_list(self):
+    """Re-aggregate the linked shopping list after an ingredient alias change."""
+    mark_consumed("shopping:rebucket")
+    from .services.shopping_sync import rebucket_shopping_list as _rebucket
+
+    async def _run():
+        async with AsyncSessionLocal() as db:
+            return await _rebucket(db)
+
+    try:
+        rebuilt = run_async(_run())
+        logger.info("Shopping list re-bucket complete: %d rows", rebuilt)
+        return rebuilt
+    except Exception as e:
+        logger.error("Shopping list re-bucket failed: %s", str(e), exc_info=True)
+        raise self.retry(exc=e, countdown=self.default_retry_delay * (2 ** self.request.retries))
+
+
+@celery_app.task(
+    name="app.tasks.reconcile_item_usage_counts",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+)
+def reconcile_item_usage_counts(self):
+    """Nightly repair of items.usage_count / last_used_on.
+
+    The meal entry write paths keep the counters current; this catches
+    anything that bypassed them (manual SQL, a bug) so drift can't persist.
+    """
+    from .crud_items import reconcile_usage_counts
+
+    async def _run():
+        async with AsyncSessionLocal() as db:
+            return await reconcile_usage_counts(db)
+
+    try:
+        repaired = run_async(_run())
+        if repaired:
+            logger.warning("Item usage reconcile repaired %d drifted items", repaired)
+        return repaired
+    except Exception as e:
+        logger.error("Item usage reconcile failed: %s", str(e), exc_info=True)
+        raise self.retry(exc=e, countdown=self.default_retry_delay * (2 ** self.request.retries))
+
+
 # =============================================================================
 # Chunk 6 — Soft-delete hard-delete sweeper (Expansion B)
 # =============================================================================
@@ -608,7 +777,9 @@ def hard_delete_expired_soft_deletes(self):
 
     Thin wrapper around `crud_items.hard_delete_expired_soft_deletes_async()`.
     The real cascade-in-code + assertion-gate logic lives there so tests can
-    await it directly with their own db_session fixture.
+    await it directly with their own db_session fixture. It sweeps in short
+    per-chunk transactions under a time budget; a backlog it doesn't finish
+    carries over to the next hourly run.
 
     Failure handling: Celery autoretry kicks in for any exception (3 retries
     with exponential backoff). After exhaustion the task fails and Celery's
@@ -0,0 +1,89 @@
+"""Weak ETags and 304s for the polled collection endpoints.
+
+The frontend re-polls /items, /meal-entries, /calendar-events and /tasks
+constantly, and most polls return exactly what the last one did. Each of
+those routes declares the tables its response is built from::
+
+    @router.get("/", dependencies=[versioned("tasks", "family_members")])
+
+`versioned()` reads those tables' `collection_versions` rows (one indexed
+query; the rows are bumped by triggers on every write, see
+models.CollectionVersion) and derives the ETag from them. If the request's
+If-None-Match carries that ETag the route never runs — `NotModified` becomes
+a bodiless 304. Otherwise `etag_middleware` stamps the ETag on the 200 along
+with `Cache-Control: no-cache`, so the browser revalidates every poll.
+
+The versions are read *before* the route queries its data, so a write that
+commits in between can only make the ETag older than the body — the next
+poll refetches — never newer.
+"""
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+from ..database import get_db
+
+
+class NotModified(Exception):
+    """Raised by a `versioned()` dependency when the client's copy is current."""
+
+    def __init__(self, etag: str):
+        super().__init__(etag)
+        self.etag = etag
+
+
+async def get_versions(db: AsyncSession, tables) -> dict[str, int]:
+    """Current version of each table. Tables never written yet are 0."""
+    result = await db.execute(
+        select(models.CollectionVersion.scope, models.CollectionVersion.version)
+        .where(models.CollectionVersion.scope.in_(tables))
+    )
+    versions = dict(result.all())
+    return {table: versions.get(table, 0) for table in tables}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # Weak comparison (RFC 9110 §13.1.2): the W/ prefix is ignored
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def versioned(*tables: str):
+    """Route dependency: answer 304 when none of `tables` changed since the
+    client's copy. Every table must be in `models.VERSIONED_TABLES`."""
+    unknown = set(tables) - set(models.VERSIONED_TABLES)
+    if unknown:
+        raise ValueError(f"No version triggers on {sorted(unknown)}")
+
+    async def check(request: Request, db: AsyncSession = Depends(get_db)):
+        versions = await get_versions(db, tables)
+        etag = 'W/"' + ".".join(str(versions[table]) for table in tables) + '"'
+        request.state.etag = etag
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModified(etag)
+
+    return Depends(check)
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": exc.etag, "Cache-Control": "no-cache"}
+    )
+
+
+async def etag_middleware(request: Request, call_next):
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag is not None and response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    return response
@@ -0,0 +1,77 @@
+"""Collapse duplicate pending Celery submissions keyed by entity.
+
+Rapid edits to one calendar event each dispatch `push_event_to_icloud` with
+a 30s countdown; every one of those re-reads the row and talks to iCloud,
+but only the last is useful. `submit_once()` claims a Redis key such as
+``push:event:42`` with SET NX before enqueueing, so while a submission for
+that entity is still pending, further submissions are dropped.
+
+The task calls `mark_consumed()` with the same key as the first thing it
+does — *before* reading any state — so an edit committed while the task is
+running enqueues a fresh run instead of being swallowed.
+
+Redis trouble fails open: a duplicate task is harmless (every deduped task
+is idempotent), a lost one is not.
+"""
+
+import logging
+import os
+
+import redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+_REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+_KEY_PREFIX = "taskdedupe:"
+# How long a pending claim outlives its countdown. Bounds how long a task
+# lost by the broker can suppress new submissions for its entity.
+_PENDING_GRACE_SECONDS = 600
+
+# Sync client: callers are Celery tasks and route handlers that already make
+# a blocking `.delay()` broker call right alongside this one.
+_client: redis.Redis | None = None
+
+
+def _get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(_REDIS_URL, decode_responses=True)
+    return _client
+
+
+def submit_once(task, key: str, args: tuple = (), countdown: int | None = None) -> bool:
+    """Enqueue `task(*args)` unless a submission for `key` is already pending.
+
+    Returns True if the task was enqueued, False if it was collapsed into an
+    earlier pending submission. Broker errors propagate (after releasing the
+    claim) so callers keep their existing dispatch error handling.
+    """
+    ttl = (countdown or 0) + _PENDING_GRACE_SECONDS
+    try:
+        claimed = _get_redis().set(f"{_KEY_PREFIX}{key}", "1", nx=True, ex=ttl)
+    except RedisError as e:
+        logger.warning("Task dedupe unavailable for %s, submitting anyway: %s", key, e)
+        claimed = True
+    if not claimed:
+        logger.info("Collapsed duplicate task submission %s (%s)", key, task.name)
+        return False
+
+    try:
+        if countdown is None:
+            task.delay(*args)
+        else:
+            task.apply_async(args=list(args), countdown=countdown)
+    except Exception:
+        # Don't let a failed enqueue suppress the next submission.
+        mark_consumed(key)
+        raise
+    return True
+
+
+def mark_consumed(key: str) -> None:
+    """Release `key` so the next submission for the entity is enqueued."""
+    try:
+        _get_redis().delete(f"{_KEY_PREFIX}{key}")
+    except RedisError as e:
+        logger.warning("Failed to release task dedupe key %s: %s", key, e)
@@ -64,6 +64,49 @@ def install_auth_config():
     auth_config.reset()
 
 
+# =============================================================================
+# Task dedupe keys — autouse per-test reset
+# =============================================================================
+#
+# `app.utils.task_dedupe.submit_once` claims Redis keys like
+# `push:event:1` that outlive the test (TTL = countdown + 10 min). Sequences
+# restart at 1 per test, so a key left by one test would silently collapse
+# the next test's dispatch of the same id. Clear them after every test.
+
+@pytest.fixture(autouse=True)
+def reset_task_dedupe_keys():
+    yield
+    from redis.exceptions import RedisError
+    from app.utils import task_dedupe
+
+    try:
+        client = task_dedupe._get_redis()
+        keys = list(client.scan_iter(f"{task_dedupe._KEY_PREFIX}*"))
+        if keys:
+            client.delete(*keys)
+    except RedisError:
+        pass  # No Redis → submit_once failed open, nothing to clean
+
+
+# Item cache keys embed collection versions, and every test rolls its writes
+# back — so each test counts versions up from the same values and would be
+# served another test's (or an earlier run's) items. Start each test empty.
+
+@pytest.fixture(autouse=True)
+async def reset_item_cache():
+    from redis.exceptions import RedisError
+    from app import crud_items
+
+    try:
+        client = crud_items._get_redis()
+        keys = [key async for key in client.scan_iter(f"{crud_items._CACHE_KEY_PREFIX}*")]
+        if keys:
+            await client.delete(*keys)
+    except RedisError:
+        pass  # No Redis → every lookup falls through to Postgres
+    yield
+
+
 # =============================================================================
 # Database Container & Engine (session-scoped)
 # =============================================================================
@@ -162,6 +205,19 @@ async def db_session(test_engine):
     async with test_engine.begin() as setup_conn:
         await setup_conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
         await setup_conn.run_sync(Base.metadata.create_all)
+        # Same as migration d7f2b9c3e1a8: pg_trgm and the trigram name index
+        # only where the server ships the extension (CI's postgres:16 does).
+        await setup_conn.execute(text("""
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                    CREATE INDEX IF NOT EXISTS items_name_trgm
+                        ON items USING gin (name gin_trgm_ops);
+                END IF;
+            END
+            $$
+        """))
         seq_rows = await setup_conn.execute(
             text(
                 "SELECT sequence_name FROM information_schema.sequences "
@@ -173,6 +229,10 @@ async def db_session(test_engine):
 
     async with test_engine.connect() as conn:
         outer = await conn.begin()
+        # The collection_versions bumps are deferred to commit, and the
+        # outer transaction never commits; apply them per statement instead
+        # so tests see their own writes move the ETags.
+        await conn.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))
         session = AsyncSession(
             bind=conn,
             expire_on_commit=False,
@@ -508,6 +568,9 @@ async def test_meal_entry(db_session, test_recipe, test_meal_slot_dinner):
         was_cooked=False,
     )
     db_session.add(entry)
+    # Inserted directly, so bump the counters crud_meal_entries would maintain
+    test_recipe.usage_count += 1
+    test_recipe.last_used_on = entry.date
     await db_session.commit()
     await db_session.refresh(entry)
     return entry
@@ -87,6 +87,19 @@ class TestPatchICloudEvent:
         call_args = mock_task.apply_async.call_args
         assert call_args.kwargs.get("args") == [icloud_event.id] or call_args[1].get("args") == [icloud_event.id]
 
+    @patch("app.tasks.push_event_to_icloud")
+    async def test_rapid_edits_collapse_into_one_pending_push(self, mock_task, client, icloud_event):
+        mock_task.apply_async = MagicMock()
+
+        for title in ("One", "Two", "Three"):
+            response = await client.patch(
+                f"/calendar-events/{icloud_event.id}",
+                json={"title": title},
+            )
+            assert response.status_code == 200
+
+        mock_task.apply_async.assert_called_once()
+
 
 class TestDeleteICloudEvent:
     """DELETE /calendar-events/{id} on ICLOUD events."""
@@ -0,0 +1,144 @@
+"""Integration tests for the fan-out/fan-in calendar pull.
+
+`pull_calendar_from_icloud` (chord header, one calendar) and
+`finalize_calendar_pulls` (chord callback) run against Postgres with the
+CalDAV client mocked. The Celery wrappers in tasks.py are thin run_async()
+shells around these and aren't exercised through a broker.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.models import Calendar, CalendarEvent, CalendarIntegration, FamilyMember
+from app.services.sync_engine import (
+    finalize_calendar_pulls,
+    get_calendar_ids,
+    pull_calendar_from_icloud,
+)
+from app.utils.encryption import encrypt_password
+
+START, END = date(2026, 3, 1), date(2026, 3, 31)
+
+
+@pytest_asyncio.fixture
+async def integration(db_session):
+    member = FamilyMember(name="Bob", is_system=False)
+    db_session.add(member)
+    await db_session.flush()
+    integ = CalendarIntegration(
+        family_member_id=member.id,
+        provider="icloud",
+        email="bob@icloud.com",
+        encrypted_password=encrypt_password("test"),
+        status="ACTIVE",
+    )
+    db_session.add(integ)
+    await db_session.flush()
+    db_session.add_all([
+        Calendar(calendar_integration_id=integ.id, calendar_url="https://cal/home", name="Home"),
+        Calendar(calendar_integration_id=integ.id, calendar_url="https://cal/work", name="Work"),
+    ])
+    await db_session.commit()
+    await db_session.refresh(integ)
+    return integ
+
+
+def _event(uid, day):
+    return {
+        "external_id": uid,
+        "title": uid,
+        "description": None,
+        "date": date(2026, 3, day),
+        "start_time": "09:00",
+        "end_time": "10:00",
+        "all_day": False,
+        "timezone": "UTC",
+        "last_modified_remote": None,
+        "etag": f"etag-{uid}",
+    }
+
+
+@pytest.fixture
+def mock_caldav():
+    with patch("app.services.sync_engine.caldav_client") as mock:
+        mock.connect_icloud.return_value = (MagicMock(), MagicMock())
+        mock.get_calendar_by_url.side_effect = lambda principal, url: url
+        mock.list_calendars.return_value = []
+        yield mock
+
+
+async def _pull_all(db_session, integration):
+    results = []
+    for calendar_id in await get_calendar_ids(db_session, integration.id):
+        results.append(await pull_calendar_from_icloud(
+            db_session, integration.id, calendar_id, START, END
+        ))
+    return results
+
+
+class TestCalendarFanOut:
+    async def test_each_calendar_pulls_its_own_events(self, db_session, integration, mock_caldav):
+        remote = {"https://cal/home": [_event("a", 2)], "https://cal/work": [_event("b", 3)]}
+        mock_caldav.fetch_events.side_effect = lambda url, s, e: remote[url]
+
+        results = await _pull_all(db_session, integration)
+
+        assert [r["seen_external_ids"] for r in results] == [["a"], ["b"]]
+        assert [r["stats"]["created"] for r in results] == [1, 1]
+        rows = (await db_session.execute(
+            select(CalendarEvent.external_id, Calendar.name)
+            .join(Calendar, CalendarEvent.calendar_id == Calendar.id)
+            .order_by(CalendarEvent.external_id)
+        )).all()
+        assert [tuple(r) for r in rows] == [("a", "Home"), ("b", "Work")]
+
+    async def test_fetch_failure_raises_for_retry(self, db_session, integration, mock_caldav):
+        mock_caldav.fetch_events.side_effect = ConnectionError("iCloud 503")
+        calendar_id = (await get_calendar_ids(db_session, integration.id))[0]
+
+        with pytest.raises(ConnectionError):
+            await pull_calendar_from_icloud(db_session, integration.id, calendar_id, START, END)
+
+
+class TestCalendarFanIn:
+    async def test_merges_stats_and_detects_deletions(self, db_session, integration, mock_caldav):
+        mock_caldav.fetch_events.side_effect = lambda url, s, e: (
+            [_event("a", 2), _event("gone", 4)] if url.endswith("home") else []
+        )
+        await _pull_all(db_session, integration)
+
+        mock_caldav.fetch_events.side_effect = lambda url, s, e: (
+            [_event("a", 2)] if url.endswith("home") else [_event("b", 3)]
+        )
+        results = await _pull_all(db_session, integration)
+        stats = await finalize_calendar_pulls(db_session, integration.id, results, START, END)
+
+        # "a" has no LAST-MODIFIED, so it is re-applied rather than skipped
+        assert stats == {"created": 1, "updated": 1, "deleted": 1, "skipped": 0, "errors": 0}
+        ids = (await db_session.execute(
+            select(CalendarEvent.external_id).order_by(CalendarEvent.external_id)
+        )).scalars().all()
+        assert ids == ["a", "b"]
+
+    async def test_failed_calendar_skips_deletion_detection(
+        self, db_session, integration, mock_caldav
+    ):
+        mock_caldav.fetch_events.side_effect = lambda url, s, e: (
+            [_event("work-event", 5)] if url.endswith("work") else []
+        )
+        await _pull_all(db_session, integration)
+
+        # Work calendar now fails for good; its event must survive.
+        home_id, _ = await get_calendar_ids(db_session, integration.id)
+        home = await pull_calendar_from_icloud(db_session, integration.id, home_id, START, END)
+        stats = await finalize_calendar_pulls(
+            db_session, integration.id, [home, {"error": "iCloud 503"}], START, END
+        )
+
+        assert stats["errors"] == 1
+        assert stats["deleted"] == 0
+        assert (await db_session.execute(select(CalendarEvent))).scalars().first() is not None
@@ -0,0 +1,173 @@
+"""Integration tests for ETag / If-None-Match on the polled collection routes.
+
+Versions come from the collection_versions rows that the table triggers bump,
+so these tests also cover the triggers built by metadata.create_all.
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest_asyncio
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud_items, crud_meal_entries, schemas
+from app.models import (
+    CollectionVersion,
+    FamilyMember,
+    Item,
+    MealEntry,
+    MealSlotType,
+    Task,
+    meal_entry_participants,
+)
+from app.utils.conditional_get import get_versions
+
+
+class TestConditionalGet:
+    async def test_200_carries_weak_etag(self, client, test_task):
+        response = await client.get("/tasks/")
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    async def test_matching_etag_is_304_without_reading_the_collection(
+        self, client, db_session, test_engine, test_task,
+    ):
+        etag = (await client.get("/tasks/")).headers["ETag"]
+        db_session.expunge_all()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            response = await client.get("/tasks/", headers={"If-None-Match": etag})
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert not [s for s in statements if "FROM tasks" in s]
+
+    async def test_write_changes_the_etag(self, client, test_task, test_list, test_family_member):
+        etag = (await client.get("/tasks/")).headers["ETag"]
+        created = await client.post("/tasks/", json={
+            "title": "Buy groceries", "list_id": test_list.id, "assigned_to": test_family_member.id,
+        })
+        assert created.status_code == 201
+
+        response = await client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    async def test_dependent_table_write_changes_the_etag(
+        self, client, test_recipe, test_meal_slot_dinner,
+    ):
+        """Planning a meal bumps items.usage_count, which /items reports."""
+        etag = (await client.get("/items/")).headers["ETag"]
+        with patch("app.tasks.sync_shopping_list_add.delay"):
+            await client.post("/meal-entries/", json={
+                "date": date.today().isoformat(),
+                "meal_slot_type_id": test_meal_slot_dinner.id,
+                "item_id": test_recipe.id,
+            })
+        response = await client.get("/items/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    async def test_stale_or_foreign_etag_gets_full_response(self, client, test_task):
+        response = await client.get("/tasks/", headers={"If-None-Match": 'W/"0.0", "abc"'})
+        assert response.status_code == 200
+
+
+class TestVersionTriggers:
+    async def test_statement_bumps_once_and_empty_update_not_at_all(self, db_session):
+        before = (await get_versions(db_session, ["family_members"]))["family_members"]
+
+        # One multi-row INSERT statement
+        await db_session.execute(insert(FamilyMember.__table__).values([
+            {"name": f"Member {i}", "is_system": False} for i in range(3)
+        ]))
+        assert (await get_versions(db_session, ["family_members"]))["family_members"] == before + 1
+
+        await db_session.execute(update(FamilyMember).where(FamilyMember.id == -1).values(name="x"))
+        assert (await get_versions(db_session, ["family_members"]))["family_members"] == before + 1
+
+    async def test_unwritten_table_is_version_zero(self, db_session):
+        assert await get_versions(db_session, ["tasks"]) == {"tasks": 0}
+        await db_session.execute(update(Task).values(priority=1))
+        assert await get_versions(db_session, ["tasks"]) == {"tasks": 0}
+
+
+@pytest_asyncio.fixture
+async def committed_meal(db_session, test_engine):
+    """A slot, two items and a meal on the first one, committed for real so
+    independent connections can write against them. Removed afterwards."""
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        slot = MealSlotType(name="Concurrent dinner", sort_order=0)
+        doomed = Item(name="Doomed", item_type="food_item")
+        planned = Item(name="Planned", item_type="food_item")
+        session.add_all([slot, doomed, planned])
+        await session.flush()
+        session.add(MealEntry(date=date(2026, 3, 2), meal_slot_type_id=slot.id, item_id=doomed.id))
+        await session.commit()
+    try:
+        yield slot, doomed, planned
+    finally:
+        async with test_engine.begin() as conn:
+            entry_ids = select(MealEntry.id).where(MealEntry.meal_slot_type_id == slot.id)
+            await conn.execute(delete(meal_entry_participants).where(
+                meal_entry_participants.c.meal_entry_id.in_(entry_ids)
+            ))
+            await conn.execute(delete(MealEntry).where(MealEntry.id.in_(entry_ids)))
+            await conn.execute(delete(Item).where(Item.id.in_([doomed.id, planned.id])))
+            await conn.execute(delete(MealSlotType).where(MealSlotType.id == slot.id))
+        async with test_engine.begin() as conn:
+            await conn.execute(delete(CollectionVersion))
+
+
+class TestConcurrentWriters:
+    async def test_create_meal_is_not_blocked_by_an_open_item_delete(
+        self, test_engine, committed_meal,
+    ):
+        """soft_delete_item writes items then meal_entries; create_meal_entry
+        writes meal_entries then items. Neither may wait on the other's
+        version bump while the other's transaction is still open."""
+        slot, doomed, planned = committed_meal
+        release = asyncio.Event()
+
+        async with (
+            AsyncSession(test_engine, expire_on_commit=False) as deleting,
+            AsyncSession(test_engine, expire_on_commit=False) as creating,
+        ):
+            before = await get_versions(creating, ["items", "meal_entries"])
+            await creating.rollback()
+
+            real_commit = deleting.commit
+
+            async def held_commit():
+                await release.wait()
+                await real_commit()
+
+            with patch.object(deleting, "commit", side_effect=held_commit):
+                delete_task = asyncio.create_task(crud_items.soft_delete_item(deleting, doomed.id))
+                await asyncio.sleep(0.2)
+                assert not delete_task.done(), "delete should be parked before its commit"
+
+                created = await asyncio.wait_for(
+                    crud_meal_entries.create_meal_entry(creating, schemas.MealEntryCreate(
+                        date=date(2026, 3, 3), meal_slot_type_id=slot.id, item_id=planned.id,
+                    )),
+                    timeout=5,
+                )
+                assert created.item_id == planned.id
+
+                release.set()
+                assert await asyncio.wait_for(delete_task, timeout=5) is not None
+
+            after = await get_versions(creating, ["items", "meal_entries"])
+        assert after["items"] == before["items"] + 2
+        assert after["meal_entries"] == before["meal_entries"] + 2
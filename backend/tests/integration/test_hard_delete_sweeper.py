@@ -11,12 +11,26 @@ against the test session. The Celery task wrapper (`tasks.py`) is a thin
 — running it through Celery's broker would require a full worker in the test
 environment, which isn't worth the complexity for a sync wrapper.
 """
+import logging
 from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy import select
 
 
+async def _expired_items(db_session, count):
+    from app.models import Item
+
+    deleted_at = datetime.utcnow() - timedelta(hours=25)
+    items = [
+        Item(name=f"Expired {i}", item_type="food_item", deleted_at=deleted_at)
+        for i in range(count)
+    ]
+    db_session.add_all(items)
+    await db_session.commit()
+    return [item.id for item in items]
+
+
 class TestHardDeleteSweeper:
     async def test_no_op_when_no_items_expired(self, db_session, test_recipe):
         """No soft-deleted items → helper returns zero counts, nothing removed."""
@@ -136,3 +150,41 @@ class TestHardDeleteSweeper:
             select(MealEntry).where(MealEntry.id == entry_id)
         )).scalar_one_or_none()
         assert still_there is not None
+
+    async def test_sweeps_backlog_in_chunks(self, db_session, caplog):
+        """A backlog larger than the chunk size is swept in several short
+        transactions, each logging its progress."""
+        from app.crud_items import hard_delete_expired_soft_deletes_async
+        from app.models import Item
+
+        ids = await _expired_items(db_session, 5)
+        caplog.set_level(logging.INFO, logger="app.crud_items")
+
+        counts = await hard_delete_expired_soft_deletes_async(db_session, chunk_size=2)
+        assert counts["items_deleted"] == 5
+
+        chunks = [r for r in caplog.records if r.getMessage() == "hard_delete.chunk"]
+        assert [(r.sweep, r.deleted, r.total) for r in chunks] == [
+            ("items", 2, 2), ("items", 2, 4), ("items", 1, 5),
+        ]
+        remaining = (await db_session.execute(select(Item.id).where(Item.id.in_(ids)))).all()
+        assert remaining == []
+
+    async def test_spent_time_budget_leaves_the_rest_for_next_run(self, db_session, caplog):
+        """Once the budget is spent no new chunk starts; the next run resumes."""
+        from app.crud_items import hard_delete_expired_soft_deletes_async
+        from app.models import Item
+
+        ids = await _expired_items(db_session, 3)
+        caplog.set_level(logging.INFO, logger="app.crud_items")
+
+        counts = await hard_delete_expired_soft_deletes_async(
+            db_session, chunk_size=2, time_budget=timedelta(0),
+        )
+        assert counts["items_deleted"] == 2
+        assert any("budget" in r.getMessage() for r in caplog.records if r.levelno == logging.WARNING)
+        remaining = (await db_session.execute(select(Item.id).where(Item.id.in_(ids)))).scalars().all()
+        assert remaining == ids[2:]
+
+        counts = await hard_delete_expired_soft_deletes_async(db_session, chunk_size=2)
+        assert counts["items_deleted"] == 1
@@ -0,0 +1,157 @@
+"""Integration tests for /ingredient-aliases and the shopping-list re-bucket job."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models import FoodItemDetail, Item, ShoppingItemSource, Task
+from app.services import ingredient_aliases
+from app.services.shopping_sync import rebucket_shopping_list, sync_meal_to_shopping_list
+
+
+@pytest.fixture(autouse=True)
+def isolate_alias_dictionary():
+    """Keep each test's aliases out of the process-wide dictionary."""
+    with patch("app.crud_ingredient_aliases.submit_once") as mock_submit:
+        yield mock_submit
+    ingredient_aliases._aliases = {}
+    ingredient_aliases._loaded_at = None
+
+
+class TestCreateIngredientAlias:
+    async def test_stores_canonicalized_names_and_schedules_rebucket(
+        self, client, isolate_alias_dictionary,
+    ):
+        response = await client.post(
+            "/ingredient-aliases/", json={"alias": "Scallions", "canonical_name": "Green Onions"}
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["alias"], data["canonical_name"]) == ("scallion", "green onion")
+
+        assert ingredient_aliases.resolve("scallion") == "green onion"
+        isolate_alias_dictionary.assert_called_once()
+        assert isolate_alias_dictionary.call_args.args[1] == "shopping:rebucket"
+
+    async def test_duplicate_alias_conflicts(self, client):
+        payload = {"alias": "scallion", "canonical_name": "green onion"}
+        assert (await client.post("/ingredient-aliases/", json=payload)).status_code == 201
+        response = await client.post(
+            "/ingredient-aliases/", json={"alias": "Scallions", "canonical_name": "leek"}
+        )
+        assert response.status_code == 409
+
+    async def test_self_alias_rejected(self, client):
+        response = await client.post(
+            "/ingredient-aliases/", json={"alias": "Tomatoes", "canonical_name": "tomato"}
+        )
+        assert response.status_code == 400
+
+    async def test_aliases_stay_one_hop(self, client):
+        await client.post("/ingredient-aliases/", json={"alias": "scallion", "canonical_name": "spring onion"})
+        await client.post("/ingredient-aliases/", json={"alias": "spring onion", "canonical_name": "green onion"})
+        await client.post("/ingredient-aliases/", json={"alias": "salad onion", "canonical_name": "spring onion"})
+
+        response = await client.get("/ingredient-aliases/")
+        assert {a["alias"]: a["canonical_name"] for a in response.json()} == {
+            "scallion": "green onion",
+            "spring onion": "green onion",
+            "salad onion": "green onion",
+        }
+
+
+class TestDeleteIngredientAlias:
+    async def test_delete_and_missing(self, client):
+        created = (await client.post(
+            "/ingredient-aliases/", json={"alias": "scallion", "canonical_name": "green onion"}
+        )).json()
+
+        response = await client.delete(f"/ingredient-aliases/{created['id']}")
+        assert response.status_code == 200
+        assert ingredient_aliases.resolve("scallion") == "scallion"
+
+        response = await client.delete(f"/ingredient-aliases/{created['id']}")
+        assert response.status_code == 404
+
+
+async def _plan_and_sync(client, db_session, slot_id, names):
+    """Plan one food item per name and sync each onto the linked list."""
+    with patch("app.tasks.sync_shopping_list_add.delay"):
+        for name in names:
+            item = Item(name=name, item_type="food_item", is_favorite=False)
+            db_session.add(item)
+            await db_session.flush()
+            db_session.add(FoodItemDetail(
+                item_id=item.id, category="produce", shopping_quantity=1, shopping_unit="bunch",
+            ))
+            await db_session.commit()
+            resp = await client.post("/meal-entries/", json={
+                "date": date.today().isoformat(),
+                "meal_slot_type_id": slot_id,
+                "item_id": item.id,
+            })
+            await sync_meal_to_shopping_list(db_session, resp.json()["id"])
+
+
+class TestRebucketShoppingList:
+    @pytest.fixture(autouse=True)
+    async def linked_list(self, db_session, test_list, test_app_settings, test_family_member):
+        test_app_settings.mealboard_shopping_list_id = test_list.id
+        await db_session.commit()
+
+    async def _rows(self, db_session, list_id):
+        result = await db_session.execute(
+            select(Task).where(Task.list_id == list_id).order_by(Task.id)
+        )
+        return result.scalars().all()
+
+    async def test_new_alias_merges_existing_rows(
+        self, client, db_session, test_list, test_meal_slot_dinner,
+    ):
+        await _plan_and_sync(client, db_session, test_meal_slot_dinner.id, ["Scallions", "Green Onions"])
+        rows = await self._rows(db_session, test_list.id)
+        assert sorted(t.aggregation_key_name for t in rows) == ["green onion", "scallion"]
+
+        resp = await client.post(
+            "/ingredient-aliases/", json={"alias": "scallions", "canonical_name": "green onions"}
+        )
+        assert resp.status_code == 201
+        assert await rebucket_shopping_list(db_session) == 1
+
+        rows = await self._rows(db_session, test_list.id)
+        assert [(t.aggregation_source, t.aggregation_key_name, t.aggregation_base_quantity) for t in rows] == [
+            ("mealboard_auto", "green onion", 2),
+        ]
+        assert rows[0].title.startswith("2 bunch ")
+        sources = await db_session.execute(
+            select(ShoppingItemSource.task_id).where(ShoppingItemSource.task_id == rows[0].id)
+        )
+        assert len(sources.all()) == 2
+
+    async def test_checked_off_rows_do_not_come_back(
+        self, client, db_session, test_list, test_meal_slot_dinner,
+    ):
+        """The bought scallions' meal entry is still synced, but the rebuild
+        only reuses the auto rows' own sources — no unchecked duplicate."""
+        await _plan_and_sync(client, db_session, test_meal_slot_dinner.id, ["Scallions", "Green Onions"])
+        scallion = next(
+            t for t in await self._rows(db_session, test_list.id) if t.aggregation_key_name == "scallion"
+        )
+        resp = await client.patch(f"/tasks/{scallion.id}", json={"completed": True})
+        assert resp.status_code == 200
+
+        await client.post(
+            "/ingredient-aliases/", json={"alias": "scallions", "canonical_name": "green onions"}
+        )
+        assert await rebucket_shopping_list(db_session) == 1
+
+        rows = await self._rows(db_session, test_list.id)
+        assert [
+            (t.completed, t.aggregation_source, t.aggregation_key_name, t.aggregation_base_quantity)
+            for t in rows
+        ] == [
+            (True, None, "scallion", 1),
+            (False, "mealboard_auto", "green onion", 1),
+        ]
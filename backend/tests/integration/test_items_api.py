@@ -7,12 +7,22 @@ Replaces the legacy /recipes and /food-items test files. Covers:
     - Patch (both types)
     - Soft-delete + undo flow (Expansion B)
     - FK RESTRICT behavior when meal_entries reference an item
+    - Redis read-through cache for GET /items and GET /items/{id}
 
 These tests hit real FastAPI endpoints with a real PostgreSQL database via the
 shared `client` fixture from `conftest.py`.
 """
 
+import logging
+from datetime import date, timedelta
+from unittest.mock import patch
+
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event, update
+
+from app import crud_items
+from app.models import Item
 
 
 # =============================================================================
@@ -71,6 +81,208 @@ class TestListItems:
         assert data[0]["name"] == "Favorite Recipe"
 
 
+class TestListItemsPaging:
+    async def _seed(self, client, count=5):
+        for i in range(count):
+            response = await client.post("/items/", json={
+                "name": f"Recipe {i}",
+                "item_type": "recipe",
+                "recipe_detail": {
+                    "description": f"Dish {i}",
+                    "ingredients": [{"name": "salt", "quantity": 1, "unit": "tsp"}],
+                    "instructions": "Cook it well. " * 50,
+                },
+            })
+            assert response.status_code == 201, response.text
+
+    async def test_cursor_walks_every_item_once(self, client, test_food_item):
+        await self._seed(client)
+        names, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get("/items/", params=params)
+            assert response.status_code == 200
+            pages += 1
+            names += [it["name"] for it in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        assert pages == 3
+        assert names == ["Banana"] + [f"Recipe {i}" for i in range(5)]
+
+    async def test_paged_rows_are_summaries_unless_expanded(self, client):
+        await self._seed(client, count=1)
+        response = await client.get("/items/", params={"limit": 10})
+        detail = response.json()[0]["recipe_detail"]
+        assert detail["description"] == "Dish 0"
+        assert "ingredients" not in detail and "instructions" not in detail
+
+        response = await client.get("/items/", params={"limit": 10, "expand": "details"})
+        detail = response.json()[0]["recipe_detail"]
+        assert detail["ingredients"][0]["name"] == "salt"
+        assert detail["instructions"].startswith("Cook it well.")
+
+        # Unpaged requests keep the full shape
+        response = await client.get("/items/")
+        assert "instructions" in response.json()[0]["recipe_detail"]
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_summary_query_skips_heavy_columns(self, client, db_session, test_engine):
+        await self._seed(client, count=1)
+        db_session.expunge_all()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            response = await client.get("/items/", params={"limit": 10})
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+        assert response.status_code == 200
+        detail_queries = [s for s in statements if "FROM recipe_details" in s]
+        assert len(detail_queries) == 1
+        assert "instructions" not in detail_queries[0]
+        assert "ingredients" not in detail_queries[0]
+
+    async def test_invalid_cursor_returns_400(self, client):
+        response = await client.get("/items/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+
+class TestListItemsQueries:
+    """Regression guard: loading items must not pull their meal history."""
+
+    async def test_list_emits_only_item_and_detail_queries(
+        self, client, db_session, test_engine, test_meal_entry, test_recipe, test_food_item,
+    ):
+        # Start from a cold identity map so every loader actually runs
+        db_session.expunge_all()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(" ".join(statement.split()))
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            response = await client.get("/items/")
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+        assert response.status_code == 200
+
+        item_queries = [
+            s for s in statements
+            if s.startswith("SELECT") and any(
+                t in s for t in ("FROM items", "FROM recipe_details", "FROM food_item_details", "FROM meal_entries")
+            )
+        ]
+        assert len(item_queries) == 3, item_queries
+        assert "FROM items" in item_queries[0]
+        assert sum("FROM recipe_details" in s for s in item_queries) == 1
+        assert sum("FROM food_item_details" in s for s in item_queries) == 1
+        # meal_entry_count is the items.usage_count column — no meal_entries read
+        assert not [s for s in item_queries if "FROM meal_entries" in s]
+        recipe_row = next(i for i in response.json() if i["id"] == test_recipe.id)
+        assert recipe_row["meal_entry_count"] == 1
+
+
+# =============================================================================
+# GET /items/search — full-text search
+# =============================================================================
+
+
+class TestSearchItems:
+    async def _create(self, client, payload):
+        response = await client.post("/items/", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    async def _seed(self, client):
+        tikka = await self._create(client, {
+            "name": "Chicken Tikka Masala",
+            "item_type": "recipe",
+            "tags": ["indian", "weeknight"],
+            "recipe_detail": {
+                "description": "Creamy tomato & cream curry with warm spices",
+                "ingredients": [
+                    {"name": "chicken thighs", "quantity": 2, "unit": "lb"},
+                    {"name": "garam masala", "quantity": 2, "unit": "tbsp"},
+                ],
+            },
+        })
+        soup = await self._create(client, {
+            "name": "Tomato Soup",
+            "item_type": "recipe",
+            "tags": ["vegetarian"],
+            "recipe_detail": {
+                "description": "Simple soup.",
+                "ingredients": [{"name": "tomatoes", "quantity": 6, "unit": None}],
+            },
+        })
+        banana = await self._create(client, {
+            "name": "Banana",
+            "item_type": "food_item",
+            "food_item_detail": {"category": "fruit"},
+        })
+        return tikka, soup, banana
+
+    async def test_name_prefix_match_with_highlight(self, client):
+        tikka, _, _ = await self._seed(client)
+        response = await client.get("/items/search", params={"q": "chick"})
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["item"]["id"] for r in results] == [tikka]
+        assert results[0]["name_highlight"] == "<mark>Chicken</mark> Tikka Masala"
+        assert results[0]["item"]["recipe_detail"] is not None
+
+    async def test_matches_tags_ingredients_and_description(self, client):
+        tikka, soup, _ = await self._seed(client)
+
+        response = await client.get("/items/search", params={"q": "indian"})
+        assert [r["item"]["id"] for r in response.json()] == [tikka]
+
+        response = await client.get("/items/search", params={"q": "garam"})
+        assert [r["item"]["id"] for r in response.json()] == [tikka]
+
+        # Name match (weight A) outranks description match (weight C)
+        response = await client.get("/items/search", params={"q": "tomato"})
+        results = response.json()
+        assert [r["item"]["id"] for r in results] == [soup, tikka]
+        assert results[0]["rank"] > results[1]["rank"]
+        # Description highlight is HTML-escaped around the <mark> tags
+        assert results[1]["description_highlight"] == (
+            "Creamy <mark>tomato</mark> &amp; cream curry with warm spices"
+        )
+
+    async def test_misspelled_name_matches_by_trigram(self, client, db_session):
+        crud_items.reset_trigram_check()
+        if not await crud_items._has_trigram(db_session):
+            pytest.skip("server has no pg_trgm")
+        tikka, _, _ = await self._seed(client)
+
+        # No word starts with "chickn", so only the trigram match can find it
+        response = await client.get("/items/search", params={"q": "chickn"})
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["item"]["id"] for r in results] == [tikka]
+        assert results[0]["rank"] > 0
+
+    async def test_deleted_items_and_operator_input(self, client):
+        tikka, _, _ = await self._seed(client)
+        response = await client.delete(f"/items/{tikka}")
+        assert response.status_code == 200
+
+        response = await client.get("/items/search", params={"q": "chicken"})
+        assert response.json() == []
+        # tsquery syntax in the input is ignored, not a 500
+        response = await client.get("/items/search", params={"q": "!&|:*"})
+        assert response.status_code == 200
+        assert response.json() == []
+
+
 # =============================================================================
 # GET /items/{id} — single
 # =============================================================================
@@ -363,6 +575,142 @@ class TestSoftDeleteFlow:
         assert test_meal_entry.id not in visible_ids
 
 
+# =============================================================================
+# items.usage_count / last_used_on (meal entry writes: test_meal_entries_api.py)
+# =============================================================================
+
+
+class TestItemUsageCounters:
+    async def test_item_soft_delete_and_restore(self, client, test_recipe, test_meal_entry):
+        token = (await client.delete(f"/items/{test_recipe.id}")).json()["undo_token"]
+        assert (await client.get(f"/items/{test_recipe.id}")).status_code == 404
+        response = await client.post(f"/items/{test_recipe.id}/undo", json={"undo_token": token})
+        assert response.status_code == 200
+        assert response.json()["meal_entry_count"] == 1
+
+    async def test_reconcile_repairs_drift(self, db_session, test_recipe, test_food_item, test_meal_entry):
+        await db_session.execute(
+            update(Item).where(Item.id.in_([test_recipe.id, test_food_item.id]))
+            .values(usage_count=7, last_used_on=None)
+        )
+        await db_session.commit()
+
+        assert await crud_items.reconcile_usage_counts(db_session) == 2
+        db_session.expunge_all()
+        recipe = await crud_items.get_item(db_session, test_recipe.id)
+        food = await crud_items.get_item(db_session, test_food_item.id)
+        assert (recipe.usage_count, recipe.last_used_on) == (1, test_meal_entry.date)
+        assert (food.usage_count, food.last_used_on) == (0, None)
+        assert await crud_items.reconcile_usage_counts(db_session) == 0
+
+    async def test_sort_by_usage(self, client, test_recipe, test_food_item, test_meal_entry):
+        response = await client.get("/items/", params={"sort": "usage"})
+        assert [it["id"] for it in response.json()] == [test_recipe.id, test_food_item.id]
+
+        first = await client.get("/items/", params={"sort": "usage", "limit": 1})
+        assert [it["id"] for it in first.json()] == [test_recipe.id]
+        second = await client.get("/items/", params={
+            "sort": "usage", "limit": 1, "cursor": first.headers["X-Next-Cursor"],
+        })
+        assert [it["id"] for it in second.json()] == [test_food_item.id]
+        assert "X-Next-Cursor" not in second.headers
+
+
+# =============================================================================
+# Item cache (crud_items.get_item_json / list_items_json)
+# =============================================================================
+
+
+def _cache_outcomes(caplog) -> list[str]:
+    return [r.outcome for r in caplog.records if r.getMessage() == "item_cache.lookup"]
+
+
+class TestItemCache:
+    async def test_repeat_read_is_a_hit_without_item_queries(
+        self, client, db_session, test_engine, test_recipe, caplog,
+    ):
+        caplog.set_level(logging.INFO, logger="app.crud_items")
+        first = await client.get(f"/items/{test_recipe.id}")
+        db_session.expunge_all()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            second = await client.get(f"/items/{test_recipe.id}")
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert _cache_outcomes(caplog) == ["miss", "hit"]
+        assert not [s for s in statements if "FROM items" in s]
+
+    async def test_list_is_cached_per_filter(self, client, test_recipe, test_food_item, caplog):
+        caplog.set_level(logging.INFO, logger="app.crud_items")
+        everything = (await client.get("/items/")).json()
+        recipes = (await client.get("/items/", params={"type": "recipe"})).json()
+        assert (await client.get("/items/")).json() == everything
+        assert [it["id"] for it in recipes] == [test_recipe.id]
+        assert _cache_outcomes(caplog) == ["miss", "miss", "hit"]
+
+    async def test_writes_invalidate(self, client, test_recipe):
+        path = f"/items/{test_recipe.id}"
+        await client.get(path)
+        await client.get("/items/")
+
+        await client.patch(path, json={"name": "Renamed"})
+        assert (await client.get(path)).json()["name"] == "Renamed"
+
+        token = (await client.delete(path)).json()["undo_token"]
+        assert (await client.get(path)).status_code == 404
+        assert test_recipe.id not in [it["id"] for it in (await client.get("/items/")).json()]
+
+        await client.post(f"{path}/undo", json={"undo_token": token})
+        assert (await client.get(path)).status_code == 200
+
+        created = await client.post("/items/", json={
+            "name": "Bananas", "item_type": "food_item",
+            "food_item_detail": {"category": "Produce"},
+        })
+        assert created.json()["id"] in [it["id"] for it in (await client.get("/items/")).json()]
+
+    async def test_redis_outage_falls_through_to_postgres(self, client, test_recipe, caplog):
+        caplog.set_level(logging.INFO, logger="app.crud_items")
+        with patch("redis.asyncio.Redis.get", side_effect=RedisConnectionError("down")):
+            response = await client.get(f"/items/{test_recipe.id}")
+        assert response.status_code == 200
+        assert response.json()["name"] == test_recipe.name
+        assert _cache_outcomes(caplog) == ["error"]
+
+
+# =============================================================================
+# /items/parse-ingredients — local parsing of pasted ingredient lines
+# =============================================================================
+
+
+class TestParseIngredientsEndpoint:
+    async def test_parses_pasted_lines(self, client):
+        response = await client.post("/items/parse-ingredients", json={
+            "text": "2 lb chicken thighs\n\n1 ½ cups rice\nJuice of 2 limes\n",
+        })
+        assert response.status_code == 200
+        lines = response.json()["ingredients"]
+        assert [(l["name"], l["quantity"], l["unit"]) for l in lines] == [
+            ("chicken thighs", 2, "lb"),
+            ("rice", 1.5, "cup"),
+            ("Juice of 2 limes", None, None),
+        ]
+        assert lines[0]["confidence"] == 1
+        assert lines[2]["confidence"] < 0.8
+
+    async def test_empty_text_returns_422(self, client):
+        response = await client.post("/items/parse-ingredients", json={"text": ""})
+        assert response.status_code == 422
+
+
 # =============================================================================
 # /items/suggest-icon — AI-backed emoji suggestion (upgraded from 501 stub)
 # =============================================================================
@@ -9,6 +9,10 @@ import pytest
 from datetime import date, timedelta
 from unittest.mock import patch
 
+from sqlalchemy import event
+
+from app.utils.task_dedupe import mark_consumed
+
 
 # Mock Celery tasks to avoid dispatching real background tasks during tests
 @pytest.fixture(autouse=True)
@@ -249,6 +253,48 @@ class TestDeleteMealEntry:
         assert response.status_code == 404
 
 
+class TestItemUsageCounters:
+    """Meal entry writes keep items.usage_count / last_used_on current."""
+
+    async def _plan(self, client, item_id, slot_id, on):
+        response = await client.post("/meal-entries/", json={
+            "date": on.isoformat(), "meal_slot_type_id": slot_id, "item_id": item_id,
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    async def _usage(self, client, item_id):
+        body = (await client.get(f"/items/{item_id}")).json()
+        return body["meal_entry_count"], body["last_used_on"]
+
+    async def test_create_delete_and_undo_adjust_counters(
+        self, client, test_recipe, test_meal_slot_dinner,
+    ):
+        today = date.today()
+        assert await self._usage(client, test_recipe.id) == (0, None)
+
+        await self._plan(client, test_recipe.id, test_meal_slot_dinner.id, today)
+        later = await self._plan(client, test_recipe.id, test_meal_slot_dinner.id, today + timedelta(days=3))
+        assert await self._usage(client, test_recipe.id) == (2, (today + timedelta(days=3)).isoformat())
+
+        token = (await client.delete(f"/meal-entries/{later}")).json()["undo_token"]
+        assert await self._usage(client, test_recipe.id) == (1, today.isoformat())
+
+        response = await client.post(f"/meal-entries/{later}/undo", json={"undo_token": token})
+        assert response.status_code == 200
+        assert await self._usage(client, test_recipe.id) == (2, (today + timedelta(days=3)).isoformat())
+
+    async def test_repointing_an_entry_moves_its_count(
+        self, client, test_recipe, test_food_item, test_meal_slot_dinner,
+    ):
+        entry_id = await self._plan(client, test_recipe.id, test_meal_slot_dinner.id, date.today())
+        response = await client.patch(f"/meal-entries/{entry_id}", json={"item_id": test_food_item.id})
+        assert response.status_code == 200
+
+        assert await self._usage(client, test_recipe.id) == (0, None)
+        assert await self._usage(client, test_food_item.id) == (1, date.today().isoformat())
+
+
 class TestUndoMealEntry:
     """Tests for POST /meal-entries/{id}/undo."""
 
@@ -433,3 +479,191 @@ class TestItemFKRestrict:
         with pytest.raises(IntegrityError):
             await db_session.commit()
         await db_session.rollback()
+
+
+@pytest.fixture
+def mock_drain():
+    with patch("app.tasks.sync_pending_shopping_entries.delay") as drain:
+        yield drain
+
+
+MONDAY = date(2026, 3, 2)
+
+
+class TestBulkCreateMealEntries:
+    """Tests for POST /meal-entries/bulk."""
+
+    async def test_creates_batch_and_queues_one_drain(
+        self, client, test_recipe, test_meal_slot_types, test_family_member,
+        test_system_member, mock_celery_tasks, mock_drain,
+    ):
+        dinner, lunch = test_meal_slot_types[2], test_meal_slot_types[1]
+        response = await client.post("/meal-entries/bulk", json={"entries": [
+            {"date": MONDAY.isoformat(), "meal_slot_type_id": dinner.id, "item_id": test_recipe.id},
+            {"date": (MONDAY + timedelta(days=1)).isoformat(), "meal_slot_type_id": dinner.id,
+             "item_id": test_recipe.id, "participant_ids": [test_family_member.id]},
+            {"date": MONDAY.isoformat(), "meal_slot_type_id": lunch.id, "custom_meal_name": "Leftovers"},
+        ]})
+        assert response.status_code == 201, response.text
+        data = response.json()
+        assert [(e["date"], e["meal_slot_type_id"]) for e in data] == [
+            (MONDAY.isoformat(), lunch.id),
+            (MONDAY.isoformat(), dinner.id),
+            ((MONDAY + timedelta(days=1)).isoformat(), dinner.id),
+        ]
+        everyone = sorted([test_family_member.id, test_system_member.id])
+        assert sorted(p["id"] for p in data[1]["participants"]) == everyone
+        assert [p["id"] for p in data[2]["participants"]] == [test_family_member.id]
+        assert all(e["shopping_sync_status"] == "pending" for e in data)
+
+        mock_drain.assert_called_once_with()
+        mock_celery_tasks["add"].assert_not_called()
+        item = (await client.get(f"/items/{test_recipe.id}")).json()
+        assert item["meal_entry_count"] == 2
+
+    async def test_one_insert_statement_per_table(
+        self, client, test_engine, test_recipe, test_meal_slot_dinner, test_family_member, mock_drain,
+    ):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            response = await client.post("/meal-entries/bulk", json={"entries": [
+                {"date": (MONDAY + timedelta(days=d)).isoformat(),
+                 "meal_slot_type_id": test_meal_slot_dinner.id, "item_id": test_recipe.id}
+                for d in range(7)
+            ]})
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+        assert response.status_code == 201
+        assert len([s for s in statements if s.startswith("INSERT INTO meal_entries ")]) == 1
+        assert len([s for s in statements if s.startswith("INSERT INTO meal_entry_participants")]) == 1
+
+    @pytest.mark.parametrize("bad", ["slot", "item", "member"])
+    async def test_unknown_reference_rejects_whole_batch(
+        self, client, test_recipe, test_meal_slot_dinner, mock_drain, bad,
+    ):
+        entry = {"date": MONDAY.isoformat(), "meal_slot_type_id": test_meal_slot_dinner.id,
+                 "item_id": test_recipe.id}
+        if bad == "slot":
+            entry["meal_slot_type_id"] = 9999
+        elif bad == "item":
+            entry["item_id"] = 9999
+        else:
+            entry["participant_ids"] = [9999]
+        good = {"date": MONDAY.isoformat(), "meal_slot_type_id": test_meal_slot_dinner.id,
+                "custom_meal_name": "Fine"}
+
+        response = await client.post("/meal-entries/bulk", json={"entries": [good, entry]})
+        assert response.status_code == 400
+        assert "9999" in response.json()["detail"]
+        listed = await client.get("/meal-entries/", params={
+            "start_date": MONDAY.isoformat(), "end_date": MONDAY.isoformat(),
+        })
+        assert listed.json() == []
+        mock_drain.assert_not_called()
+
+    async def test_rejects_empty_batch(self, client):
+        response = await client.post("/meal-entries/bulk", json={"entries": []})
+        assert response.status_code == 422
+
+
+class TestCopyWeek:
+    """Tests for POST /meal-entries/copy-week."""
+
+    async def test_copies_entries_and_participants(
+        self, client, test_recipe, test_meal_slot_dinner, test_family_member, mock_drain,
+    ):
+        created = await client.post("/meal-entries/bulk", json={"entries": [
+            {"date": MONDAY.isoformat(), "meal_slot_type_id": test_meal_slot_dinner.id,
+             "item_id": test_recipe.id, "participant_ids": [test_family_member.id]},
+            {"date": (MONDAY + timedelta(days=4)).isoformat(), "meal_slot_type_id": test_meal_slot_dinner.id,
+             "custom_meal_name": "Pizza night", "notes": "order early", "participant_ids": []},
+        ]})
+        await client.patch(f"/meal-entries/{created.json()[0]['id']}", json={"was_cooked": True})
+        # A real drain releases its dedupe key when it starts
+        mark_consumed("shopping:drain")
+        mock_drain.reset_mock()
+
+        next_monday = MONDAY + timedelta(days=7)
+        response = await client.post("/meal-entries/copy-week", json={
+            "source_start": MONDAY.isoformat(), "target_start": next_monday.isoformat(),
+        })
+        assert response.status_code == 201, response.text
+        copies = response.json()
+        assert [(c["date"], c["item_id"], c["custom_meal_name"]) for c in copies] == [
+            (next_monday.isoformat(), test_recipe.id, None),
+            ((next_monday + timedelta(days=4)).isoformat(), None, "Pizza night"),
+        ]
+        assert [p["id"] for p in copies[0]["participants"]] == [test_family_member.id]
+        assert copies[1]["participants"] == []
+        assert copies[1]["notes"] == "order early"
+        assert copies[0]["was_cooked"] is False
+        mock_drain.assert_called_once_with()
+
+    async def test_empty_source_week_copies_nothing(self, client, mock_drain):
+        response = await client.post("/meal-entries/copy-week", json={
+            "source_start": MONDAY.isoformat(), "target_start": (MONDAY + timedelta(days=7)).isoformat(),
+        })
+        assert response.status_code == 201
+        assert response.json() == []
+        mock_drain.assert_not_called()
+
+    async def test_rejects_copy_onto_itself(self, client):
+        response = await client.post("/meal-entries/copy-week", json={
+            "source_start": MONDAY.isoformat(), "target_start": MONDAY.isoformat(),
+        })
+        assert response.status_code == 400
+
+
+class TestBulkMoveMealEntries:
+    """Tests for PATCH /meal-entries/bulk-move."""
+
+    async def _plan(self, client, slot_id, item_id, days):
+        response = await client.post("/meal-entries/bulk", json={"entries": [
+            {"date": (MONDAY + timedelta(days=d)).isoformat(), "meal_slot_type_id": slot_id, "item_id": item_id}
+            for d in days
+        ]})
+        return [e["id"] for e in response.json()]
+
+    async def test_moves_dates_and_slots(
+        self, client, test_recipe, test_meal_slot_types, mock_drain,
+    ):
+        dinner, lunch = test_meal_slot_types[2], test_meal_slot_types[1]
+        first, second = await self._plan(client, dinner.id, test_recipe.id, [0, 1])
+
+        response = await client.patch("/meal-entries/bulk-move", json={"moves": [
+            {"id": first, "date": (MONDAY + timedelta(days=9)).isoformat(), "meal_slot_type_id": lunch.id},
+            {"id": second, "date": (MONDAY + timedelta(days=2)).isoformat(), "sort_order": 3},
+        ]})
+        assert response.status_code == 200, response.text
+        moved = {e["id"]: e for e in response.json()}
+        assert (moved[first]["date"], moved[first]["meal_slot_type_id"]) == (
+            (MONDAY + timedelta(days=9)).isoformat(), lunch.id,
+        )
+        assert (moved[second]["date"], moved[second]["meal_slot_type_id"], moved[second]["sort_order"]) == (
+            (MONDAY + timedelta(days=2)).isoformat(), dinner.id, 3,
+        )
+        item = (await client.get(f"/items/{test_recipe.id}")).json()
+        assert item["last_used_on"] == (MONDAY + timedelta(days=9)).isoformat()
+
+    async def test_rejects_hidden_or_unknown_entries(
+        self, client, test_recipe, test_meal_slot_dinner, mock_celery_tasks, mock_drain,
+    ):
+        (entry_id,) = await self._plan(client, test_meal_slot_dinner.id, test_recipe.id, [0])
+        await client.delete(f"/meal-entries/{entry_id}")
+        response = await client.patch("/meal-entries/bulk-move", json={"moves": [
+            {"id": entry_id, "date": MONDAY.isoformat()},
+        ]})
+        assert response.status_code == 400
+
+    async def test_rejects_duplicate_moves(self, client, test_recipe, test_meal_slot_dinner, mock_drain):
+        (entry_id,) = await self._plan(client, test_meal_slot_dinner.id, test_recipe.id, [0])
+        response = await client.patch("/meal-entries/bulk-move", json={"moves": [
+            {"id": entry_id, "date": MONDAY.isoformat()},
+            {"id": entry_id, "date": (MONDAY + timedelta(days=1)).isoformat()},
+        ]})
+        assert response.status_code == 400
@@ -0,0 +1,63 @@
+"""The board range query and the per-person filter should hit their indexes.
+
+Seeds a few years of planned meals, then checks the plans Postgres picks for
+the statement the board and GET /meal-entries run.
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.crud_meal_entries import meal_entries_in_range_stmt
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def _plan_indexes(db_session, stmt) -> set[str]:
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    result = await db_session.execute(text("EXPLAIN (FORMAT JSON) " + sql))
+    return _index_names(result.scalar_one()[0]["Plan"])
+
+
+class TestMealEntryRangeIndexes:
+    async def _seed(self, db_session, slot_id, member_ids):
+        await db_session.execute(text("""
+            INSERT INTO meal_entries (date, meal_slot_type_id, custom_meal_name, sort_order, soft_hidden_at)
+            SELECT d::date, :slot, 'Meal', n, CASE WHEN n = 2 THEN now() END
+            FROM generate_series('2023-01-01'::date, '2026-12-31'::date, interval '1 day') d,
+                 generate_series(0, 2) n
+        """), {"slot": slot_id})
+        await db_session.execute(text("""
+            INSERT INTO meal_entry_participants (meal_entry_id, family_member_id)
+            SELECT e.id, m FROM meal_entries e, unnest(CAST(:members AS int[])) m
+            WHERE (e.id + m) % 3 = 0
+        """), {"members": member_ids})
+        await db_session.execute(text("ANALYZE meal_entries"))
+        await db_session.execute(text("ANALYZE meal_entry_participants"))
+        # A test-sized junction table is a handful of pages, which the planner
+        # would rather read whole; rule that out so the index choice shows
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    async def test_week_range_uses_visible_board_index(self, db_session, test_meal_slot_dinner):
+        await self._seed(db_session, test_meal_slot_dinner.id, [])
+        stmt = meal_entries_in_range_stmt(date(2026, 3, 2), date(2026, 3, 8))
+        assert "meal_entries_visible_board_idx" in await _plan_indexes(db_session, stmt)
+
+    async def test_member_filter_uses_participant_member_index(
+        self, db_session, test_meal_slot_dinner, test_family_member, test_system_member,
+    ):
+        await self._seed(
+            db_session, test_meal_slot_dinner.id, [test_family_member.id, test_system_member.id],
+        )
+        stmt = meal_entries_in_range_stmt(
+            date(2026, 3, 2), date(2026, 3, 8), family_member_id=test_family_member.id,
+        )
+        indexes = await _plan_indexes(db_session, stmt)
+        assert "meal_entries_visible_board_idx" in indexes
+        assert "meal_entry_participants_member_idx" in indexes
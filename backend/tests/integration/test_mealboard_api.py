@@ -0,0 +1,122 @@
+"""Integration tests for GET /mealboard/week — the aggregated meal board payload."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture(autouse=True)
+def mock_celery_tasks():
+    with patch("app.tasks.sync_shopping_list_add.delay") as mock_add, \
+         patch("app.tasks.sync_shopping_list_remove.apply_async") as mock_remove:
+        yield {"add": mock_add, "remove": mock_remove}
+
+
+MONDAY = date(2026, 3, 2)
+
+
+async def _plan(client, slot_id, on, **fields):
+    response = await client.post("/meal-entries/", json={
+        "date": on.isoformat(), "meal_slot_type_id": slot_id, **fields,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+class TestMealboardWeek:
+    async def test_requires_start(self, client):
+        response = await client.get("/mealboard/week")
+        assert response.status_code == 422
+
+    async def test_returns_board_with_items_listed_once(
+        self, client, test_recipe, test_food_item, test_meal_slot_dinner,
+        test_family_member, test_app_settings,
+    ):
+        await _plan(client, test_meal_slot_dinner.id, MONDAY, item_id=test_recipe.id)
+        await _plan(client, test_meal_slot_dinner.id, MONDAY + timedelta(days=2), item_id=test_recipe.id)
+        await _plan(
+            client, test_meal_slot_dinner.id, MONDAY + timedelta(days=6),
+            item_id=test_food_item.id, participant_ids=[test_family_member.id],
+        )
+        await _plan(client, test_meal_slot_dinner.id, MONDAY + timedelta(days=1), custom_meal_name="Takeout")
+        # Outside the week
+        await _plan(client, test_meal_slot_dinner.id, MONDAY + timedelta(days=7), item_id=test_recipe.id)
+
+        response = await client.get("/mealboard/week", params={"start": MONDAY.isoformat()})
+        assert response.status_code == 200
+        body = response.json()
+
+        assert body["start"] == MONDAY.isoformat()
+        assert body["end"] == (MONDAY + timedelta(days=6)).isoformat()
+        assert body["settings"]["timezone"] == "UTC"
+        assert test_meal_slot_dinner.id in [s["id"] for s in body["slot_types"]]
+        assert test_family_member.id in [m["id"] for m in body["family_members"]]
+
+        assert [e["date"] for e in body["entries"]] == [
+            (MONDAY + timedelta(days=d)).isoformat() for d in (0, 1, 2, 6)
+        ]
+        assert [e["item_id"] for e in body["entries"]] == [
+            test_recipe.id, None, test_recipe.id, test_food_item.id,
+        ]
+        assert body["entries"][3]["participant_ids"] == [test_family_member.id]
+
+        items = {it["id"]: it for it in body["items"]}
+        assert sorted(items) == sorted([test_recipe.id, test_food_item.id])
+        assert items[test_recipe.id]["prep_time_minutes"] == test_recipe.recipe_detail.prep_time_minutes
+        assert items[test_food_item.id]["category"] == test_food_item.food_item_detail.category
+        assert "instructions" not in items[test_recipe.id]
+
+    async def test_hidden_entries_are_left_out(self, client, test_recipe, test_meal_slot_dinner):
+        entry_id = await _plan(client, test_meal_slot_dinner.id, MONDAY, item_id=test_recipe.id)
+        await client.delete(f"/meal-entries/{entry_id}")
+
+        body = (await client.get("/mealboard/week", params={"start": MONDAY.isoformat()})).json()
+        assert body["entries"] == []
+        assert body["items"] == []
+
+    async def test_family_member_filter(
+        self, client, test_recipe, test_meal_slot_dinner, test_family_member, test_system_member,
+    ):
+        await _plan(client, test_meal_slot_dinner.id, MONDAY, item_id=test_recipe.id,
+                    participant_ids=[test_family_member.id])
+        await _plan(client, test_meal_slot_dinner.id, MONDAY, custom_meal_name="Other",
+                    participant_ids=[test_system_member.id])
+
+        body = (await client.get("/mealboard/week", params={
+            "start": MONDAY.isoformat(), "family_member_id": test_family_member.id,
+        })).json()
+        assert [e["item_id"] for e in body["entries"]] == [test_recipe.id]
+        assert body["entries"][0]["participant_ids"] == [test_family_member.id]
+
+    async def test_query_count_does_not_grow_with_the_week(
+        self, client, db_session, test_engine, test_recipe, test_food_item,
+        test_meal_slot_dinner, test_family_member, test_app_settings,
+    ):
+        async def count_queries():
+            db_session.expunge_all()
+            statements = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                response = await client.get("/mealboard/week", params={"start": MONDAY.isoformat()})
+            finally:
+                event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+            assert response.status_code == 200
+            # The auth user lookup and the ETag version check aren't the board
+            return len([
+                s for s in statements if s.startswith("SELECT")
+                and "FROM users" not in s and "FROM collection_versions" not in s
+            ])
+
+        await _plan(client, test_meal_slot_dinner.id, MONDAY, item_id=test_recipe.id)
+        few = await count_queries()
+
+        for day in range(7):
+            await _plan(client, test_meal_slot_dinner.id, MONDAY + timedelta(days=day),
+                        item_id=test_food_item.id, participant_ids=[test_family_member.id])
+        assert await count_queries() == few == 5
@@ -130,6 +130,47 @@ class TestHappyPath:
         assert result.source_url.startswith("https://example.com/")
 
 
+    def test_confident_scraper_hint_skips_llm(self, monkeypatch):
+        _patch_httpx_client(monkeypatch, [_fake_response()])
+        monkeypatch.setattr(
+            "app.services.recipe_extractor._try_recipe_scrapers",
+            lambda url, html: {
+                "title": "Pancakes",
+                "ingredients": ["1 ½ cups flour", "2 eggs", "1 cup milk"],
+                "instructions": "Whisk everything together and cook on a hot griddle.",
+                "yields": "8 pancakes",
+            },
+        )
+
+        def _no_llm(*a, **kw):
+            raise AssertionError("LLM must not be called")
+
+        monkeypatch.setattr("app.services.recipe_extractor.ai_client.extract_structured", _no_llm)
+        steps = []
+        result = re.extract_recipe("https://example.com/recipe", on_progress=steps.append)
+        assert result.name == "Pancakes"
+        assert [i.name for i in result.recipe_detail.ingredients] == ["flour", "eggs", "milk"]
+        assert result.recipe_detail.servings == 8
+        assert steps[-1] == "parsing_ingredients"
+
+    def test_unsure_scraper_hint_uses_llm(self, monkeypatch):
+        _patch_httpx_client(monkeypatch, [_fake_response()])
+        monkeypatch.setattr(
+            "app.services.recipe_extractor._try_recipe_scrapers",
+            lambda url, html: {
+                "title": "Honey Garlic Chicken",
+                "ingredients": ["2 lb chicken breast", "Honey or maple syrup"],
+                "instructions": "Season chicken. Cook in skillet. Add sauce and reduce.",
+            },
+        )
+        monkeypatch.setattr(
+            "app.services.recipe_extractor.ai_client.extract_structured",
+            lambda *a, **kw: _good_llm_recipe(),
+        )
+        result = re.extract_recipe("https://example.com/recipe")
+        assert "chicken" in result.tags
+
+
 # ---------------------------------------------------------------------------
 # Fetch-stage failures
 # ---------------------------------------------------------------------------
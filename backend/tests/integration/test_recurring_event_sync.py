@@ -0,0 +1,252 @@
+"""Integration tests for recurring iCloud events.
+
+Exercises sync_engine._sync_series (series storage + local occurrence
+materialization) against Postgres, and the API guard that keeps generated
+occurrences read-only.
+"""
+
+import pytest_asyncio
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+
+from app.models import (
+    CalendarEvent,
+    CalendarIntegration,
+    FamilyMember,
+    RecurringEventSeries,
+)
+from app.services.sync_engine import _sync_series, _detect_remote_series_deletions
+from app.utils.encryption import encrypt_password
+
+
+@pytest_asyncio.fixture
+async def member(db_session):
+    m = FamilyMember(name="Bob", is_system=False)
+    db_session.add(m)
+    await db_session.commit()
+    await db_session.refresh(m)
+    return m
+
+
+@pytest_asyncio.fixture
+async def integration(db_session, member):
+    integ = CalendarIntegration(
+        family_member_id=member.id,
+        provider="icloud",
+        email="bob@icloud.com",
+        encrypted_password=encrypt_password("test"),
+        status="ACTIVE",
+    )
+    db_session.add(integ)
+    await db_session.commit()
+    await db_session.refresh(integ)
+    return integ
+
+
+def _remote(**overrides):
+    remote = {
+        "external_id": "series-1",
+        "title": "Swim practice",
+        "description": None,
+        "dtstart": datetime(2026, 1, 5, 17, 0),
+        "all_day": False,
+        "timezone": "America/New_York",
+        "duration_minutes": 60,
+        "rrule": "FREQ=WEEKLY;BYDAY=MO",
+        "exdates": [],
+        "overrides": {},
+        "etag": "etag-1",
+        "last_modified_remote": datetime(2026, 1, 1, 12, 0),
+    }
+    remote.update(overrides)
+    return remote
+
+
+def _stats():
+    return {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "errors": 0}
+
+
+async def _occurrence_dates(db_session):
+    result = await db_session.execute(
+        select(CalendarEvent.date)
+        .where(CalendarEvent.series_id.is_not(None))
+        .order_by(CalendarEvent.date)
+    )
+    return [d.day for d in result.scalars().all()]
+
+
+class TestSyncSeries:
+    async def test_creates_series_and_materializes_window(self, db_session, integration):
+        stats = _stats()
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 1), date(2026, 1, 31), stats
+        )
+        await db_session.commit()
+
+        series = (await db_session.execute(select(RecurringEventSeries))).scalar_one()
+        assert series.expanded_until == date(2026, 1, 31)
+        assert await _occurrence_dates(db_session) == [5, 12, 19, 26]
+        assert stats["created"] == 1
+
+        occ = (await db_session.execute(
+            select(CalendarEvent).where(CalendarEvent.series_id == series.id).limit(1)
+        )).scalars().first()
+        assert occ.external_id is None
+        assert occ.start_time == "17:00"
+        assert occ.end_time == "18:00"
+        assert occ.assigned_to == integration.family_member_id
+
+    async def test_unchanged_series_only_expands_new_days(self, db_session, integration):
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 1), date(2026, 1, 15), _stats()
+        )
+        await db_session.commit()
+        first_ids = set((await db_session.execute(
+            select(CalendarEvent.id).where(CalendarEvent.series_id.is_not(None))
+        )).scalars().all())
+
+        stats = _stats()
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 8), date(2026, 1, 31), stats
+        )
+        await db_session.commit()
+
+        all_ids = set((await db_session.execute(
+            select(CalendarEvent.id).where(CalendarEvent.series_id.is_not(None))
+        )).scalars().all())
+        # Existing rows untouched, only 19th and 26th added
+        assert first_ids < all_ids
+        assert await _occurrence_dates(db_session) == [5, 12, 19, 26]
+        assert stats["skipped"] == 1
+
+    async def test_changed_series_rebuilds_occurrences(self, db_session, integration):
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 1), date(2026, 1, 31), _stats()
+        )
+        await db_session.commit()
+
+        stats = _stats()
+        await _sync_series(
+            db_session, integration,
+            _remote(exdates=["2026-01-12T17:00:00"], etag="etag-2"),
+            date(2026, 1, 1), date(2026, 1, 31), stats,
+        )
+        await db_session.commit()
+
+        assert await _occurrence_dates(db_session) == [5, 19, 26]
+        assert stats["updated"] == 1
+
+    async def test_changed_series_with_override_moved_before_window(
+        self, db_session, integration,
+    ):
+        """The Jan 12 instance was moved to Dec 30 — outside the window by
+        date, inside it by original slot. A rebuild must replace it, not
+        trip the (series_id, recurrence_id) unique constraint."""
+        moved = {"2026-01-12T17:00:00": {
+            "title": "Swim practice (moved)", "date": "2025-12-30",
+            "start_time": "17:00", "end_time": "18:00", "all_day": False,
+            "timezone": "America/New_York",
+        }}
+        await _sync_series(
+            db_session, integration, _remote(overrides=moved),
+            date(2026, 1, 1), date(2026, 1, 31), _stats(),
+        )
+        await db_session.commit()
+
+        stats = _stats()
+        await _sync_series(
+            db_session, integration, _remote(overrides=moved, title="Swim", etag="etag-2"),
+            date(2026, 1, 1), date(2026, 1, 31), stats,
+        )
+        await db_session.commit()
+
+        rows = (await db_session.execute(
+            select(CalendarEvent.date, CalendarEvent.title)
+            .where(CalendarEvent.series_id.is_not(None))
+            .order_by(CalendarEvent.date)
+        )).all()
+        assert rows == [
+            (date(2025, 12, 30), "Swim practice (moved)"),
+            (date(2026, 1, 5), "Swim"),
+            (date(2026, 1, 19), "Swim"),
+            (date(2026, 1, 26), "Swim"),
+        ]
+        assert stats == {**_stats(), "updated": 1}
+
+    async def test_override_moved_into_window_from_later_slot(self, db_session, integration):
+        """The Feb 9 instance was moved to Jan 20. It shows on Jan 20 before
+        the window reaches Feb 9, and isn't added twice once it does."""
+        moved = {"2026-02-09T17:00:00": {
+            "title": "Swim practice (moved)", "date": "2026-01-20",
+            "start_time": "17:00", "end_time": "18:00", "all_day": False,
+            "timezone": "America/New_York",
+        }}
+        await _sync_series(
+            db_session, integration, _remote(overrides=moved),
+            date(2026, 1, 1), date(2026, 1, 31), _stats(),
+        )
+        await db_session.commit()
+        assert await _occurrence_dates(db_session) == [5, 12, 19, 20, 26]
+
+        # Window slides over the original slot
+        await _sync_series(
+            db_session, integration, _remote(overrides=moved),
+            date(2026, 1, 1), date(2026, 2, 15), _stats(),
+        )
+        await db_session.commit()
+        # Rule change rebuilds from the window start
+        await _sync_series(
+            db_session, integration, _remote(overrides=moved, title="Swim", etag="etag-2"),
+            date(2026, 1, 1), date(2026, 2, 15), _stats(),
+        )
+        await db_session.commit()
+
+        rows = (await db_session.execute(
+            select(CalendarEvent.date, CalendarEvent.title, CalendarEvent.recurrence_id)
+            .where(CalendarEvent.series_id.is_not(None))
+            .order_by(CalendarEvent.date)
+        )).all()
+        assert [(d.isoformat(), t) for d, t, _ in rows] == [
+            ("2026-01-05", "Swim"),
+            ("2026-01-12", "Swim"),
+            ("2026-01-19", "Swim"),
+            ("2026-01-20", "Swim practice (moved)"),
+            ("2026-01-26", "Swim"),
+            ("2026-02-02", "Swim"),
+        ]
+        assert rows[3].recurrence_id == "2026-02-09T17:00:00"
+
+    async def test_missing_series_with_occurrences_in_range_is_deleted(
+        self, db_session, integration
+    ):
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 1), date(2026, 1, 31), _stats()
+        )
+        await db_session.commit()
+
+        stats = _stats()
+        await _detect_remote_series_deletions(
+            db_session, integration.id, set(), date(2026, 1, 1), date(2026, 1, 31), stats
+        )
+        await db_session.commit()
+
+        assert stats["deleted"] == 1
+        assert (await db_session.execute(select(RecurringEventSeries))).first() is None
+        assert await _occurrence_dates(db_session) == []
+
+
+class TestOccurrencesReadOnly:
+    async def test_patch_and_delete_rejected(self, client, db_session, integration):
+        await _sync_series(
+            db_session, integration, _remote(), date(2026, 1, 1), date(2026, 1, 31), _stats()
+        )
+        await db_session.commit()
+        occ_id = (await db_session.execute(
+            select(CalendarEvent.id).where(CalendarEvent.series_id.is_not(None)).limit(1)
+        )).scalar()
+
+        response = await client.patch(f"/calendar-events/{occ_id}", json={"title": "x"})
+        assert response.status_code == 400
+        response = await client.delete(f"/calendar-events/{occ_id}")
+        assert response.status_code == 400
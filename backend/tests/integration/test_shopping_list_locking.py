@@ -0,0 +1,199 @@
+"""Integration tests for the per-list advisory lock in shopping_sync.
+
+A second connection holds the list's advisory lock the way a concurrent
+worker would; the sync under test must wait for it and report the wait.
+"""
+
+import asyncio
+import logging
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import event, func, literal_column, select
+
+from app.crud_tasks import update_task
+from app.models import AppSettings, FoodItemDetail, Item, MealEntry, Task
+from app.services.shopping_sync import (
+    _LIST_LOCK_NAMESPACE,
+    remove_meal_from_shopping_list,
+    sync_meal_to_shopping_list,
+)
+from app.schemas import TaskUpdate
+
+
+async def _hold_list_lock(test_engine, list_id, release: asyncio.Event):
+    async with test_engine.connect() as conn:
+        async with conn.begin():
+            await conn.execute(
+                select(func.pg_advisory_xact_lock(func.hashtext(_LIST_LOCK_NAMESPACE), list_id))
+            )
+            await release.wait()
+
+
+async def _pending_entry(db_session, slot_id, item_id=None):
+    entry = MealEntry(
+        date=date.today(),
+        meal_slot_type_id=slot_id,
+        item_id=item_id,
+        custom_meal_name=None if item_id else "Leftovers",
+        shopping_sync_status="pending",
+    )
+    db_session.add(entry)
+    await db_session.commit()
+    return entry
+
+
+class TestListAdvisoryLock:
+    async def test_sync_waits_for_list_lock_and_records_contention(
+        self, db_session, test_engine, test_list, test_app_settings, test_meal_slot_dinner, caplog,
+    ):
+        test_app_settings.mealboard_shopping_list_id = test_list.id
+        await db_session.commit()
+        entry = await _pending_entry(db_session, test_meal_slot_dinner.id)
+
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold_list_lock(test_engine, test_list.id, release))
+        await asyncio.sleep(0.1)
+
+        caplog.set_level(logging.INFO, logger="app.services.shopping_sync")
+        sync = asyncio.create_task(sync_meal_to_shopping_list(db_session, entry.id))
+        await asyncio.sleep(0.2)
+        assert not sync.done(), "sync should block while another worker holds the list"
+
+        release.set()
+        await asyncio.wait_for(sync, timeout=5)
+        await holder
+
+        assert entry.shopping_sync_status == "synced"
+        records = [r for r in caplog.records if r.getMessage() == "shopping_sync.list_lock"]
+        assert len(records) == 1
+        assert records[0].list_id == test_list.id
+        assert records[0].contended is True
+        assert records[0].wait_ms >= 100
+
+    async def test_other_lists_are_not_blocked(
+        self, db_session, test_engine, test_list, test_app_settings, test_meal_slot_dinner, caplog,
+    ):
+        test_app_settings.mealboard_shopping_list_id = test_list.id
+        await db_session.commit()
+        entry = await _pending_entry(db_session, test_meal_slot_dinner.id)
+
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold_list_lock(test_engine, test_list.id + 1000, release))
+        await asyncio.sleep(0.1)
+        try:
+            caplog.set_level(logging.INFO, logger="app.services.shopping_sync")
+            await asyncio.wait_for(sync_meal_to_shopping_list(db_session, entry.id), timeout=5)
+        finally:
+            release.set()
+            await holder
+
+        assert entry.shopping_sync_status == "synced"
+        assert not [r for r in caplog.records if r.getMessage() == "shopping_sync.list_lock"]
+
+
+class TestCheckFlipLocking:
+    async def test_check_flip_takes_list_lock_before_the_row(
+        self, db_session, test_list, test_app_settings, test_meal_slot_dinner,
+        test_family_member,
+    ):
+        """Checking an auto row flips it to manual — a write to the list's
+        auto rows, so it takes the list lock, and takes it before the task
+        row is written."""
+        test_app_settings.mealboard_shopping_list_id = test_list.id
+        await db_session.commit()
+        item = Item(name="Apples", item_type="food_item", is_favorite=False)
+        db_session.add(item)
+        await db_session.flush()
+        db_session.add(FoodItemDetail(
+            item_id=item.id, category="other",
+            shopping_quantity=Decimal("1"), shopping_unit="each",
+        ))
+        await db_session.commit()
+        entry = await _pending_entry(db_session, test_meal_slot_dinner.id, item.id)
+        await sync_meal_to_shopping_list(db_session, entry.id)
+        task_id = (await db_session.execute(
+            select(Task.id).where(Task.list_id == test_list.id)
+        )).scalar_one()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_conn = (await db_session.connection()).sync_connection
+        event.listen(sync_conn, "before_cursor_execute", record)
+        try:
+            await update_task(db_session, task_id, TaskUpdate(completed=True))
+        finally:
+            event.remove(sync_conn, "before_cursor_execute", record)
+
+        lock_at = next(i for i, sql in enumerate(statements) if "advisory_xact_lock" in sql)
+        update_at = next(i for i, sql in enumerate(statements) if sql.startswith("UPDATE tasks"))
+        assert lock_at < update_at
+        task = (await db_session.execute(select(Task).where(Task.id == task_id))).scalar_one()
+        assert (task.completed, task.aggregation_source) == (True, None)
+
+
+class TestNoCommitUnderLock:
+    async def test_removal_without_settings_row_commits_once(
+        self, db_session, test_list, test_meal_slot_dinner,
+    ):
+        """With no settings row yet, reading the measurement system must not
+        create one: that commit would release the list lock mid-removal."""
+        entry = await _pending_entry(db_session, test_meal_slot_dinner.id)
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            await remove_meal_from_shopping_list(db_session, entry.id, test_list.id)
+
+        assert commit.call_count == 1
+        assert (await db_session.execute(select(func.count()).select_from(AppSettings))).scalar() == 0
+
+
+class TestRemovalRowLocks:
+    """Rows are found through shopping_item_sources.meal_entry_id, so removing
+    a meal locks only the rows it contributed to."""
+
+    async def test_removal_locks_only_rows_the_meal_contributed(
+        self, db_session, test_engine, test_list, test_app_settings, test_meal_slot_dinner,
+        test_family_member,
+    ):
+        test_app_settings.mealboard_shopping_list_id = test_list.id
+        await db_session.commit()
+        entries = []
+        for name in ("Apples", "Bread"):
+            item = Item(name=name, item_type="food_item", is_favorite=False)
+            db_session.add(item)
+            await db_session.flush()
+            db_session.add(FoodItemDetail(
+                item_id=item.id, category="other",
+                shopping_quantity=Decimal("1"), shopping_unit="each",
+            ))
+            await db_session.commit()
+            entry = await _pending_entry(db_session, test_meal_slot_dinner.id, item.id)
+            await sync_meal_to_shopping_list(db_session, entry.id)
+            entries.append(entry)
+
+        tasks = {
+            t.aggregation_key_name: t.id
+            for t in (await db_session.execute(select(Task).where(Task.list_id == test_list.id))).scalars()
+        }
+
+        async def bread_xmax():
+            return (await db_session.execute(
+                select(literal_column("xmax::text::bigint")).select_from(Task)
+                .where(Task.id == tasks["bread"])
+            )).scalar_one()
+
+        # Locking a row (FOR UPDATE, or the FK check behind a new source row)
+        # stamps its xmax. The bread row belongs to the other meal, so
+        # removing the apples meal must leave it untouched.
+        before = await bread_xmax()
+        await remove_meal_from_shopping_list(db_session, entries[0].id, test_list.id)
+        assert await bread_xmax() == before
+
+        remaining = (await db_session.execute(
+            select(Task.aggregation_key_name).where(Task.list_id == test_list.id)
+        )).scalars().all()
+        assert remaining == ["bread"]
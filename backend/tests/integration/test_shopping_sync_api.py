@@ -8,12 +8,19 @@ import pytest
 from datetime import date
 from unittest.mock import patch
 
-from sqlalchemy import select
+from sqlalchemy import event, func, select
 
 from decimal import Decimal
 
-from app.models import Task, MealEntry, Item, RecipeDetail, FoodItemDetail, AppSettings
-from app.services.shopping_sync import sync_meal_to_shopping_list
+from app.models import (
+    Task, MealEntry, Item, RecipeDetail, FoodItemDetail, AppSettings, ShoppingItemSource,
+)
+from app.services.shopping_sync import (
+    pending_meal_entry_ids,
+    remove_meal_from_shopping_list,
+    sync_meal_to_shopping_list,
+    sync_meals_to_shopping_list,
+)
 
 
 # =============================================================================
@@ -128,6 +135,14 @@ async def _get_auto_tasks(db_session, list_id):
     return result.scalars().all()
 
 
+async def _source_count(db_session, task_id):
+    """Return how many meal contributions a shopping task has."""
+    result = await db_session.execute(
+        select(func.count()).where(ShoppingItemSource.task_id == task_id)
+    )
+    return result.scalar_one()
+
+
 async def _get_all_tasks_on_list(db_session, list_id):
     """Return all tasks on a list (auto + manual)."""
     result = await db_session.execute(
@@ -305,6 +320,135 @@ class TestAggregationSpecExamples:
         assert olive_oil[0].title == "olive oil"
 
 
+    async def test_same_bucket_ingredients_in_one_recipe_merge(
+        self, client, db_session, test_list, test_meal_slot_dinner, test_app_settings, test_family_member,
+    ):
+        """'Onion' ×1 and 'onions' ×2 in the same recipe → 1 row, 2 sources."""
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+
+        recipe = await _create_recipe(db_session, "Soup", [
+            {"name": "Onion", "quantity": 1, "unit": None, "category": "Produce"},
+            {"name": "onions", "quantity": 2, "unit": None, "category": "Produce"},
+        ])
+        await _create_meal_entry_and_sync(
+            client, db_session, test_meal_slot_dinner.id,
+            recipe_id=recipe.id, item_type="recipe",
+        )
+
+        tasks = await _get_auto_tasks(db_session, test_list.id)
+        assert len(tasks) == 1
+        assert tasks[0].aggregation_base_quantity == 3
+        assert await _source_count(db_session, tasks[0].id) == 2
+
+
+class TestBulkUpsert:
+    """All ingredients of a meal are written with a single upsert statement."""
+
+    async def test_recipe_sync_issues_one_upsert(
+        self, client, db_session, test_engine, test_list, test_meal_slot_dinner,
+        test_app_settings, test_family_member,
+    ):
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+        recipe = await _create_recipe(db_session, "Stew", [
+            {"name": f"ingredient {i}", "quantity": 1, "unit": "cup", "category": "Other"}
+            for i in range(20)
+        ] + [{"name": "carrot", "quantity": 2, "unit": None, "category": "Produce"}])
+
+        # Pre-existing bucket so the conflict path is exercised too
+        carrot = await _create_food_item(db_session, "Carrots", quantity=1.0, unit="each")
+        await _create_meal_entry_and_sync(
+            client, db_session, test_meal_slot_dinner.id, food_item_id=carrot.id,
+        )
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        resp = await client.post("/meal-entries/", json={
+            "date": date.today().isoformat(),
+            "meal_slot_type_id": test_meal_slot_dinner.id,
+            "item_id": recipe.id,
+        })
+        assert resp.status_code == 201, resp.text
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            await sync_meal_to_shopping_list(db_session, resp.json()["id"])
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        # One upsert for all 21 ingredients, one insert of their sources, and
+        # one title fix-up for the carrot row that already existed — no
+        # per-ingredient SELECT FOR UPDATE.
+        writes = [
+            " ".join(s.split()[:3]) for s in statements
+            if s.split()[0] in ("INSERT", "UPDATE", "DELETE")
+        ]
+        assert writes == [
+            "INSERT INTO tasks",
+            "INSERT INTO shopping_item_sources",
+            "UPDATE tasks SET",
+            "UPDATE meal_entries SET",
+        ]
+        assert not any("FOR UPDATE" in s and "FROM tasks" in s for s in statements)
+
+        tasks = await _get_auto_tasks(db_session, test_list.id)
+        assert len(tasks) == 21
+        carrot_row = next(t for t in tasks if t.aggregation_key_name == "carrot")
+        assert carrot_row.aggregation_base_quantity == 3
+        assert carrot_row.title == "3 each carrot"
+        assert await _source_count(db_session, carrot_row.id) == 2
+
+
+    async def test_batch_sync_writes_each_bucket_once(
+        self, client, db_session, test_engine, test_list, test_meal_slot_dinner,
+        test_app_settings, test_family_member,
+    ):
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+        recipe = await _create_recipe(db_session, "Omelette", [
+            {"name": "eggs", "quantity": 3, "unit": None, "category": "Dairy"},
+            {"name": "butter", "quantity": 1, "unit": "tbsp", "category": "Dairy"},
+        ])
+
+        entry_ids = []
+        for _ in range(5):
+            resp = await client.post("/meal-entries/", json={
+                "date": date.today().isoformat(),
+                "meal_slot_type_id": test_meal_slot_dinner.id,
+                "item_id": recipe.id,
+            })
+            assert resp.status_code == 201, resp.text
+            entry_ids.append(resp.json()["id"])
+        # Already synced entries are left alone
+        await sync_meal_to_shopping_list(db_session, entry_ids[0])
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            synced = await sync_meals_to_shopping_list(db_session, entry_ids)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert synced == 4
+        assert sum(s.startswith("INSERT INTO tasks") for s in statements) == 1
+
+        tasks = {t.aggregation_key_name: t for t in await _get_auto_tasks(db_session, test_list.id)}
+        assert set(tasks) == {"egg", "butter"}
+        assert tasks["egg"].aggregation_base_quantity == 15
+        assert await _source_count(db_session, tasks["egg"].id) == 5
+
+        result = await db_session.execute(
+            select(MealEntry.shopping_sync_status).where(MealEntry.id.in_(entry_ids))
+        )
+        assert set(result.scalars().all()) == {"synced"}
+        assert await pending_meal_entry_ids(db_session) == []
+
+
 # =============================================================================
 # 2. on_item_checked (check-flip)
 # =============================================================================
@@ -441,6 +585,55 @@ class TestSwapMealboardList:
         assert len(tasks_a_after) == 0, f"Expected 0 auto tasks on A, got {len(tasks_a_after)}"
         assert len(tasks_b_after) == 2, f"Expected 2 auto tasks on B, got {len(tasks_b_after)}"
 
+    async def test_swap_recompute_matches_incremental_sync(
+        self, client, db_session, test_meal_slot_dinner, test_app_settings, test_family_member,
+    ):
+        """The set-based SQL recompute builds the same rows as per-meal syncs."""
+        from app.models import List as ListModel
+
+        list_a = ListModel(name="Shopping A", color="#FF0000", icon="cart")
+        list_b = ListModel(name="Shopping B", color="#00FF00", icon="cart")
+        db_session.add_all([list_a, list_b])
+        await db_session.commit()
+        await _link_shopping_list(db_session, test_app_settings, list_a.id)
+
+        recipe1 = await _create_recipe(db_session, "Chili", [
+            {"name": "Ground Beef", "quantity": 1, "unit": "lb", "category": "Protein"},
+            {"name": "Tomatoes", "quantity": 2, "unit": "can", "category": "Pantry"},
+            {"name": "onions", "quantity": 1, "unit": None, "category": "Produce"},
+            {"name": "cumin", "quantity": 0, "unit": "tsp", "category": "Spice"},
+        ])
+        recipe2 = await _create_recipe(db_session, "Burgers", [
+            {"name": "ground beef", "quantity": 8, "unit": "oz", "category": "Protein"},
+            {"name": "onion", "quantity": 2, "unit": "each", "category": "Produce"},
+            {"name": "milk", "quantity": 0.5, "unit": "cup", "category": "Dairy"},
+            {"name": "cumin", "quantity": None, "unit": None, "category": "Spice"},
+        ])
+        bananas = await _create_food_item(db_session, "Bananas", quantity=3.0, unit="each")
+        for item_id in (recipe1.id, recipe2.id, bananas.id, recipe1.id):
+            await _create_meal_entry_and_sync(
+                client, db_session, test_meal_slot_dinner.id, recipe_id=item_id,
+            )
+
+        async def _snapshot(list_id):
+            rows = []
+            for t in await _get_auto_tasks(db_session, list_id):
+                rows.append((
+                    t.aggregation_key_name, t.aggregation_unit, t.aggregation_unit_group,
+                    round(t.aggregation_base_quantity, 6), t.title.lower(),
+                    await _source_count(db_session, t.id),
+                ))
+            return sorted(rows, key=lambda r: (r[0], r[1] or ""))
+
+        before = await _snapshot(list_a.id)
+        resp = await client.patch("/app-settings/", json={"mealboard_shopping_list_id": list_b.id})
+        assert resp.status_code == 200
+
+        # Titles compared case-insensitively: which same-bucket display name
+        # wins depends on processing order.
+        assert len(before) == 6
+        assert await _snapshot(list_b.id) == before
+
     async def test_swap_keeps_manual_checked_items_on_old_list(
         self, client, db_session, test_meal_slot_dinner, test_app_settings, test_family_member,
     ):
@@ -649,3 +842,142 @@ class TestCeleryTaskGuards:
         entry = result.scalar_one()
         assert entry.shopping_sync_status == "skipped"
         assert entry.synced_to_list_id is None
+
+
+# =============================================================================
+# 6. remove_meal_from_shopping_list
+# =============================================================================
+
+
+class TestRemoveMealFromShoppingList:
+    """Removal subtracts only the removed meal's shopping_item_sources rows."""
+
+    async def test_partial_removal_keeps_other_meals_contribution(
+        self, client, db_session, test_list, test_meal_slot_dinner, test_app_settings, test_family_member,
+    ):
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+
+        recipe1 = await _create_recipe(db_session, "Salsa", [
+            {"name": "Tomatoes", "quantity": 2, "unit": None, "category": "Produce"},
+        ])
+        recipe2 = await _create_recipe(db_session, "Salad", [
+            {"name": "tomato", "quantity": 3, "unit": None, "category": "Produce"},
+            {"name": "lettuce", "quantity": 1, "unit": "head", "category": "Produce"},
+        ])
+        entry1 = await _create_meal_entry_and_sync(
+            client, db_session, test_meal_slot_dinner.id, recipe_id=recipe1.id,
+        )
+        entry2 = await _create_meal_entry_and_sync(
+            client, db_session, test_meal_slot_dinner.id, recipe_id=recipe2.id,
+        )
+
+        await remove_meal_from_shopping_list(db_session, entry2, test_list.id)
+
+        tasks = await _get_auto_tasks(db_session, test_list.id)
+        assert [t.aggregation_key_name for t in tasks] == ["tomato"]
+        assert tasks[0].aggregation_base_quantity == 2
+        # Display name comes from the remaining source, not the canonical key
+        assert tasks[0].title == "2 each Tomatoes"
+        assert await _source_count(db_session, tasks[0].id) == 1
+
+        await remove_meal_from_shopping_list(db_session, entry1, test_list.id)
+        assert await _get_auto_tasks(db_session, test_list.id) == []
+
+    async def test_checked_rows_are_left_alone(
+        self, client, db_session, test_list, test_meal_slot_dinner, test_app_settings, test_family_member,
+    ):
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+
+        recipe = await _create_recipe(db_session, "Toast", [
+            {"name": "bread", "quantity": 2, "unit": "slice", "category": "Grain"},
+        ])
+        entry_id = await _create_meal_entry_and_sync(
+            client, db_session, test_meal_slot_dinner.id, recipe_id=recipe.id,
+        )
+        task_id = (await _get_auto_tasks(db_session, test_list.id))[0].id
+        resp = await client.patch(f"/tasks/{task_id}", json={"completed": True})
+        assert resp.status_code == 200
+
+        await remove_meal_from_shopping_list(db_session, entry_id, test_list.id)
+
+        result = await db_session.execute(select(Task).where(Task.id == task_id))
+        assert result.scalar_one().completed is True
+        assert await _source_count(db_session, task_id) == 1
+
+
+# =============================================================================
+# 7. Shopping preview
+# =============================================================================
+
+class TestShoppingPreview:
+    """GET /meal-entries/shopping-preview buckets a date range without writing."""
+
+    async def _plan(self, client, db_session, slot_id):
+        recipe = await _create_recipe(db_session, "Chili", [
+            {"name": "onions", "quantity": 2, "unit": None, "category": "Produce"},
+            {"name": "ground beef", "quantity": 1, "unit": "lb", "category": "Meat"},
+            {"name": "salt", "quantity": 0, "unit": None, "category": "Pantry"},
+        ])
+        onion = await _create_food_item(db_session, "Onion", quantity=1.0, unit="each")
+        ids = []
+        for offset, item_id in ((0, recipe.id), (1, recipe.id), (2, onion.id), (9, recipe.id)):
+            resp = await client.post("/meal-entries/", json={
+                "date": date.fromordinal(date.today().toordinal() + offset).isoformat(),
+                "meal_slot_type_id": slot_id,
+                "item_id": item_id,
+            })
+            assert resp.status_code == 201, resp.text
+            ids.append(resp.json()["id"])
+        return ids
+
+    async def test_preview_matches_sync_and_writes_nothing(
+        self, client, db_session, test_engine, test_list, test_meal_slot_dinner,
+        test_app_settings, test_family_member,
+    ):
+        await _link_shopping_list(db_session, test_app_settings, test_list.id)
+        entry_ids = await self._plan(client, db_session, test_meal_slot_dinner.id)
+        start = date.today()
+        end = date.fromordinal(start.toordinal() + 6)
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            resp = await client.get(
+                "/meal-entries/shopping-preview",
+                params={"start": start.isoformat(), "end": end.isoformat()},
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+        assert resp.status_code == 200, resp.text
+        preview = resp.json()
+
+        assert not any(s.split()[0] in ("INSERT", "UPDATE", "DELETE") for s in statements)
+        assert not any("FOR UPDATE" in s or "advisory" in s for s in statements)
+        assert len([s for s in statements if "FROM meal_entries" in s]) == 1
+        assert await _get_auto_tasks(db_session, test_list.id) == []
+
+        by_name = {item["aggregation_key_name"]: item for item in preview}
+        assert sorted(by_name) == ["ground beef", "onion", "salt"]
+        assert by_name["onion"]["aggregation_base_quantity"] == 5
+        assert {s["meal_entry_id"] for s in by_name["onion"]["sources"]} == set(entry_ids[:3])
+        assert by_name["salt"]["aggregation_unit"] is None
+        # The entry on day 9 is outside the range
+        assert all(
+            s["meal_entry_id"] != entry_ids[3] for item in preview for s in item["sources"]
+        )
+
+        # Syncing the same entries produces exactly the previewed rows
+        await sync_meals_to_shopping_list(db_session, entry_ids[:3])
+        tasks = await _get_auto_tasks(db_session, test_list.id)
+        assert sorted(t.title for t in tasks) == sorted(item["title"] for item in preview)
+
+    async def test_end_before_start_rejected(self, client):
+        resp = await client.get(
+            "/meal-entries/shopping-preview",
+            params={"start": "2026-01-08", "end": "2026-01-01"},
+        )
+        assert resp.status_code == 400
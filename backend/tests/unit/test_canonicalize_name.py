@@ -1,6 +1,7 @@
 import pytest
 
-from app.services.shopping_sync import canonicalize_name
+from app.services import ingredient_aliases
+from app.services.shopping_sync import canonicalize_name, singularize_name
 
 
 class TestCanonicalizeName:
@@ -116,3 +117,23 @@ class TestCanonicalizeName:
 
     def test_es_plates(self):
         assert canonicalize_name("plates") == "plate"
+
+
+class TestAliases:
+    """canonicalize_name() maps singularized names through the alias dictionary."""
+
+    @pytest.fixture(autouse=True)
+    def aliases(self, monkeypatch):
+        monkeypatch.setattr(ingredient_aliases, "_aliases", {"scallion": "green onion"})
+
+    def test_alias_applies_after_singularizing(self):
+        assert canonicalize_name("Scallions") == "green onion"
+
+    def test_unaliased_name_unchanged(self):
+        assert canonicalize_name("green onions") == "green onion"
+
+    def test_rule_based_step_is_memoized(self):
+        singularize_name.cache_clear()
+        canonicalize_name("Scallions")
+        canonicalize_name("Scallions")
+        assert singularize_name.cache_info().hits == 1
@@ -0,0 +1,49 @@
+"""Unit tests for Celery queue routing (app/celery_app.py)."""
+
+import app.tasks  # noqa: F401 — registers tasks on celery_app
+from app.celery_app import (
+    QUEUE_AI,
+    QUEUE_INTERACTIVE,
+    QUEUE_MAINTENANCE,
+    QUEUE_SYNC_BULK,
+    TASK_ROUTES,
+    WORKER_POOLS,
+    celery_app,
+)
+
+
+def _queue_for(task_name: str) -> str:
+    route = celery_app.amqp.router.route({}, task_name)
+    return route["queue"].name
+
+
+def test_every_app_task_has_an_explicit_route():
+    app_tasks = {name for name in celery_app.tasks if name.startswith("app.tasks.")}
+    assert app_tasks == set(TASK_ROUTES)
+
+
+def test_routes_only_target_declared_queues():
+    assert set(TASK_ROUTES.values()) <= set(WORKER_POOLS)
+
+
+def test_user_facing_pushes_are_interactive():
+    assert _queue_for("app.tasks.push_event_to_icloud") == QUEUE_INTERACTIVE
+    assert _queue_for("app.tasks.sync_shopping_list_add") == QUEUE_INTERACTIVE
+
+
+def test_slow_tasks_are_isolated_from_interactive():
+    assert _queue_for("app.tasks.extract_recipe_from_url") == QUEUE_AI
+    assert _queue_for("app.tasks.sync_all_reminders") == QUEUE_SYNC_BULK
+    assert _queue_for("app.tasks.hard_delete_expired_soft_deletes") == QUEUE_MAINTENANCE
+
+
+def test_unrouted_tasks_fall_back_to_interactive():
+    assert _queue_for("app.tasks.some_future_task") == QUEUE_INTERACTIVE
+
+
+def test_each_queue_has_its_own_binding():
+    # A shared exchange/routing key would deliver every task to every queue.
+    bindings = {
+        (q.exchange.name, q.routing_key) for q in celery_app.conf.task_queues
+    }
+    assert len(bindings) == len(WORKER_POOLS)
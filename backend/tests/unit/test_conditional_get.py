@@ -0,0 +1,22 @@
+"""Unit tests for app/utils/conditional_get.py."""
+
+import pytest
+
+from app.utils.conditional_get import _etag_matches, versioned
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ('W/"3.1"', True),
+    ('"3.1"', True),  # weak comparison ignores W/
+    ('W/"3.2"', False),
+    ('W/"9.9", W/"3.1"', True),
+    ("*", True),
+])
+def test_etag_matches(header, expected):
+    assert _etag_matches(header, 'W/"3.1"') is expected
+
+
+def test_versioned_rejects_tables_without_triggers():
+    with pytest.raises(ValueError, match="users"):
+        versioned("tasks", "users")
@@ -0,0 +1,356 @@
+"""Unit tests for the line-oriented ICS fast path.
+
+Differential: every fixture is mapped through ics_to_event_data /
+vtodo_to_task_data twice — once from FastComponent, once from the full
+icalendar tree — and the resulting dicts must be identical. Also covers
+the fallback triggers, and checks the fast path skips icalendar entirely.
+The microbenchmark at the bottom is opt-in: `pytest -m benchmark -s`.
+"""
+
+import timeit
+from datetime import date, datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import icalendar
+import pytest
+
+from app.services import ics_fastpath
+from app.services.caldav_client import (
+    _parse_components,
+    ics_to_event_data,
+    vtodo_to_task_data,
+)
+
+
+def _ics(*body_lines: str) -> str:
+    return "\r\n".join(
+        ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Apple Inc.//iCloud//EN", *body_lines, "END:VCALENDAR", ""]
+    )
+
+
+_VTIMEZONE_NY = (
+    "BEGIN:VTIMEZONE",
+    "TZID:America/New_York",
+    "BEGIN:DAYLIGHT",
+    "DTSTART:20070311T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU",
+    "TZOFFSETFROM:-0500",
+    "TZOFFSETTO:-0400",
+    "END:DAYLIGHT",
+    "BEGIN:STANDARD",
+    "DTSTART:20071104T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU",
+    "TZOFFSETFROM:-0400",
+    "TZOFFSETTO:-0500",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+)
+
+
+EVENT_FIXTURES = {
+    "utc_timed": _ics(
+        "BEGIN:VEVENT",
+        "UID:utc-1",
+        "SUMMARY:Team Meeting",
+        "DESCRIPTION:Weekly standup",
+        "DTSTART:20260315T140000Z",
+        "DTEND:20260315T153000Z",
+        "LAST-MODIFIED:20260301T120000Z",
+        "DTSTAMP:20260301T120000Z",
+        "END:VEVENT",
+    ),
+    "tzid_with_vtimezone": _ics(
+        *_VTIMEZONE_NY,
+        "BEGIN:VEVENT",
+        "UID:tz-1",
+        "SUMMARY:Eastern Meeting",
+        "DTSTART;TZID=America/New_York:20260115T100000",
+        "DTEND;TZID=America/New_York:20260115T110000",
+        "LAST-MODIFIED:20260110T080000Z",
+        "END:VEVENT",
+    ),
+    "quoted_tzid": _ics(
+        "BEGIN:VEVENT",
+        "UID:tz-quoted",
+        "SUMMARY:Quoted",
+        'DTSTART;TZID="Europe/Berlin":20260601T090000',
+        'DTEND;TZID="Europe/Berlin":20260601T093000',
+        "END:VEVENT",
+    ),
+    "all_day_value_date": _ics(
+        "BEGIN:VEVENT",
+        "UID:allday-1",
+        "SUMMARY:Holiday",
+        "DTSTART;VALUE=DATE:20261225",
+        "DTEND;VALUE=DATE:20261226",
+        "END:VEVENT",
+    ),
+    "floating_time": _ics(
+        "BEGIN:VEVENT",
+        "UID:float-1",
+        "SUMMARY:Floating",
+        "DTSTART:20260401T080000",
+        "END:VEVENT",
+    ),
+    "folded_and_escaped": _ics(
+        "BEGIN:VEVENT",
+        "UID:fold-1",
+        "SUMMARY:Dinner\\, drinks\\; and a very long title that iCloud folds acr",
+        " oss multiple content lines",
+        "DESCRIPTION:Line one\\nLine two\\NLine three with a backslash \\\\ here",
+        "DTSTART:20260210T190000Z",
+        "END:VEVENT",
+    ),
+    "valarm_not_leaked": _ics(
+        "BEGIN:VEVENT",
+        "UID:alarm-1",
+        "SUMMARY:Dentist",
+        "DTSTART:20260502T150000Z",
+        "BEGIN:VALARM",
+        "UID:alarm-uid-should-not-win",
+        "ACTION:DISPLAY",
+        "DESCRIPTION:Reminder",
+        "TRIGGER:-PT15M",
+        "END:VALARM",
+        "END:VEVENT",
+    ),
+    "lowercase_names": _ics(
+        "begin:VEVENT",
+        "uid:lower-1",
+        "summary:Lowercase",
+        "dtstart:20260702T100000Z",
+        "end:VEVENT",
+    ),
+    "missing_uid": _ics(
+        "BEGIN:VEVENT",
+        "SUMMARY:No UID",
+        "DTSTART:20260101T120000Z",
+        "END:VEVENT",
+    ),
+    "missing_dtstart": _ics(
+        "BEGIN:VEVENT",
+        "UID:no-start",
+        "SUMMARY:No start",
+        "END:VEVENT",
+    ),
+    "expanded_instances": _ics(
+        "BEGIN:VEVENT",
+        "UID:series-1",
+        "RECURRENCE-ID:20260105T090000Z",
+        "SUMMARY:Standup",
+        "DTSTART:20260105T090000Z",
+        "DTEND:20260105T091500Z",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "UID:series-1",
+        "RECURRENCE-ID:20260106T090000Z",
+        "SUMMARY:Standup",
+        "DTSTART:20260106T090000Z",
+        "DTEND:20260106T091500Z",
+        "END:VEVENT",
+    ),
+}
+
+
+TODO_FIXTURES = {
+    "full": _ics(
+        "BEGIN:VTODO",
+        "UID:todo-1",
+        "SUMMARY:Buy groceries",
+        "DESCRIPTION:Milk\\, eggs",
+        "DUE:20260315T100000Z",
+        "PRIORITY:1",
+        "STATUS:NEEDS-ACTION",
+        "LAST-MODIFIED:20260310T100000Z",
+        "END:VTODO",
+    ),
+    "completed_subtask": _ics(
+        "BEGIN:VTODO",
+        "UID:todo-2",
+        "SUMMARY:Sub",
+        "STATUS:COMPLETED",
+        "COMPLETED:20260311T080000Z",
+        "RELATED-TO:todo-1",
+        "PRIORITY:6",
+        "END:VTODO",
+    ),
+    "date_due": _ics(
+        "BEGIN:VTODO",
+        "UID:todo-3",
+        "SUMMARY:Date only",
+        "DUE;VALUE=DATE:20260615",
+        "PRIORITY:5",
+        "END:VTODO",
+    ),
+    "tzid_due": _ics(
+        *_VTIMEZONE_NY,
+        "BEGIN:VTODO",
+        "UID:todo-4",
+        "SUMMARY:Local due",
+        "DUE;TZID=America/New_York:20260615T170000",
+        "END:VTODO",
+    ),
+    "missing_summary": _ics(
+        "BEGIN:VTODO",
+        "UID:todo-5",
+        "END:VTODO",
+    ),
+}
+
+
+def _slow(raw: str, name: str) -> list:
+    return [c for c in icalendar.Calendar.from_ical(raw).walk() if c.name == name]
+
+
+# =============================================================================
+# Differential tests against the icalendar mapping
+# =============================================================================
+
+
+class TestDifferentialAgainstIcalendar:
+    @pytest.mark.parametrize("fixture", sorted(EVENT_FIXTURES))
+    def test_vevent_mapping_matches(self, fixture):
+        raw = EVENT_FIXTURES[fixture]
+        fast = ics_fastpath.extract_components(raw, "VEVENT")
+        assert fast is not None, "fast path should handle this fixture"
+
+        slow = _slow(raw, "VEVENT")
+        assert len(fast) == len(slow)
+        for f, s in zip(fast, slow):
+            assert ics_to_event_data(f) == ics_to_event_data(s)
+            assert bool(f.get("RRULE")) == bool(s.get("RRULE"))
+
+    @pytest.mark.parametrize("fixture", sorted(TODO_FIXTURES))
+    def test_vtodo_mapping_matches(self, fixture):
+        raw = TODO_FIXTURES[fixture]
+        fast = ics_fastpath.extract_components(raw, "VTODO")
+        assert fast is not None, "fast path should handle this fixture"
+
+        slow = _slow(raw, "VTODO")
+        assert len(fast) == len(slow)
+        for f, s in zip(fast, slow):
+            assert vtodo_to_task_data(f) == vtodo_to_task_data(s)
+
+    def test_bytes_input(self):
+        raw = EVENT_FIXTURES["utc_timed"].encode("utf-8")
+        fast = ics_fastpath.extract_components(raw, "VEVENT")
+        assert ics_to_event_data(fast[0]) == ics_to_event_data(_slow(raw, "VEVENT")[0])
+
+
+# =============================================================================
+# Parsing details
+# =============================================================================
+
+
+class TestFastComponent:
+    def test_valarm_properties_do_not_leak(self):
+        [comp] = ics_fastpath.extract_components(EVENT_FIXTURES["valarm_not_leaked"], "VEVENT")
+        assert comp.get("UID") == "alarm-1"
+        assert comp.get("DESCRIPTION") is None
+
+    def test_tzid_and_value_date(self):
+        [comp] = ics_fastpath.extract_components(EVENT_FIXTURES["tzid_with_vtimezone"], "VEVENT")
+        assert comp.get("DTSTART").dt == datetime(
+            2026, 1, 15, 10, 0, tzinfo=ZoneInfo("America/New_York")
+        )
+        [comp] = ics_fastpath.extract_components(EVENT_FIXTURES["all_day_value_date"], "VEVENT")
+        assert comp.get("DTSTART").dt == date(2026, 12, 25)
+
+    def test_rrule_and_exdate_kept(self):
+        raw = _ics(
+            "BEGIN:VEVENT",
+            "UID:rr-1",
+            "SUMMARY:Weekly",
+            "DTSTART:20260105T090000Z",
+            "RRULE:FREQ=WEEKLY;BYDAY=MO",
+            "EXDATE:20260112T090000Z,20260119T090000Z",
+            "EXDATE:20260126T090000Z",
+            "END:VEVENT",
+        )
+        [comp] = ics_fastpath.extract_components(raw, "VEVENT")
+        assert comp.get("RRULE") == "FREQ=WEEKLY;BYDAY=MO"
+        assert len(comp.get("EXDATE")) == 3
+
+    def test_other_component_type_returns_empty(self):
+        assert ics_fastpath.extract_components(EVENT_FIXTURES["utc_timed"], "VTODO") == []
+
+
+class TestFallbackTriggers:
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            # Custom / non-IANA TZID (Exchange-style)
+            ("BEGIN:VEVENT", "UID:x", "DTSTART;TZID=Eastern Standard Time:20260101T090000", "END:VEVENT"),
+            # PERIOD value type
+            ("BEGIN:VEVENT", "UID:x", "DTSTART;VALUE=PERIOD:20260101T090000Z/PT1H", "END:VEVENT"),
+            # Base64-encoded property
+            ("BEGIN:VEVENT", "UID:x", "DESCRIPTION;ENCODING=BASE64:SGVsbG8=", "END:VEVENT"),
+            # Repeated single-valued property
+            ("BEGIN:VEVENT", "UID:x", "UID:y", "END:VEVENT"),
+            # Unbalanced nesting
+            ("BEGIN:VEVENT", "UID:x", "END:VTODO"),
+            # Content line without a colon
+            ("BEGIN:VEVENT", "UID:x", "GARBAGE", "END:VEVENT"),
+        ],
+    )
+    def test_returns_none(self, lines):
+        assert ics_fastpath.extract_components(_ics(*lines), "VEVENT") is None
+
+    def test_unterminated_component(self):
+        raw = "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:x\r\n"
+        assert ics_fastpath.extract_components(raw, "VEVENT") is None
+
+    def test_parse_components_falls_back_to_icalendar(self):
+        raw = _ics(
+            "BEGIN:VEVENT",
+            "UID:fallback-1",
+            "SUMMARY:Fallback",
+            "DTSTART;VALUE=PERIOD:20260101T090000Z/PT1H",
+            "END:VEVENT",
+        )
+        [comp] = _parse_components(raw, "VEVENT")
+        assert isinstance(comp, icalendar.Event)
+        assert str(comp.get("UID")) == "fallback-1"
+
+
+# =============================================================================
+# No icalendar parse on the fast path
+# =============================================================================
+
+
+def test_fast_path_never_builds_an_icalendar_tree():
+    """The whole point of the fast path: a parseable object never pays for
+    icalendar's full parse."""
+    raw = EVENT_FIXTURES["tzid_with_vtimezone"]
+    with patch.object(icalendar.Calendar, "from_ical", side_effect=AssertionError) as from_ical:
+        [comp] = _parse_components(raw, "VEVENT")
+        ics_to_event_data(comp)
+    from_ical.assert_not_called()
+    assert not isinstance(comp, icalendar.Event)
+
+
+# =============================================================================
+# Microbenchmark (opt-in)
+# =============================================================================
+
+
+@pytest.mark.benchmark
+def test_fast_path_outperforms_icalendar():
+    """The speedup the fast path exists for. Typical is ~10x; assert a
+    conservative 2x."""
+    raw = EVENT_FIXTURES["tzid_with_vtimezone"]
+
+    def fast():
+        for comp in ics_fastpath.extract_components(raw, "VEVENT"):
+            ics_to_event_data(comp)
+
+    def slow():
+        for comp in _slow(raw, "VEVENT"):
+            ics_to_event_data(comp)
+
+    fast_s = min(timeit.repeat(fast, number=200, repeat=3))
+    slow_s = min(timeit.repeat(slow, number=200, repeat=3))
+    print(f"\nics fast path: {fast_s * 5:.3f} ms/obj vs icalendar {slow_s * 5:.3f} ms/obj "
+          f"({slow_s / fast_s:.1f}x)")
+    assert fast_s * 2 < slow_s
@@ -0,0 +1,84 @@
+"""Unit tests for the rule-based ingredient line parser."""
+
+import pytest
+
+from app.services.ingredient_parser import (
+    CONFIDENT,
+    parse_ingredient_line,
+    parse_ingredient_lines,
+)
+
+
+class TestParseIngredientLine:
+    @pytest.mark.parametrize("line, name, quantity, unit", [
+        ("2 lb ground beef", "ground beef", 2, "lb"),
+        ("1 1/2 cups all-purpose flour, sifted", "all-purpose flour", 1.5, "cup"),
+        ("1½ cups sugar", "sugar", 1.5, "cup"),
+        ("½ tsp salt", "salt", 0.5, "tsp"),
+        ("0.25 cup honey", "honey", 0.25, "cup"),
+        ("3 cloves garlic, minced", "garlic", 3, "clove"),
+        ("1 (14 oz) can diced tomatoes", "diced tomatoes", 1, "can"),
+        ("2 cups of milk", "milk", 2, "cup"),
+        ("1 lb. ground pork", "ground pork", 1, "lb"),
+        ("8 fl oz cream", "cream", 8, "fl oz"),
+        ("1 T butter", "butter", 1, "tbsp"),
+        ("1 t vanilla extract", "vanilla extract", 1, "tsp"),
+        ("2 c flour", "flour", 2, "cup"),
+        ("2 c. flour", "flour", 2, "cup"),
+        ("1 C sugar", "sugar", 1, "cup"),
+        ("2 large eggs", "large eggs", 2, None),
+        ("• 3 carrots", "carrots", 3, None),
+        ("1 cup walnuts (optional)", "walnuts", 1, "cup"),
+    ])
+    def test_confident_lines(self, line, name, quantity, unit):
+        parsed = parse_ingredient_line(line)
+        assert (parsed.name, parsed.quantity, parsed.unit) == (name, quantity, unit)
+        assert parsed.confidence >= CONFIDENT
+        assert parsed.raw == line
+
+    def test_range_takes_upper_bound(self):
+        parsed = parse_ingredient_line("2-3 tbsp olive oil")
+        assert (parsed.name, parsed.quantity, parsed.unit) == ("olive oil", 3, "tbsp")
+        assert CONFIDENT <= parsed.confidence < 1
+
+        assert parse_ingredient_line("2 to 3 cloves garlic").quantity == 3
+
+    def test_pantry_phrasing_has_no_quantity(self):
+        parsed = parse_ingredient_line("Salt and pepper, to taste")
+        assert (parsed.name, parsed.quantity, parsed.unit) == ("Salt and pepper", None, None)
+        assert parsed.confidence >= CONFIDENT
+
+    @pytest.mark.parametrize("line", [
+        "Juice of 2 lemons",
+        "1 cup butter or margarine",
+        "1 cup " + "very " * 10 + "finely chopped parsley",
+    ])
+    def test_ambiguous_lines_are_not_confident(self, line):
+        assert parse_ingredient_line(line).confidence < CONFIDENT
+
+    @pytest.mark.parametrize("line", [
+        "1 pinch salt",
+        "1 dash hot sauce",
+        "2 sticks butter",
+        "1 env. yeast",
+        "1 pk yeast",
+        "2 bx crackers",
+        "3 x eggs",
+    ])
+    def test_unknown_units_are_not_confident(self, line):
+        """The unit would end up in the name — leave these to the LLM."""
+        parsed = parse_ingredient_line(line)
+        assert parsed.unit is None
+        assert parsed.confidence < CONFIDENT
+
+    @pytest.mark.parametrize("line", ["", "   ", "1/0 cup x", "2 cups"])
+    def test_unparseable_lines_score_zero(self, line):
+        parsed = parse_ingredient_line(line)
+        assert parsed.name == ""
+        assert parsed.confidence == 0
+
+
+class TestParseIngredientLines:
+    def test_skips_blank_lines(self):
+        parsed = parse_ingredient_lines(["2 eggs", "", "  ", "1 cup milk"])
+        assert [p.name for p in parsed] == ["eggs", "milk"]
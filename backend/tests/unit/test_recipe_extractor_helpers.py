@@ -216,3 +216,50 @@ class TestNormalizeToRecipeDetail:
         out = re._normalize_to_recipe_detail(recipe, source_url="https://x.example/")
         assert out.ingredients[0].category == "Other"
         assert out.ingredients[1].category == "Pantry"
+
+
+# ---------------------------------------------------------------------------
+# _try_local_parse
+# ---------------------------------------------------------------------------
+
+
+def _scraper_hint(**overrides):
+    hint = {
+        "title": "Honey Garlic Chicken",
+        "description": "A weeknight win.",
+        "ingredients": ["2 lb chicken breast", "¼ cup honey", "3 cloves garlic, minced"],
+        "instructions": "Season the chicken. Cook in a skillet, add sauce, reduce and serve.",
+        "prep_time": 10,
+        "cook_time": 20,
+        "yields": "4 servings",
+        "image": "https://x.example/chicken.jpg",
+    }
+    hint.update(overrides)
+    return hint
+
+
+class TestTryLocalParse:
+    def test_confident_hint_builds_recipe(self):
+        out = re._try_local_parse(_scraper_hint(), "https://x.example/r")
+        assert out is not None
+        assert out.name == "Honey Garlic Chicken"
+        assert out.tags == []
+        detail = out.recipe_detail
+        assert [(i.name, i.quantity, i.unit) for i in detail.ingredients] == [
+            ("chicken breast", 2, "lb"), ("honey", 0.25, "cup"), ("garlic", 3, "clove"),
+        ]
+        assert (detail.prep_time_minutes, detail.cook_time_minutes, detail.servings) == (10, 20, 4)
+        assert detail.source_url == "https://x.example/r"
+
+    @pytest.mark.parametrize("overrides", [
+        {"title": None},
+        {"instructions": "Cook."},
+        {"ingredients": None},
+        {"ingredients": ["2 lb chicken breast"]},
+        {"ingredients": ["2 lb chicken breast", "Juice of 2 lemons"]},
+    ])
+    def test_falls_back_to_llm(self, overrides):
+        assert re._try_local_parse(_scraper_hint(**overrides), "https://x.example/r") is None
+
+    def test_no_hint(self):
+        assert re._try_local_parse(None, "https://x.example/r") is None
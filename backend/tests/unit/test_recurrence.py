@@ -0,0 +1,239 @@
+"""Unit tests for local recurring-event expansion (services/recurrence.py)
+and the series mapping in caldav_client.ics_to_series_data.
+"""
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import icalendar
+import pytest
+
+from app.services import ics_fastpath
+from app.services.caldav_client import ics_to_series_data
+from app.services.recurrence import (
+    MAX_OCCURRENCES_PER_WINDOW,
+    build_occurrences,
+    expand_starts,
+    occurrence_key,
+)
+
+
+class FakeSeries:
+    """Minimal stand-in for RecurringEventSeries ORM object."""
+
+    def __init__(self, **kwargs):
+        defaults = dict(
+            title="Standup", description=None, all_day=False,
+            timezone="America/New_York", duration_minutes=30,
+            exdates=[], overrides={},
+        )
+        defaults.update(kwargs)
+        for k, v in defaults.items():
+            setattr(self, k, v)
+
+
+class TestOccurrenceKey:
+    def test_zoned_datetime_converted_to_series_wall_time(self):
+        utc = datetime(2026, 3, 2, 14, 0, tzinfo=ZoneInfo("UTC"))
+        assert occurrence_key(utc, "America/New_York", False) == "2026-03-02T09:00:00"
+
+    def test_naive_datetime_kept_as_is(self):
+        assert occurrence_key(datetime(2026, 3, 2, 9, 0), None, False) == "2026-03-02T09:00:00"
+
+    def test_all_day_uses_date(self):
+        assert occurrence_key(date(2026, 3, 2), None, True) == "2026-03-02"
+        assert occurrence_key(datetime(2026, 3, 2, 0, 0), None, True) == "2026-03-02"
+
+
+class TestExpandStarts:
+    def test_weekly_within_window(self):
+        starts = expand_starts(
+            "FREQ=WEEKLY;BYDAY=MO", datetime(2026, 1, 5, 9, 0),
+            "America/New_York", False, date(2026, 2, 1), date(2026, 2, 28),
+        )
+        assert starts == [
+            datetime(2026, 2, 2, 9, 0), datetime(2026, 2, 9, 9, 0),
+            datetime(2026, 2, 16, 9, 0), datetime(2026, 2, 23, 9, 0),
+        ]
+
+    def test_wall_time_stable_across_dst(self):
+        # US DST starts 2026-03-08; a 09:00 event stays at 09:00 local.
+        starts = expand_starts(
+            "FREQ=DAILY", datetime(2026, 3, 6, 9, 0),
+            "America/New_York", False, date(2026, 3, 6), date(2026, 3, 10),
+        )
+        assert [s.hour for s in starts] == [9, 9, 9, 9, 9]
+
+    def test_utc_until_on_zoned_dtstart(self):
+        # UNTIL is 14:00Z == 09:00 EST on the 4th, inclusive.
+        starts = expand_starts(
+            "FREQ=DAILY;UNTIL=20260204T140000Z", datetime(2026, 2, 1, 9, 0),
+            "America/New_York", False, date(2026, 1, 1), date(2026, 3, 1),
+        )
+        assert [s.day for s in starts] == [1, 2, 3, 4]
+
+    def test_floating_until_on_zoned_dtstart_falls_back(self):
+        starts = expand_starts(
+            "FREQ=DAILY;UNTIL=20260203T090000", datetime(2026, 2, 1, 9, 0),
+            "America/New_York", False, date(2026, 1, 1), date(2026, 3, 1),
+        )
+        assert [s.day for s in starts] == [1, 2, 3]
+
+    def test_count_is_counted_from_dtstart_not_window(self):
+        starts = expand_starts(
+            "FREQ=DAILY;COUNT=5", datetime(2026, 2, 1, 9, 0),
+            "UTC", False, date(2026, 2, 4), date(2026, 2, 28),
+        )
+        assert [s.day for s in starts] == [4, 5]
+
+    def test_all_day_yearly(self):
+        starts = expand_starts(
+            "FREQ=YEARLY", datetime(2020, 7, 4), None, True,
+            date(2026, 1, 1), date(2027, 12, 31),
+        )
+        assert starts == [datetime(2026, 7, 4), datetime(2027, 7, 4)]
+
+    def test_truncates_pathological_rules(self):
+        starts = expand_starts(
+            "FREQ=MINUTELY", datetime(2026, 1, 1), "UTC", False,
+            date(2026, 1, 1), date(2026, 1, 31),
+        )
+        assert len(starts) == MAX_OCCURRENCES_PER_WINDOW
+
+
+class TestBuildOccurrences:
+    def test_materializes_fields(self):
+        series = FakeSeries(rrule="FREQ=WEEKLY;BYDAY=MO", dtstart=datetime(2026, 1, 5, 9, 0))
+        occs = build_occurrences(series, date(2026, 1, 5), date(2026, 1, 11))
+        assert occs == [{
+            "recurrence_id": "2026-01-05T09:00:00",
+            "title": "Standup",
+            "description": None,
+            "date": date(2026, 1, 5),
+            "start_time": "09:00",
+            "end_time": "09:30",
+            "all_day": False,
+            "timezone": "America/New_York",
+        }]
+
+    def test_exdate_and_cancelled_override_dropped(self):
+        series = FakeSeries(
+            rrule="FREQ=DAILY", dtstart=datetime(2026, 1, 1, 9, 0),
+            exdates=["2026-01-02T09:00:00"],
+            overrides={"2026-01-03T09:00:00": None},
+        )
+        occs = build_occurrences(series, date(2026, 1, 1), date(2026, 1, 4))
+        assert [o["date"].day for o in occs] == [1, 4]
+
+    def test_override_replaces_instance_fields(self):
+        series = FakeSeries(
+            rrule="FREQ=DAILY", dtstart=datetime(2026, 1, 1, 9, 0),
+            overrides={"2026-01-02T09:00:00": {
+                "title": "Standup (moved)", "description": None,
+                "date": "2026-01-02", "start_time": "11:00", "end_time": "11:30",
+                "all_day": False, "timezone": "America/New_York",
+            }},
+        )
+        occs = build_occurrences(series, date(2026, 1, 1), date(2026, 1, 3))
+        moved = occs[1]
+        assert moved["recurrence_id"] == "2026-01-02T09:00:00"
+        assert moved["title"] == "Standup (moved)"
+        assert moved["start_time"] == "11:00"
+
+    def test_override_moved_into_window_from_outside(self):
+        moved = {
+            "title": "Standup (moved)", "description": None,
+            "date": "2026-01-03", "start_time": "11:00", "end_time": "11:30",
+            "all_day": False, "timezone": "America/New_York",
+        }
+        series = FakeSeries(
+            rrule="FREQ=WEEKLY;BYDAY=MO", dtstart=datetime(2026, 1, 5, 9, 0),
+            overrides={"2026-01-12T09:00:00": moved, "2026-01-19T09:00:00": None},
+        )
+        occs = build_occurrences(series, date(2026, 1, 1), date(2026, 1, 5))
+        assert [(o["recurrence_id"], o["date"]) for o in occs] == [
+            ("2026-01-05T09:00:00", date(2026, 1, 5)),
+            ("2026-01-12T09:00:00", date(2026, 1, 3)),
+        ]
+        # Its original slot's window no longer shows it there
+        occs = build_occurrences(series, date(2026, 1, 6), date(2026, 1, 31))
+        assert [o["date"] for o in occs] == [date(2026, 1, 3), date(2026, 1, 26)]
+
+    def test_incremental_windows_partition_the_full_expansion(self):
+        series = FakeSeries(rrule="FREQ=DAILY", dtstart=datetime(2026, 1, 1, 9, 0))
+        full = build_occurrences(series, date(2026, 1, 1), date(2026, 1, 20))
+        first = build_occurrences(series, date(2026, 1, 1), date(2026, 1, 10))
+        rest = build_occurrences(series, date(2026, 1, 11), date(2026, 1, 20))
+        assert first + rest == full
+
+
+def _vcal(*lines: str) -> str:
+    return "\r\n".join(
+        ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Test//EN", *lines, "END:VCALENDAR", ""]
+    )
+
+
+RECURRING_ICS = _vcal(
+    "BEGIN:VEVENT",
+    "UID:series-1",
+    "SUMMARY:Piano lesson",
+    "DTSTART;TZID=America/New_York:20260105T160000",
+    "DTEND;TZID=America/New_York:20260105T164500",
+    "RRULE:FREQ=WEEKLY;BYDAY=MO",
+    "EXDATE;TZID=America/New_York:20260119T160000",
+    "LAST-MODIFIED:20260101T120000Z",
+    "END:VEVENT",
+    "BEGIN:VEVENT",
+    "UID:series-1",
+    "SUMMARY:Piano lesson (late)",
+    "RECURRENCE-ID;TZID=America/New_York:20260112T160000",
+    "DTSTART;TZID=America/New_York:20260112T170000",
+    "DTEND;TZID=America/New_York:20260112T174500",
+    "LAST-MODIFIED:20260110T120000Z",
+    "END:VEVENT",
+    "BEGIN:VEVENT",
+    "UID:series-1",
+    "RECURRENCE-ID:20260126T210000Z",
+    "DTSTART;TZID=America/New_York:20260126T160000",
+    "STATUS:CANCELLED",
+    "END:VEVENT",
+)
+
+
+def _components(parser: str):
+    if parser == "fast":
+        return ics_fastpath.extract_components(RECURRING_ICS, "VEVENT")
+    cal = icalendar.Calendar.from_ical(RECURRING_ICS)
+    return [c for c in cal.walk() if c.name == "VEVENT"]
+
+
+@pytest.mark.parametrize("parser", ["fast", "icalendar"])
+class TestIcsToSeriesData:
+    def test_maps_master_rule_exdates_and_overrides(self, parser):
+        master, *overrides = _components(parser)
+        data = ics_to_series_data(master, overrides)
+
+        assert data["external_id"] == "series-1"
+        assert data["rrule"] == "FREQ=WEEKLY;BYDAY=MO"
+        assert data["dtstart"] == datetime(2026, 1, 5, 16, 0)
+        assert data["timezone"] == "America/New_York"
+        assert data["duration_minutes"] == 45
+        assert data["exdates"] == ["2026-01-19T16:00:00"]
+        assert data["overrides"]["2026-01-26T16:00:00"] is None
+        moved = data["overrides"]["2026-01-12T16:00:00"]
+        assert moved["title"] == "Piano lesson (late)"
+        assert moved["start_time"] == "17:00"
+        # An instance edit counts as a change to the series
+        assert data["last_modified_remote"] == datetime(2026, 1, 10, 12, 0)
+
+    def test_round_trips_through_build_occurrences(self, parser):
+        master, *overrides = _components(parser)
+        series = FakeSeries(**{
+            k: v for k, v in ics_to_series_data(master, overrides).items()
+            if k in ("title", "description", "dtstart", "all_day", "timezone",
+                     "duration_minutes", "rrule", "exdates", "overrides")
+        })
+        occs = build_occurrences(series, date(2026, 1, 1), date(2026, 2, 2))
+        assert [(o["date"].day, o["start_time"]) for o in occs] == [
+            (5, "16:00"), (12, "17:00"), (2, "16:00"),
+        ]
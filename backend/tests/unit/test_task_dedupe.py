@@ -0,0 +1,86 @@
+"""Unit tests for deduplicated Celery task submission (app/utils/task_dedupe.py).
+
+Redis is replaced with a dict-backed fake; the Celery task is a MagicMock.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.utils import task_dedupe
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(task_dedupe, "_get_redis", lambda: fake)
+    return fake
+
+
+def _task():
+    task = MagicMock()
+    task.name = "app.tasks.push_event_to_icloud"
+    return task
+
+
+class TestSubmitOnce:
+    def test_first_submission_enqueues(self, fake_redis):
+        task = _task()
+        assert task_dedupe.submit_once(task, "push:event:1", (1,), countdown=30) is True
+        task.apply_async.assert_called_once_with(args=[1], countdown=30)
+        assert fake_redis.ttls["taskdedupe:push:event:1"] == 30 + task_dedupe._PENDING_GRACE_SECONDS
+
+    def test_duplicate_pending_submission_is_collapsed(self, fake_redis):
+        task = _task()
+        for _ in range(5):
+            task_dedupe.submit_once(task, "push:event:1", (1,), countdown=30)
+        assert task.apply_async.call_count == 1
+
+    def test_different_entities_are_independent(self, fake_redis):
+        task = _task()
+        task_dedupe.submit_once(task, "push:event:1", (1,))
+        task_dedupe.submit_once(task, "push:event:2", (2,))
+        assert [c.args for c in task.delay.call_args_list] == [(1,), (2,)]
+
+    def test_consumed_key_allows_resubmission(self, fake_redis):
+        task = _task()
+        task_dedupe.submit_once(task, "push:event:1", (1,))
+        task_dedupe.mark_consumed("push:event:1")
+        task_dedupe.submit_once(task, "push:event:1", (1,))
+        assert task.delay.call_count == 2
+
+    def test_failed_enqueue_releases_claim(self, fake_redis):
+        task = _task()
+        task.delay.side_effect = OSError("broker down")
+        with pytest.raises(OSError):
+            task_dedupe.submit_once(task, "push:event:1", (1,))
+        assert "taskdedupe:push:event:1" not in fake_redis.store
+
+    def test_redis_outage_fails_open(self, monkeypatch):
+        broken = MagicMock()
+        broken.set.side_effect = RedisConnectionError("refused")
+        broken.delete.side_effect = RedisConnectionError("refused")
+        monkeypatch.setattr(task_dedupe, "_get_redis", lambda: broken)
+
+        task = _task()
+        assert task_dedupe.submit_once(task, "push:event:1", (1,)) is True
+        task.delay.assert_called_once_with(1)
+        task_dedupe.mark_consumed("push:event:1")  # must not raise
@@ -6,7 +6,9 @@ from app.constants.units import (
     UNIT_TO_GROUP,
     to_base_unit,
     from_base_unit,
+    from_base_units,
     format_ingredient_title,
+    format_ingredient_titles,
     normalize_unit,
 )
 
@@ -182,3 +184,36 @@ class TestRoundTripConversion:
         display_qty, display_unit = from_base_unit(total, "g", "imperial")
         assert display_unit == "lb"
         assert display_qty == pytest.approx(1.5, abs=0.1)
+
+
+def _mixed_batch():
+    """Base quantities straddling every display threshold, plus count rows."""
+    quantities, base_units = [], []
+    for base, steps in (("g", (1, 28.3495, 100, 453.592, 999.9, 1000, 2500)),
+                        ("ml", (2, 4.929, 14.787, 100, 236.588, 999, 1000, 4000))):
+        for q in steps:
+            for scale in (0.5, 1, 1.05, 3):
+                quantities.append(q * scale)
+                base_units.append(base)
+    quantities += [3, 2.6]
+    base_units += ["clove", "bunch"]
+    return quantities, base_units
+
+
+class TestFromBaseUnits:
+    """from_base_units() must agree with from_base_unit() element for element."""
+
+    @pytest.mark.parametrize("system", ["imperial", "metric"])
+    def test_matches_scalar(self, system):
+        quantities, base_units = _mixed_batch()
+        expected = [from_base_unit(q, u, system) for q, u in zip(quantities, base_units)]
+        display_qtys, display_units = from_base_units(quantities, base_units, system)
+        assert list(zip(display_qtys, display_units)) == expected
+
+    def test_empty_batch(self):
+        assert from_base_units([], [], "metric") == ([], [])
+
+    def test_format_ingredient_titles(self):
+        assert format_ingredient_titles(
+            [2, None, 1.25], ["lb", None, "cup"], ["ground beef", "salt", "flour"],
+        ) == ["2 lb ground beef", "salt", "1.2 cup flour"]